@@ -71,7 +71,7 @@ def run_multiple_beats(num_beats: int):
     print("\n" + "-" * 40)
     print("SUMMARY")
     print("-" * 40)
-    print(f"Total beats: {len(heartbeat.results)}")
+    print(f"Total beats: {heartbeat.beat_count}")
 
     if heartbeat.results:
         avg_coherence = sum(r.coherence_estimate for r in heartbeat.results)
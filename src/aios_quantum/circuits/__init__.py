@@ -7,6 +7,11 @@ from .hello_world import (
     create_ghz_state,
     transpile_for_backend
 )
+from .transpile_cache import (
+    TranspileCache,
+    cached_transpile,
+    get_transpile_cache,
+)
 from .consciousness_circuits import (
     create_coherence_measurement_circuit,
     create_entanglement_witness_circuit,
@@ -21,6 +26,9 @@ __all__ = [
     "create_bell_state",
     "create_ghz_state",
     "transpile_for_backend",
+    "TranspileCache",
+    "cached_transpile",
+    "get_transpile_cache",
     "create_coherence_measurement_circuit",
     "create_entanglement_witness_circuit",
     "create_consciousness_ansatz",
@@ -4,7 +4,8 @@ Based on IBM Quantum Hello World tutorial.
 """
 
 from qiskit import QuantumCircuit
-from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+
+from .transpile_cache import cached_transpile
 
 
 def create_bell_state() -> QuantumCircuit:
@@ -53,6 +54,9 @@ def transpile_for_backend(circuit: QuantumCircuit, backend) -> QuantumCircuit:
     """
     Transpile a circuit for a specific backend.
     
+    Results come from the shared transpilation cache, so circuits that
+    differ only in rotation angles are transpiled once per backend.
+
     Args:
         circuit: The quantum circuit to transpile
         backend: Target backend
@@ -60,8 +64,4 @@ def transpile_for_backend(circuit: QuantumCircuit, backend) -> QuantumCircuit:
     Returns:
         Transpiled circuit optimized for the backend
     """
-    pass_manager = generate_preset_pass_manager(
-        backend=backend,
-        optimization_level=1,
-    )
-    return pass_manager.run(circuit)
+    return cached_transpile(circuit, backend, optimization_level=1)
@@ -0,0 +1,241 @@
+"""
+Transpilation cache.
+
+Successive heartbeats (and most repeated task circuits) differ only in
+their rotation angles, yet every submission used to run the full preset
+pass manager. Here each circuit is split into
+
+    template  — the same circuit with every numeric rotation angle
+                replaced by a Parameter
+    values    — the angles that were taken out
+
+The template is transpiled once per (structure, backend, calibration
+version, optimization level) and the cached result is bound to the new
+angles on every later call, which costs a parameter assignment instead
+of a layout/routing/optimization run. The calibration version is read
+from backend.properties() at most once per backend name every
+CALIBRATION_TTL_SECONDS, since that call can be a remote fetch.
+
+Transpiling with symbolic angles gives up simplifications that depend on
+the values (e.g. dropping rz(0)), so the cached circuit can be a few
+gates longer than a fresh transpile of special angles. It is otherwise
+equivalent.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from numbers import Real
+from typing import Any, Dict, List, Optional, Tuple
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import ControlFlowOp, Gate, Parameter
+from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+
+logger = logging.getLogger(__name__)
+
+# Gates whose parameters are rotation angles (safe to make symbolic)
+ANGLE_GATES = frozenset({
+    "rx", "ry", "rz", "r", "p", "u", "u1", "u2", "u3",
+    "rxx", "ryy", "rzz", "rzx", "cp", "crx", "cry", "crz",
+    "cu1", "cu3", "cu", "xx_minus_yy", "xx_plus_yy",
+})
+
+# Transpiled templates kept per cache
+DEFAULT_MAX_ENTRIES = 128
+
+# Seconds a backend's calibration stamp is reused before re-reading it
+CALIBRATION_TTL_SECONDS = 300.0
+
+
+def parameterize(
+    circuit: QuantumCircuit,
+) -> Tuple[QuantumCircuit, List[Parameter], List[float], str]:
+    """
+    Abstract the rotation angles out of `circuit`.
+
+    Returns (template, angles, values, structure_key): binding `angles`
+    to `values` in the template gives back `circuit`, and every circuit
+    that differs only in those angles has the same structure_key.
+    """
+    # Angle names must not collide with the circuit's own parameters
+    prefix = "_angle"
+    existing = [p.name for p in circuit.parameters]
+    while any(name.startswith(prefix) for name in existing):
+        prefix = "_" + prefix
+
+    angles: List[Parameter] = []
+    template = QuantumCircuit(
+        *circuit.qregs, *circuit.cregs,
+        name=circuit.name, global_phase=circuit.global_phase,
+    )
+    for bit in circuit.qubits:
+        if bit not in template.qubits:
+            template.add_bits([bit])
+    for bit in circuit.clbits:
+        if bit not in template.clbits:
+            template.add_bits([bit])
+
+    values: List[float] = []
+    signature: List[Any] = [
+        [(r.name, r.size) for r in circuit.qregs],
+        [(r.name, r.size) for r in circuit.cregs],
+        circuit.num_qubits, circuit.num_clbits, str(circuit.global_phase),
+    ]
+    for instruction in circuit.data:
+        op = instruction.operation
+        params: List[Any] = []
+        if op.name in ANGLE_GATES and isinstance(op, Gate):
+            symbolic = []
+            for p in op.params:
+                if isinstance(p, Real):
+                    angles.append(Parameter(f"{prefix}{len(angles)}"))
+                    symbolic.append(angles[-1])
+                    values.append(float(p))
+                    params.append("θ")
+                else:
+                    symbolic.append(p)
+                    params.append(str(p))
+            op = op.copy()
+            op.params = symbolic
+        else:
+            params = [str(p) for p in op.params]
+        template.append(op, instruction.qubits, instruction.clbits, copy=False)
+        signature.append((
+            op.name,
+            [circuit.find_bit(q).index for q in instruction.qubits],
+            [circuit.find_bit(c).index for c in instruction.clbits],
+            params,
+        ))
+
+    key = hashlib.sha256(repr(signature).encode()).hexdigest()
+    return template, angles, values, key
+
+
+def calibration_version(backend) -> str:
+    """Calibration timestamp of an IBM backend ("" if it has none)."""
+    properties = getattr(backend, "properties", None)
+    if not callable(properties):
+        return ""
+    try:
+        props = properties()
+    except Exception:
+        return ""
+    stamp = getattr(props, "last_update_date", None)
+    return str(stamp) if stamp else ""
+
+
+def _backend_name(backend) -> str:
+    if backend is None:
+        return ""
+    name = getattr(backend, "name", None)
+    return name() if callable(name) else str(name or type(backend).__name__)
+
+
+class TranspileCache:
+    """LRU cache of transpiled, parameterized circuit templates."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        calibration_ttl: float = CALIBRATION_TTL_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.calibration_ttl = calibration_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Tuple[QuantumCircuit, list]]" = OrderedDict()
+        # backend name → (read at, calibration stamp)
+        self._calibrations: Dict[str, Tuple[float, str]] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def transpile(
+        self,
+        circuit: QuantumCircuit,
+        backend,
+        optimization_level: int = 1,
+    ) -> QuantumCircuit:
+        """Transpile `circuit` for `backend`, reusing a cached template."""
+        if any(isinstance(i.operation, ControlFlowOp) for i in circuit.data):
+            return self._run(circuit, backend, optimization_level)
+
+        template, angles, values, structure = parameterize(circuit)
+        name = _backend_name(backend)
+        key = (
+            structure,
+            name,
+            self._calibration(name, backend),
+            optimization_level,
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            logger.debug(f"Transpile cache miss: {circuit.name} on {key[1] or 'no backend'}")
+            entry = (self._run(template, backend, optimization_level), angles)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        # Bind through the angles of the template that was transpiled
+        transpiled, angles = entry
+        if not angles:
+            return transpiled.copy()
+        # Angles the optimizer removed are simply absent from the result
+        return transpiled.assign_parameters(
+            dict(zip(angles, values)), inplace=False, strict=False
+        )
+
+    def _calibration(self, name: str, backend) -> str:
+        """Calibration stamp of `backend`, memoized per name for the TTL."""
+        now = self._clock()
+        with self._lock:
+            cached = self._calibrations.get(name)
+        if cached is not None and now - cached[0] < self.calibration_ttl:
+            return cached[1]
+        stamp = calibration_version(backend)
+        with self._lock:
+            self._calibrations[name] = (now, stamp)
+        return stamp
+
+    @staticmethod
+    def _run(circuit, backend, optimization_level) -> QuantumCircuit:
+        pass_manager = generate_preset_pass_manager(
+            optimization_level=optimization_level, backend=backend
+        )
+        return pass_manager.run(circuit)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._calibrations.clear()
+            self.hits = self.misses = 0
+
+
+_default_cache = TranspileCache()
+
+
+def get_transpile_cache() -> TranspileCache:
+    """The process-wide cache used by `cached_transpile`."""
+    return _default_cache
+
+
+def cached_transpile(
+    circuit: QuantumCircuit,
+    backend,
+    optimization_level: int = 1,
+    cache: Optional[TranspileCache] = None,
+) -> QuantumCircuit:
+    """Drop-in for a preset pass manager run, backed by a TranspileCache."""
+    return (cache or _default_cache).transpile(circuit, backend, optimization_level)
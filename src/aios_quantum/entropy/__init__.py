@@ -1,5 +1,13 @@
 """Quantum entropy extraction from heartbeat measurement distributions."""
 
+from .bit_generator import QuantumBitGenerator
 from .quantum_entropy_extractor import QuantumEntropyExtractor, get_quantum_entropy
+from .service import EntropyClient, EntropyServer
 
-__all__ = ["QuantumEntropyExtractor", "get_quantum_entropy"]
+__all__ = [
+    "QuantumEntropyExtractor",
+    "QuantumBitGenerator",
+    "EntropyClient",
+    "EntropyServer",
+    "get_quantum_entropy",
+]
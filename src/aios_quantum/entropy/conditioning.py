@@ -0,0 +1,240 @@
+"""
+Entropy Conditioning — pluggable extractor backends
+===================================================
+
+Conditioning turns a heartbeat's raw measurement material into pool
+bytes. Backends trade speed against how tight a guarantee they give:
+
+    sha512    — the original construction: five SHA-512 rounds over the
+                distribution, a SHA-256 slice per state sized by its
+                information content, one SHA-512 over the noise
+    blake2b   — keyed BLAKE2b in counter mode; fastest hash backend
+    shake256  — SHAKE256 XOF, any output length from a single call
+    toeplitz  — Toeplitz-matrix hashing over GF(2); a 2-universal
+                family, so the leftover hash lemma bounds the output's
+                distance from uniform. Output is compressed to
+                output_bits / input_bits of the input.
+
+Every backend sees the same `BeatMaterial` and is asked for the same
+number of bytes, so their output is directly comparable:
+
+    qe = QuantumEntropyExtractor(conditioner="blake2b")
+    get_conditioner("toeplitz", input_bits=2048, output_bits=256)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# φ — golden ratio, used as mixing constant
+PHI = 1.6180339887498948482
+
+# Bosonic frequencies from SingularityCore
+BOSONIC_FREQUENCIES = [1.618033, 2.718281, 3.141592, 4.669201, 5.858362]
+
+# Public default key / matrix seed, derived from the bosonic frequencies
+_DEFAULT_SEED = struct.pack(">5d", *BOSONIC_FREQUENCIES)
+
+
+@dataclass(frozen=True)
+class BeatMaterial:
+    """Raw, unconditioned inputs extracted from one heartbeat."""
+
+    counts: dict[str, int]
+    total_shots: int
+    timestamp: str
+    backend: str
+    noise_probs: np.ndarray
+
+    def serialize(self) -> bytes:
+        """Canonical byte encoding fed to generic conditioners."""
+        head = json.dumps(self.counts, sort_keys=True)
+        text = f"{head}\n{self.timestamp}\n{self.backend}\n{self.total_shots}\n"
+        return text.encode() + self.noise_probs.astype(">f8").tobytes()
+
+    def state_byte_counts(self) -> list[int]:
+        """Bytes owed per state (sorted): four per bit, one SHA-256 at most."""
+        counts = np.array(
+            [c for _, c in sorted(self.counts.items())], dtype=np.float64
+        )
+        with np.errstate(divide="ignore"):
+            info = np.where(counts > 0, -np.log2(counts / self.total_shots), 0.0)
+        return np.clip((info * 4).astype(np.int64), 1, 32).tolist()
+
+    @property
+    def output_bytes(self) -> int:
+        """Output budget: the size the original SHA-512 construction makes."""
+        noise = 64 if self.noise_probs.size else 0
+        return 64 * len(BOSONIC_FREQUENCIES) + sum(self.state_byte_counts()) + noise
+
+
+class Conditioner(ABC):
+    """Base class: condition raw bytes into at most `n` output bytes."""
+
+    name = "base"
+
+    @abstractmethod
+    def condition(self, raw: bytes, n: int) -> bytes:
+        """Condition `raw` into at most `n` bytes."""
+        ...
+
+    def condition_beat(self, material: BeatMaterial) -> bytes:
+        """Condition one heartbeat; backends may return fewer bytes."""
+        return self.condition(material.serialize(), material.output_bytes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+def _counter_mode(base: Any, n: int) -> bytes:
+    """Expand a primed hash object: block i = H(raw ‖ i)."""
+    blocks = []
+    for i in range(-(-n // base.digest_size)):
+        h = base.copy()
+        h.update(i.to_bytes(8, "big"))
+        blocks.append(h.digest())
+    return b"".join(blocks)[:n]
+
+
+class Sha512Conditioner(Conditioner):
+    """The original SHA-512/SHA-256 string-hashing construction."""
+
+    name = "sha512"
+
+    def condition(self, raw: bytes, n: int) -> bytes:
+        return _counter_mode(hashlib.sha512(raw), n)
+
+    def condition_beat(self, material: BeatMaterial) -> bytes:
+        # Method: Hash each (state, count) pair with a mixing constant
+        # to produce deterministic but quantum-derived bytes.
+        # The non-determinism comes from which states appear and how many —
+        # that's the quantum part.
+        counts, total_shots = material.counts, material.total_shots
+        out = bytearray()
+
+        # Primary extraction: hash the full distribution
+        # Multiple rounds of hashing with bosonic frequency mixing
+        dist_str = json.dumps(counts, sort_keys=True)
+        for i, freq in enumerate(BOSONIC_FREQUENCIES):
+            seed = f"{dist_str}:{material.timestamp}:{material.backend}:{freq}:{i}"
+            out += hashlib.sha512(seed.encode()).digest()
+
+        # Secondary extraction: per-state entropy, taking bytes proportional
+        # to the information content of each state
+        takes = material.state_byte_counts()
+        for (state, count), take in zip(sorted(counts.items()), takes):
+            state_seed = f"{state}:{count}:{total_shots}:{PHI}"
+            out += hashlib.sha256(state_seed.encode()).digest()[:take]
+
+        # Tertiary extraction: noise harmonics
+        if material.noise_probs.size:
+            noise_seed = ":".join(f"{p:.10f}" for p in material.noise_probs.tolist())
+            out += hashlib.sha512(noise_seed.encode()).digest()
+        return bytes(out)
+
+
+class Blake2bConditioner(Conditioner):
+    """Keyed BLAKE2b-512 in counter mode."""
+
+    name = "blake2b"
+
+    def __init__(self, key: bytes = _DEFAULT_SEED) -> None:
+        if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError(
+                f"key must be at most {hashlib.blake2b.MAX_KEY_SIZE} bytes"
+            )
+        self._key = key
+
+    def condition(self, raw: bytes, n: int) -> bytes:
+        return _counter_mode(hashlib.blake2b(raw, key=self._key), n)
+
+
+class Shake256Conditioner(Conditioner):
+    """SHAKE256 extendable-output function."""
+
+    name = "shake256"
+
+    def condition(self, raw: bytes, n: int) -> bytes:
+        return hashlib.shake_256(raw).digest(n)
+
+
+class ToeplitzConditioner(Conditioner):
+    """
+    Toeplitz-hashing randomness extractor over GF(2).
+
+    Input is split into `input_bits` blocks (zero-padded); each block x
+    maps to T·x mod 2 for a fixed output_bits × input_bits Toeplitz
+    matrix T defined by input_bits + output_bits − 1 seed bits. All
+    blocks are multiplied in one float32 matmul — exact, since row sums
+    stay below 2**24.
+    """
+
+    name = "toeplitz"
+
+    def __init__(
+        self,
+        input_bits: int = 1024,
+        output_bits: int = 512,
+        seed: bytes = _DEFAULT_SEED,
+    ) -> None:
+        if input_bits % 8 or output_bits % 8:
+            raise ValueError("input_bits and output_bits must be multiples of 8")
+        if not 0 < output_bits <= input_bits < 1 << 24:
+            raise ValueError("expected 0 < output_bits <= input_bits < 2**24")
+        self.input_bits = input_bits
+        self.output_bits = output_bits
+        n_seed = input_bits + output_bits - 1
+        diagonals = np.unpackbits(
+            np.frombuffer(hashlib.shake_256(seed).digest(-(-n_seed // 8)), np.uint8)
+        )[:n_seed]
+        # T[i, j] depends only on i − j: constant along every diagonal
+        rows = np.arange(output_bits)[:, None]
+        cols = np.arange(input_bits)[None, :]
+        matrix = diagonals[rows - cols + input_bits - 1]
+        self._matrix_t = np.ascontiguousarray(matrix.T, dtype=np.float32)
+
+    def condition(self, raw: bytes, n: int) -> bytes:
+        bits = np.unpackbits(np.frombuffer(raw, dtype=np.uint8))
+        blocks = max(1, -(-bits.size // self.input_bits))
+        x = np.zeros(blocks * self.input_bits, dtype=np.float32)
+        x[: bits.size] = bits
+        y = x.reshape(blocks, self.input_bits) @ self._matrix_t
+        out = np.packbits(y.astype(np.int64) & 1).tobytes()
+        return out[:n]
+
+    def __repr__(self) -> str:
+        return f"ToeplitzConditioner({self.input_bits}→{self.output_bits})"
+
+
+CONDITIONERS: dict[str, type[Conditioner]] = {
+    cls.name: cls
+    for cls in (
+        Sha512Conditioner,
+        Blake2bConditioner,
+        Shake256Conditioner,
+        ToeplitzConditioner,
+    )
+}
+
+DEFAULT_CONDITIONER = Sha512Conditioner.name
+
+
+def get_conditioner(spec: str | Conditioner | None = None, **kwargs: Any) -> Conditioner:
+    """Resolve a backend by name (keyword args go to its constructor)."""
+    if isinstance(spec, Conditioner):
+        return spec
+    name = spec or DEFAULT_CONDITIONER
+    try:
+        cls = CONDITIONERS[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown conditioner {name!r}; expected one of {sorted(CONDITIONERS)}"
+        ) from None
+    return cls(**kwargs)
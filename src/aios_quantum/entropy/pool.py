@@ -0,0 +1,143 @@
+"""
+Entropy Pool — fixed-capacity ring buffer
+=========================================
+
+Backing store for QuantumEntropyExtractor. Bytes are written at the
+tail and consumed from the head of a preallocated bytearray, so
+steady-state reads and writes never allocate:
+
+    pool = EntropyPool(capacity=1 << 20)
+    pool.write(digest)
+    pool.readinto(buffer)   # at most two memoryview slice copies
+
+When a write does not fit, the overflow is XOR-folded into the unread
+bytes instead of being dropped. XOR with independent data never
+lowers the entropy of what is already buffered.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Default pool capacity (1 MiB)
+DEFAULT_CAPACITY = 1 << 20
+
+
+class EntropyPool:
+    """Ring buffer of entropy bytes with zero-copy reads."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._capacity = capacity
+        self._head = 0           # next byte to read
+        self._size = 0           # unread bytes
+        self._total_written = 0
+        self._total_read = 0
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def available(self) -> int:
+        """Unread bytes in the pool."""
+        return self._size
+
+    @property
+    def free(self) -> int:
+        return self._capacity - self._size
+
+    @property
+    def total_written(self) -> int:
+        return self._total_written
+
+    @property
+    def total_read(self) -> int:
+        return self._total_read
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """Append bytes; overflow is XOR-folded into unread bytes.
+
+        Returns the number of bytes appended (the rest were folded).
+        """
+        src = memoryview(data).cast("B")
+        n = len(src)
+        if n == 0:
+            return 0
+        appended = min(n, self.free)
+        tail = (self._head + self._size) % self._capacity
+        self._copy_in(tail, src[:appended])
+        self._size += appended
+        if appended < n:
+            self._fold(src[appended:])
+        self._total_written += n
+        return appended
+
+    def _copy_in(self, pos: int, src: memoryview) -> None:
+        first = min(len(src), self._capacity - pos)
+        self._view[pos : pos + first] = src[:first]
+        if first < len(src):
+            self._view[: len(src) - first] = src[first:]
+
+    def _fold(self, src: memoryview) -> None:
+        """XOR src over the buffer starting at the oldest unread byte."""
+        ring = np.frombuffer(self._buf, dtype=np.uint8)
+        extra = np.frombuffer(src, dtype=np.uint8)
+        pos = self._head
+        while extra.size:
+            chunk = extra[: self._capacity - pos]
+            ring[pos : pos + chunk.size] ^= chunk
+            extra = extra[chunk.size :]
+            pos = (pos + chunk.size) % self._capacity
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def readinto(self, dest: bytearray | memoryview) -> int:
+        """Fill dest from the head of the pool; returns bytes copied."""
+        out = memoryview(dest).cast("B")
+        n = min(len(out), self._size)
+        first = min(n, self._capacity - self._head)
+        out[:first] = self._view[self._head : self._head + first]
+        if first < n:
+            out[first:n] = self._view[: n - first]
+        self._head = (self._head + n) % self._capacity
+        self._size -= n
+        self._total_read += n
+        return n
+
+    def read(self, n: int) -> bytes:
+        """Read up to n bytes as a new bytes object."""
+        out = bytearray(min(n, self._size))
+        self.readinto(out)
+        return bytes(out)
+
+    def tail(self, n: int) -> bytes:
+        """The most recently written n bytes (consumed or not).
+
+        Returns fewer bytes if less than n have ever been written.
+        """
+        n = min(n, self._total_written, self._capacity)
+        end = (self._head + self._size) % self._capacity
+        start = end - n
+        if start >= 0:
+            return bytes(self._view[start:end])
+        return bytes(self._view[start:]) + bytes(self._view[:end])
+
+    def __repr__(self) -> str:
+        return f"EntropyPool({self._size}/{self._capacity}B)"
@@ -0,0 +1,370 @@
+"""
+Entropy Quality — randomness tests and throughput benchmark
+===========================================================
+
+Catches regressions when the pool or extraction logic changes:
+
+    NIST SP 800-22–style statistical tests, vectorized with NumPy:
+        monobit · runs · block frequency · approximate entropy · serial
+
+    Throughput, measured separately for:
+        quantum_bytes() · random() · the SHA-512 hash-chain fallback
+
+    Conditioning backends, compared on one heartbeat corpus:
+        beats/sec · output bytes/sec · output bytes per beat
+
+Run against the live heartbeat corpus:
+
+    python -m aios_quantum.entropy.quality --mb 1
+    python -m aios_quantum.entropy.quality --conditioning
+
+A test passes when its p-value is at least `alpha` (default 0.01, the
+SP 800-22 recommendation). One failure in a single run is expected
+about 1% of the time; repeated failures are the signal.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+import numpy as np
+from scipy.special import gammaincc
+
+from .conditioning import CONDITIONERS, Conditioner, get_conditioner
+
+if TYPE_CHECKING:
+    from .quantum_entropy_extractor import QuantumEntropyExtractor
+
+DEFAULT_ALPHA = 0.01
+
+
+@dataclass
+class RandomnessTestResult:
+    """Outcome of one statistical test."""
+    name: str
+    statistic: Optional[float]  # None when the test was not applicable
+    p_value: float
+    passed: bool
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+def to_bits(data: bytes | bytearray | memoryview | np.ndarray) -> np.ndarray:
+    """
+    Bits under test as a 0/1 uint8 array.
+
+    An ndarray is taken to already hold bits; bytes-like input is
+    unpacked most significant bit first.
+    """
+    if isinstance(data, np.ndarray):
+        bits = data.astype(np.uint8, copy=False).ravel()
+        if bits.size and bits.max() > 1:
+            raise ValueError("bit arrays must contain only 0 and 1")
+        return bits
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+
+def _result(
+    name: str,
+    statistic: Optional[float],
+    p_value: float,
+    alpha: float,
+    **details: Any,
+) -> RandomnessTestResult:
+    return RandomnessTestResult(
+        name=name,
+        statistic=None if statistic is None else float(statistic),
+        p_value=float(p_value),
+        passed=bool(p_value >= alpha),
+        details=details,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Statistical tests (SP 800-22 sections 2.1, 2.2, 2.3, 2.11, 2.12)
+# ---------------------------------------------------------------------------
+
+
+def monobit_test(bits: np.ndarray, alpha: float = DEFAULT_ALPHA) -> RandomnessTestResult:
+    """Frequency (monobit): are ones and zeros equally likely?"""
+    n = bits.size
+    s = 2 * int(bits.sum()) - n
+    s_obs = abs(s) / math.sqrt(n)
+    return _result("monobit", s_obs, math.erfc(s_obs / math.sqrt(2)), alpha, n=n)
+
+
+def runs_test(bits: np.ndarray, alpha: float = DEFAULT_ALPHA) -> RandomnessTestResult:
+    """Runs: do uninterrupted runs of identical bits occur as expected?"""
+    n = bits.size
+    pi = float(bits.mean())
+    if abs(pi - 0.5) >= 2 / math.sqrt(n):
+        # Frequency prerequisite failed; the runs test is not applicable
+        return _result("runs", None, 0.0, alpha, n=n, pi=pi)
+    v_obs = 1 + int(np.count_nonzero(bits[1:] != bits[:-1]))
+    num = abs(v_obs - 2 * n * pi * (1 - pi))
+    den = 2 * math.sqrt(2 * n) * pi * (1 - pi)
+    return _result("runs", v_obs, math.erfc(num / den), alpha, n=n, pi=pi)
+
+
+def block_frequency_test(
+    bits: np.ndarray, block_size: int = 128, alpha: float = DEFAULT_ALPHA
+) -> RandomnessTestResult:
+    """Block frequency: is the proportion of ones ~1/2 in every M-bit block?"""
+    blocks = bits.size // block_size
+    if blocks == 0:
+        raise ValueError("need at least one full block")
+    proportions = bits[: blocks * block_size].reshape(blocks, block_size).mean(axis=1)
+    chi2 = 4 * block_size * float(((proportions - 0.5) ** 2).sum())
+    return _result(
+        "block_frequency", chi2, gammaincc(blocks / 2, chi2 / 2), alpha,
+        blocks=blocks, block_size=block_size,
+    )
+
+
+def _pattern_counts(bits: np.ndarray, m: int) -> np.ndarray:
+    """Counts of every overlapping m-bit pattern, wrapping at the end."""
+    if m == 0:
+        return np.array([bits.size])
+    extended = np.concatenate([bits, bits[: m - 1]])
+    windows = np.lib.stride_tricks.sliding_window_view(extended, m)
+    weights = 1 << np.arange(m - 1, -1, -1)
+    return np.bincount(windows @ weights, minlength=1 << m)
+
+
+def approximate_entropy_test(
+    bits: np.ndarray, m: int = 2, alpha: float = DEFAULT_ALPHA
+) -> RandomnessTestResult:
+    """Approximate entropy: m- vs (m+1)-bit pattern frequencies."""
+    n = bits.size
+
+    def phi(k: int) -> float:
+        c = _pattern_counts(bits, k) / n
+        c = c[c > 0]
+        return float((c * np.log(c)).sum())
+
+    ap_en = phi(m) - phi(m + 1)
+    chi2 = 2 * n * (math.log(2) - ap_en)
+    return _result(
+        "approximate_entropy", chi2, gammaincc(2 ** (m - 1), chi2 / 2), alpha,
+        m=m, ap_en=ap_en,
+    )
+
+
+def serial_test(
+    bits: np.ndarray, m: int = 3, alpha: float = DEFAULT_ALPHA
+) -> RandomnessTestResult:
+    """Serial: are all overlapping m-bit patterns equally frequent?
+
+    Reports the smaller of the two SP 800-22 p-values.
+    """
+    if m < 3:
+        raise ValueError("serial test needs m >= 3")
+    n = bits.size
+
+    def psi2(k: int) -> float:
+        if k <= 0:
+            return 0.0
+        counts = _pattern_counts(bits, k).astype(np.float64)
+        return (2**k / n) * float((counts**2).sum()) - n
+
+    p_m, p_m1, p_m2 = psi2(m), psi2(m - 1), psi2(m - 2)
+    delta1 = p_m - p_m1
+    delta2 = p_m - 2 * p_m1 + p_m2
+    p1 = gammaincc(2 ** (m - 2), delta1 / 2)
+    p2 = gammaincc(2 ** (m - 3), delta2 / 2)
+    return _result(
+        "serial", delta1, min(p1, p2), alpha,
+        m=m, p_value1=float(p1), p_value2=float(p2), delta2=delta2,
+    )
+
+
+def run_randomness_tests(
+    data: bytes | np.ndarray, alpha: float = DEFAULT_ALPHA
+) -> list[RandomnessTestResult]:
+    """Run every test on one sample of bytes (or a 0/1 bit array)."""
+    bits = to_bits(data)
+    return [
+        monobit_test(bits, alpha),
+        runs_test(bits, alpha),
+        block_frequency_test(bits, alpha=alpha),
+        approximate_entropy_test(bits, alpha=alpha),
+        serial_test(bits, alpha=alpha),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Throughput
+# ---------------------------------------------------------------------------
+
+
+def _rate(fn: Callable[[], int], min_seconds: float) -> float:
+    """Bytes per second of repeated fn() calls (fn returns bytes made)."""
+    produced = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds:
+        produced += fn()
+        elapsed = time.perf_counter() - start
+    return produced / elapsed
+
+
+def benchmark_throughput(
+    extractor: QuantumEntropyExtractor,
+    min_seconds: float = 0.5,
+    block_bytes: int = 64 * 1024,
+) -> dict[str, float]:
+    """Bytes/sec for quantum_bytes(), random() and the hash chain."""
+    from .quantum_entropy_extractor import _hash_chain
+
+    def bulk() -> int:
+        return len(extractor.quantum_bytes(block_bytes))
+
+    def scalar() -> int:
+        for _ in range(1024):
+            extractor.random()
+        return 8 * 1024
+
+    seed = extractor.quantum_bytes(64)
+    blocks = block_bytes // 64
+
+    def chain() -> int:
+        return len(_hash_chain(seed, blocks))
+
+    return {
+        "quantum_bytes": _rate(bulk, min_seconds),
+        "random": _rate(scalar, min_seconds),
+        "hash_chain": _rate(chain, min_seconds),
+    }
+
+
+def benchmark_conditioning(
+    beats: Sequence[dict[str, Any]],
+    conditioners: Optional[Sequence[str | Conditioner]] = None,
+    min_seconds: float = 0.5,
+) -> dict[str, dict[str, float]]:
+    """Extraction speed and output size per conditioning backend."""
+    from .quantum_entropy_extractor import _extract_beat
+
+    results = {}
+    for spec in conditioners or sorted(CONDITIONERS):
+        conditioner = get_conditioner(spec)
+        extracted = [_extract_beat(beat, conditioner) for beat in beats]
+        valid = [beat for beat, e in zip(beats, extracted) if e is not None]
+        per_pass = sum(len(e.data) for e in extracted if e is not None)
+        if not per_pass:
+            continue
+
+        def corpus() -> int:
+            for beat in valid:
+                _extract_beat(beat, conditioner)
+            return per_pass
+
+        rate = _rate(corpus, min_seconds)
+        results[conditioner.name] = {
+            "bytes_per_sec": rate,
+            "beats_per_sec": rate / per_pass * len(valid),
+            "bytes_per_beat": per_pass / len(valid),
+        }
+    return results
+
+
+def load_corpus(results_dir: str | Path) -> list[dict[str, Any]]:
+    """Read every heartbeat JSON file in a directory, skipping bad ones."""
+    beats = []
+    for path in sorted(Path(results_dir).glob("*.json")):
+        try:
+            beats.append(json.loads(path.read_text()))
+        except (json.JSONDecodeError, OSError):
+            continue
+    return beats
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+def quality_report(
+    extractor: QuantumEntropyExtractor,
+    megabytes: float = 1.0,
+    alpha: float = DEFAULT_ALPHA,
+    benchmark_seconds: float = 0.5,
+) -> dict[str, Any]:
+    """Draw `megabytes` from the extractor, test it, and benchmark."""
+    n_bytes = int(megabytes * 1024 * 1024)
+    data = extractor.quantum_bytes(n_bytes)
+    results = run_randomness_tests(data, alpha)
+    return {
+        "bytes_tested": n_bytes,
+        "alpha": alpha,
+        "passed": all(r.passed for r in results),
+        "tests": [asdict(r) for r in results],
+        "throughput_bytes_per_sec": benchmark_throughput(
+            extractor, min_seconds=benchmark_seconds
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    from .quantum_entropy_extractor import QuantumEntropyExtractor
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--mb", type=float, default=1.0, help="megabytes to test")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    parser.add_argument("--results-dir", default=None)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    parser.add_argument(
+        "--conditioner", default=None, choices=sorted(CONDITIONERS),
+        help="conditioning backend for the extractor under test",
+    )
+    parser.add_argument(
+        "--conditioning", action="store_true",
+        help="benchmark every conditioning backend on the heartbeat corpus",
+    )
+    args = parser.parse_args(argv)
+
+    qe = QuantumEntropyExtractor(
+        results_dir=args.results_dir, conditioner=args.conditioner
+    )
+    if args.conditioning:
+        corpus = load_corpus(qe.status()["results_dir"])
+        bench = benchmark_conditioning(corpus)
+        if args.json:
+            print(json.dumps(bench, indent=2))
+            return 0
+        print(f"  Conditioning on {len(corpus)} heartbeats:")
+        for name, row in bench.items():
+            print(
+                f"    {name:<10} {row['beats_per_sec']:10.0f} beats/s"
+                f" {row['bytes_per_sec'] / 1e6:8.2f} MB/s"
+                f" {row['bytes_per_beat']:8.1f} B/beat"
+            )
+        return 0
+    report = quality_report(qe, megabytes=args.mb, alpha=args.alpha)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("=" * 64)
+        print("  Quantum Entropy Quality Report")
+        print("=" * 64)
+        print(f"  {qe}")
+        print(f"  Tested {report['bytes_tested']:,} bytes at alpha={args.alpha}")
+        print()
+        for r in report["tests"]:
+            mark = "PASS" if r["passed"] else "FAIL"
+            print(f"    [{mark}] {r['name']:<20} p={r['p_value']:.6f}")
+        print()
+        print("  Throughput:")
+        for name, rate in report["throughput_bytes_per_sec"].items():
+            print(f"    {name:<14} {rate / 1e6:10.2f} MB/s")
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
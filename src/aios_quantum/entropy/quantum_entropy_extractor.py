@@ -28,25 +28,48 @@ import json
 import math
 import os
 import struct
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional, Sequence
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+
+from .bit_generator import QuantumBitGenerator
+from .checkpoint import read_checkpoint, rekey_pool_bytes, write_checkpoint
+from .conditioning import (
+    BOSONIC_FREQUENCIES,
+    PHI,
+    BeatMaterial,
+    Conditioner,
+    get_conditioner,
+)
+from .pool import DEFAULT_CAPACITY, EntropyPool
+from .sampling import AliasSampler
+from .service import Address, EntropyClient, EntropyServer, check_local
+from .signature import DEFAULT_WINDOW, NoiseSignature
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-# Minimum pool size before we trigger a refill
+# Minimum pool size before we trigger a refill (low watermark)
 _MIN_POOL_BYTES = 64
 
+# Pool level a refill tops up to (high watermark)
+_REFILL_TARGET_BYTES = 4096
+
 # Heartbeat results directory (relative to aios-quantum root)
 _DEFAULT_RESULTS_DIR = "heartbeat_results"
 
-# φ — golden ratio, used as mixing constant
-PHI = 1.6180339887498948482
+# Scale for 53-bit float conversion: (uint64 >> 11) * 2**-53 ∈ [0, 1)
+_FLOAT53_SCALE = 1.0 / (1 << 53)
 
-# Bosonic frequencies from SingularityCore
-BOSONIC_FREQUENCIES = [1.618033, 2.718281, 3.141592, 4.669201, 5.858362]
+# Batches smaller than this are extracted on the calling thread
+_PARALLEL_MIN_ITEMS = 4
 
 
 class QuantumEntropyExtractor:
@@ -66,13 +89,40 @@ class QuantumEntropyExtractor:
         self,
         results_dir: Optional[str] = None,
         auto_load: bool = True,
+        pool_capacity: int = DEFAULT_CAPACITY,
+        low_watermark: int = _MIN_POOL_BYTES,
+        high_watermark: int = _REFILL_TARGET_BYTES,
+        signature_window: int = DEFAULT_WINDOW,
+        subpool_bytes: int = 0,
+        upstream: Optional[EntropyClient] = None,
+        checkpoint_path: Optional[str | Path] = None,
+        conditioner: Optional[str | Conditioner] = None,
     ) -> None:
-        self._pool: bytearray = bytearray()
-        self._pool_offset: int = 0
+        if not 0 <= low_watermark <= high_watermark <= pool_capacity:
+            raise ValueError(
+                "expected 0 <= low_watermark <= high_watermark <= pool_capacity"
+            )
+        self._pool = EntropyPool(pool_capacity)
+        self._low_watermark = low_watermark
+        self._high_watermark = high_watermark
+        # Per-thread sub-pools (disabled when 0) and remote byte source
+        self._subpool_bytes = subpool_bytes
+        self._local = threading.local()
+        self._upstream = upstream
+        # Turns heartbeat material into pool bytes (see conditioning.py)
+        self._conditioner = get_conditioner(conditioner)
         self._beats_loaded: int = 0
         self._total_entropy_bits: float = 0.0
-        self._noise_signature: list[float] = []  # running noise fingerprint
+        # Running noise fingerprint: bounded window + summary + digest
+        self._noise = NoiseSignature(signature_window)
         self._last_refill: float = 0.0
+        self._bit_generator: Optional[QuantumBitGenerator] = None
+
+        # Guards pool and signature state shared with the refill worker
+        self._lock = threading.RLock()
+        self._refill_worker: Optional[EntropyRefillWorker] = None
+        # Heartbeat files already ingested: resolved path → mtime
+        self._ingested_files: dict[str, float] = {}
 
         # Resolve results directory
         if results_dir:
@@ -87,6 +137,14 @@ class QuantumEntropyExtractor:
                 (p for p in candidates if p.exists()), Path(_DEFAULT_RESULTS_DIR)
             )
 
+        # Restore from checkpoint first so auto-load only hashes new beats
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        if self._checkpoint_path is not None and self._checkpoint_path.exists():
+            try:
+                self.load_checkpoint(self._checkpoint_path)
+            except ValueError:
+                pass  # stale or corrupt: fall back to a full load
+
         if auto_load and self._results_dir.exists():
             self._ingest_all_heartbeats()
 
@@ -96,10 +154,8 @@ class QuantumEntropyExtractor:
 
     def random(self) -> float:
         """Return a quantum-derived float in [0, 1)."""
-        raw = self._consume_bytes(8)
-        # Convert 8 bytes to uint64, then normalize to [0, 1)
-        val = struct.unpack(">Q", raw)[0]
-        return val / (2**64)
+        # Convert 8 bytes to uint64, keep the top 53 bits → [0, 1)
+        return (self._next_word() >> 11) * _FLOAT53_SCALE
 
     def uniform(self, a: float, b: float) -> float:
         """Return a quantum-derived float in [a, b)."""
@@ -117,54 +173,221 @@ class QuantumEntropyExtractor:
         span = b - a + 1
         return a + int(self.random() * span) % span
 
-    def choice(self, seq: Sequence[Any]) -> Any:
-        """Choose a quantum-random element from a non-empty sequence."""
-        if not seq:
+    def choice(
+        self,
+        seq: Union[int, Sequence[Any], np.ndarray],
+        size: Union[int, tuple[int, ...], None] = None,
+        replace: bool = True,
+        p: Optional[Sequence[float]] = None,
+    ) -> Any:
+        """Choose a quantum-random element from a non-empty sequence.
+
+        With `size`, `replace` or `p` this follows NumPy's
+        `Generator.choice` and returns an array (see `_choice_array`).
+        """
+        if (
+            size is not None or p is not None or not replace
+            or isinstance(seq, (int, np.integer, np.ndarray))
+        ):
+            return self._choice_array(seq, size, replace, p)
+        if len(seq) == 0:
             raise IndexError("Cannot choose from empty sequence")
         return seq[self.randint(0, len(seq) - 1)]
 
     def sample(self, population: Sequence[Any], k: int) -> list[Any]:
-        """Quantum-random sample without replacement."""
-        pool = list(population)
-        if k > len(pool):
+        """Quantum-random sample without replacement.
+
+        Ranks the population by random keys and keeps the k smallest
+        (argpartition, then a sort of only those k), so no list is
+        popped from.
+        """
+        n = len(population)
+        if k > n:
             raise ValueError("Sample larger than population")
-        result = []
-        for _ in range(k):
-            idx = self.randint(0, len(pool) - 1)
-            result.append(pool.pop(idx))
-        return result
+        if k <= 0:
+            return []
+        keys = self.random_array(n)
+        idx = np.argpartition(keys, k - 1)[:k]
+        idx = idx[np.argsort(keys[idx])]
+        return [population[i] for i in idx.tolist()]
 
     def shuffle(self, x: list[Any]) -> None:
-        """Shuffle in-place using Fisher-Yates with quantum entropy."""
-        for i in range(len(x) - 1, 0, -1):
-            j = self.randint(0, i)
-            x[i], x[j] = x[j], x[i]
+        """Shuffle in-place by sorting on quantum random keys."""
+        if len(x) < 2:
+            return
+        order = np.argsort(self.random_array(len(x)), kind="stable")
+        x[:] = [x[i] for i in order.tolist()]
 
-    def choices(self, population: Sequence[Any], weights: Optional[Sequence[float]] = None, k: int = 1) -> list[Any]:
-        """Weighted quantum-random selection with replacement."""
+    def choices(
+        self,
+        population: Sequence[Any],
+        weights: Optional[Sequence[float]] = None,
+        k: int = 1,
+    ) -> list[Any]:
+        """Weighted quantum-random selection with replacement.
+
+        Builds an alias table (O(n)) and draws k samples in O(k). For
+        repeated draws over the same weights, build the table once
+        with `weighted_sampler`.
+        """
         if weights is None:
-            return [self.choice(population) for _ in range(k)]
-        # Cumulative distribution
-        cum = []
-        total = 0.0
-        for w in weights:
-            total += w
-            cum.append(total)
-        result = []
-        for _ in range(k):
-            r = self.random() * total
-            for i, c in enumerate(cum):
-                if r <= c:
-                    result.append(population[i])
-                    break
-            else:
-                result.append(population[-1])
-        return result
+            if not population:
+                raise IndexError("Cannot choose from empty sequence")
+            idx = self.integers(0, len(population), k)
+            return [population[i] for i in idx.tolist()]
+        return self.weighted_sampler(population, weights).draw(k)
+
+    def weighted_sampler(
+        self,
+        population: Sequence[Any],
+        weights: Sequence[float],
+    ) -> AliasSampler:
+        """Precomputed alias-table sampler bound to this extractor."""
+        return AliasSampler(weights, population=population, extractor=self)
 
     def quantum_bytes(self, n: int) -> bytes:
         """Return n bytes of quantum-derived entropy."""
         return bytes(self._consume_bytes(n))
 
+    def readinto(self, buffer: bytearray | memoryview | np.ndarray) -> int:
+        """Fill a caller-provided writable buffer with entropy (no allocation)."""
+        view = memoryview(buffer).cast("B")
+        self._consume_into(view)
+        return len(view)
+
+    # ------------------------------------------------------------------
+    # Bulk array API — NumPy-style, one pool pull per call
+    # ------------------------------------------------------------------
+
+    def uint64_array(self, n: int) -> np.ndarray:
+        """Return n quantum-derived uint64 words as a NumPy array."""
+        raw = np.empty(n, dtype=">u8")
+        self._consume_into(raw.view(np.uint8))
+        return raw.astype(np.uint64)
+
+    def random_array(self, n: int) -> np.ndarray:
+        """Return n quantum-derived floats in [0, 1).
+
+        Uses the same 53-bit conversion as `random()`: drawn from the
+        same pool bytes, the bulk and scalar values are identical.
+        """
+        words = self.uint64_array(n)
+        return (words >> np.uint64(11)).astype(np.float64) * _FLOAT53_SCALE
+
+    def normal(
+        self,
+        loc: float = 0.0,
+        scale: float = 1.0,
+        size: Union[int, tuple[int, ...], None] = None,
+    ) -> Union[float, np.ndarray]:
+        """Box-Muller normal samples; both outputs of each pair are used."""
+        count = int(np.prod(size)) if size is not None else 1
+        pairs = (count + 1) // 2
+        u = self.random_array(2 * pairs).reshape(2, pairs)
+        radius = np.sqrt(-2.0 * np.log(np.maximum(u[0], 1e-15)))
+        angle = 2.0 * math.pi * u[1]
+        z = np.concatenate([radius * np.cos(angle), radius * np.sin(angle)])[:count]
+        out = loc + scale * z
+        return float(out[0]) if size is None else out.reshape(size)
+
+    def integers(
+        self,
+        low: int,
+        high: Optional[int] = None,
+        size: Union[int, tuple[int, ...], None] = None,
+    ) -> Union[int, np.ndarray]:
+        """Uniform ints in [low, high) — NumPy `Generator.integers` semantics.
+
+        Rejection sampling on 64-bit words keeps the result unbiased.
+        """
+        if high is None:
+            low, high = 0, low
+        span = high - low
+        if span <= 0:
+            raise ValueError("high must be greater than low")
+        int64 = np.iinfo(np.int64)
+        if low < int64.min or high - 1 > int64.max or span > int64.max:
+            raise ValueError("high - low must fit in int64")
+        count = int(np.prod(size)) if size is not None else 1
+
+        # Largest multiple of span that fits in 64 bits
+        limit = (1 << 64) - ((1 << 64) % span)
+        out = np.empty(count, dtype=np.int64)
+        filled = 0
+        while filled < count:
+            words = self.uint64_array(count - filled + 8)
+            if limit < (1 << 64):
+                words = words[words < np.uint64(limit)]
+            take = words[: count - filled]
+            out[filled : filled + take.size] = (take % np.uint64(span)).astype(
+                np.int64
+            ) + low
+            filled += take.size
+        return int(out[0]) if size is None else out.reshape(size)
+
+    def _choice_array(
+        self,
+        a: Union[int, Sequence[Any], np.ndarray],
+        size: Union[int, tuple[int, ...], None] = None,
+        replace: bool = True,
+        p: Optional[Sequence[float]] = None,
+    ) -> Any:
+        """NumPy-style choice: sample from `a` (or range(a) for an int).
+
+        Weighted sampling uses a searchsorted CDF; sampling without
+        replacement uses random sort keys (Efraimidis–Spirakis when
+        weighted), so neither path loops in Python per draw.
+        """
+        items = np.arange(a) if isinstance(a, (int, np.integer)) else np.asarray(a)
+        n = len(items)
+        if n == 0:
+            raise ValueError("a must be non-empty")
+        count = int(np.prod(size)) if size is not None else 1
+        weights = None
+        if p is not None:
+            weights = np.asarray(p, dtype=np.float64)
+            if weights.shape != (n,) or np.any(weights < 0):
+                raise ValueError("p must be non-negative and match a")
+            # Same tolerance as NumPy's Generator.choice
+            if abs(weights.sum() - 1.0) > np.sqrt(np.finfo(np.float64).eps):
+                raise ValueError("probabilities do not sum to 1")
+
+        if replace:
+            if weights is None:
+                idx = self.integers(0, n, count)
+            else:
+                cdf = np.cumsum(weights)
+                u = self.random_array(count) * cdf[-1]
+                idx = np.minimum(np.searchsorted(cdf, u, side="right"), n - 1)
+        else:
+            if count > n:
+                raise ValueError("Sample larger than population")
+            if weights is not None and count > np.count_nonzero(weights):
+                raise ValueError("Fewer non-zero entries in p than size")
+            u = self.random_array(n)
+            if weights is None:
+                keys = u
+            else:
+                with np.errstate(divide="ignore"):
+                    keys = np.log(np.maximum(u, 1e-300)) / weights
+            idx = np.argsort(-keys, kind="stable")[:count]
+
+        result = items[idx]
+        if size is None:
+            return result[0]
+        return result.reshape(size)
+
+    @property
+    def bit_generator(self) -> QuantumBitGenerator:
+        """NumPy BitGenerator view of this extractor."""
+        if self._bit_generator is None:
+            self._bit_generator = QuantumBitGenerator(self)
+        return self._bit_generator
+
+    def generator(self) -> np.random.Generator:
+        """A `numpy.random.Generator` drawing from this extractor."""
+        return np.random.Generator(self.bit_generator)
+
     # ------------------------------------------------------------------
     # Noise signature — the quantum fingerprint
     # ------------------------------------------------------------------
@@ -173,15 +396,35 @@ class QuantumEntropyExtractor:
     def noise_signature(self) -> list[float]:
         """
         The running noise fingerprint — a vector of probabilities from
-        non-ideal states across all ingested heartbeats. This IS the
+        non-ideal states across ingested heartbeats. This IS the
         quantum personality of the hardware.
+
+        Only the most recent `signature_window` values are kept; see
+        `noise_summary` for statistics over the full history.
         """
-        return list(self._noise_signature)
+        with self._lock:
+            return self._noise.values().tolist()
+
+    @property
+    def noise_summary(self) -> dict[str, float]:
+        """Count, mean, variance, min and max over every noise value."""
+        with self._lock:
+            return self._noise.summary()
+
+    @property
+    def checkpoint_path(self) -> Optional[Path]:
+        """Default location for `save_checkpoint`, if configured."""
+        return self._checkpoint_path
 
     @property
     def pool_size(self) -> int:
         """Remaining entropy bytes in the pool."""
-        return len(self._pool) - self._pool_offset
+        return self._pool.available
+
+    @property
+    def conditioner(self) -> Conditioner:
+        """Backend conditioning heartbeat material into pool bytes."""
+        return self._conditioner
 
     @property
     def beats_loaded(self) -> int:
@@ -207,83 +450,257 @@ class QuantumEntropyExtractor:
 
         Returns the number of entropy bytes extracted.
         """
-        # Handle multiple heartbeat JSON formats
-        counts = (
-            beat.get("measurement_counts")
-            or beat.get("counts")
-            or {}
-        )
-        if not counts:
+        extraction = _extract_beat(beat, self._conditioner)
+        if extraction is None:
             return 0
+        return self._commit_extractions([extraction])
 
-        total_shots = sum(counts.values())
-        if total_shots == 0:
-            return 0
+    def ingest_heartbeats(
+        self,
+        beats: Sequence[dict[str, Any]],
+        workers: Optional[int] = None,
+    ) -> int:
+        """
+        Ingest many heartbeat results in one batch.
 
-        # --- Step 1: Extract probability distribution ---
-        probs = {state: count / total_shots for state, count in counts.items()}
+        Extraction (NumPy statistics plus the hash rounds) runs across a
+        thread pool — hashlib releases the GIL on large inputs — and the
+        results are appended to the pool in one block, in input order,
+        under a single lock acquisition. Short of pool overflow, the pool
+        ends up byte-identical to calling `ingest_heartbeat` on each beat.
 
-        # --- Step 2: Calculate Shannon entropy ---
-        entropy_bits = -sum(
-            p * math.log2(p) for p in probs.values() if p > 0
+        Returns the number of entropy bytes extracted.
+        """
+        extract = partial(_extract_beat, conditioner=self._conditioner)
+        extractions = _map_workers(extract, list(beats), workers)
+        return self._commit_extractions(
+            [e for e in extractions if e is not None]
         )
-        self._total_entropy_bits += entropy_bits
-
-        # --- Step 3: Extract noise signature ---
-        # Noise = deviation from ideal states
-        # For GHZ: ideal = {|000...0>, |111...1>}. Everything else is noise.
-        num_qubits = beat.get("num_qubits", len(next(iter(counts))))
-        ideal_all_zero = "0" * num_qubits
-        ideal_all_one = "1" * num_qubits
-        noise_probs = [
-            p for state, p in probs.items()
-            if state not in (ideal_all_zero, ideal_all_one)
-        ]
-        self._noise_signature.extend(noise_probs)
-
-        # --- Step 4: Convert distribution to entropy bytes ---
-        # Method: Hash each (state, count) pair with a mixing constant
-        # to produce deterministic but quantum-derived bytes.
-        # The non-determinism comes from which states appear and how many —
-        # that's the quantum part.
-        entropy_bytes = bytearray()
-
-        # Primary extraction: hash the full distribution
-        dist_str = json.dumps(counts, sort_keys=True)
-        timestamp = beat.get("timestamp", str(time.time()))
-        backend = beat.get("backend", "unknown")
-
-        # Multiple rounds of hashing with bosonic frequency mixing
-        for i, freq in enumerate(BOSONIC_FREQUENCIES):
-            seed = f"{dist_str}:{timestamp}:{backend}:{freq}:{i}"
-            h = hashlib.sha512(seed.encode()).digest()
-            entropy_bytes.extend(h)
-
-        # Secondary extraction: per-state entropy
-        for state, count in sorted(counts.items()):
-            state_seed = f"{state}:{count}:{total_shots}:{PHI}"
-            h = hashlib.sha256(state_seed.encode()).digest()
-            # Weight by information content of this state
-            info_content = -math.log2(count / total_shots) if count > 0 else 0
-            # Take bytes proportional to information content
-            n_bytes = max(1, int(info_content * 4))
-            entropy_bytes.extend(h[:n_bytes])
-
-        # Tertiary extraction: noise harmonics
-        if noise_probs:
-            noise_seed = ":".join(f"{p:.10f}" for p in noise_probs)
-            h = hashlib.sha512(noise_seed.encode()).digest()
-            entropy_bytes.extend(h)
-
-        self._pool.extend(entropy_bytes)
-        self._beats_loaded += 1
-        return len(entropy_bytes)
 
     def ingest_file(self, filepath: str | Path) -> int:
         """Ingest a heartbeat JSON file."""
-        with open(filepath) as f:
+        path = Path(filepath)
+        with open(path) as f:
             beat = json.load(f)
-        return self.ingest_heartbeat(beat)
+        extracted = self.ingest_heartbeat(beat)
+        with self._lock:
+            self._ingested_files[str(path.resolve())] = path.stat().st_mtime
+        return extracted
+
+    def ingest_files(
+        self,
+        paths: Sequence[str | Path],
+        workers: Optional[int] = None,
+    ) -> int:
+        """
+        Batch-ingest heartbeat JSON files.
+
+        Files are read, parsed and extracted in worker threads, then
+        committed together. Corrupt or half-written files are skipped.
+        Returns the number of files ingested.
+        """
+        load = partial(_load_beat_file, conditioner=self._conditioner)
+        loaded = _map_workers(load, [Path(p) for p in paths], workers)
+        loaded = [item for item in loaded if item is not None]
+        self._commit_extractions(
+            [extraction for _, _, extraction in loaded if extraction is not None],
+            files={key: mtime for key, mtime, _ in loaded},
+        )
+        return len(loaded)
+
+    def ingest_directory(
+        self,
+        directory: Optional[str | Path] = None,
+        workers: Optional[int] = None,
+    ) -> int:
+        """
+        Batch-ingest every new heartbeat file in a directory.
+
+        Defaults to the results directory. Files already ingested with an
+        unchanged mtime are skipped. Returns the number of files ingested.
+        """
+        directory = self._results_dir if directory is None else Path(directory)
+        if not directory.exists():
+            return 0
+        pending = []
+        for f in sorted(directory.glob("*.json")):
+            try:
+                mtime = f.stat().st_mtime
+            except OSError:
+                continue
+            if self._ingested_files.get(str(f.resolve())) != mtime:
+                pending.append(f)
+        return self.ingest_files(pending, workers) if pending else 0
+
+    def ingest_new_files(self) -> int:
+        """
+        Ingest heartbeat files in the results directory not seen before.
+
+        Returns the number of files ingested. A file is seen once it has
+        been ingested (directly, via auto-load, or according to a restored
+        checkpoint) and its mtime is unchanged.
+        """
+        return self.ingest_directory()
+
+    def _commit_extractions(
+        self,
+        extractions: Sequence[BeatExtraction],
+        files: Optional[dict[str, float]] = None,
+    ) -> int:
+        """Append extracted beats to the pool as one block."""
+        data = b"".join(e.data for e in extractions)
+        noise = [e.noise_probs for e in extractions if e.noise_probs.size]
+        with self._lock:
+            self._total_entropy_bits += sum(e.entropy_bits for e in extractions)
+            if noise:
+                self._noise.extend(np.concatenate(noise))
+            if data:
+                self._pool.write(data)
+            self._beats_loaded += len(extractions)
+            if files:
+                self._ingested_files.update(files)
+        return len(data)
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def save_checkpoint(self, path: Optional[str | Path] = None) -> Path:
+        """
+        Write pool, noise signature, counters and ingested-file index
+        to `path` (default: the constructor's checkpoint_path).
+        """
+        path = Path(path) if path else self._checkpoint_path
+        if path is None:
+            raise ValueError("no checkpoint path given")
+        with self._lock:
+            unread = self._pool.tail(self._pool.available)
+            window, noise_meta = self._noise.state()
+            meta = {
+                "results_dir": str(self._results_dir.resolve()),
+                "beats_loaded": self._beats_loaded,
+                "total_entropy_bits": self._total_entropy_bits,
+                "noise": noise_meta,
+                "ingested_files": dict(self._ingested_files),
+                "saved_at": time.time(),
+            }
+        write_checkpoint(
+            path,
+            meta,
+            {
+                "pool": np.frombuffer(unread, dtype=np.uint8),
+                "noise_window": window,
+            },
+        )
+        return path
+
+    def load_checkpoint(self, path: str | Path) -> None:
+        """
+        Restore state written by `save_checkpoint`.
+
+        Replaces the current pool and signature. Raises ValueError if
+        the checkpoint is unreadable or belongs to another results
+        directory.
+        """
+        meta, arrays = read_checkpoint(path)
+        if meta.get("results_dir") != str(self._results_dir.resolve()):
+            raise ValueError("checkpoint was written for another results_dir")
+        try:
+            noise = NoiseSignature.from_state(arrays["noise_window"], meta["noise"])
+            pool_bytes = rekey_pool_bytes(arrays["pool"].tobytes())
+            beats_loaded = int(meta["beats_loaded"])
+            total_entropy_bits = float(meta["total_entropy_bits"])
+            ingested_files = {
+                k: float(v) for k, v in meta["ingested_files"].items()
+            }
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"corrupt checkpoint {path}: {e!r}") from e
+        with self._lock:
+            self._pool = EntropyPool(self._pool.capacity)
+            self._pool.write(pool_bytes)
+            self._noise = noise
+            self._beats_loaded = beats_loaded
+            self._total_entropy_bits = total_entropy_bits
+            self._ingested_files = ingested_files
+
+    # ------------------------------------------------------------------
+    # Multi-process service
+    # ------------------------------------------------------------------
+
+    def serve(self, address: Address, allow_remote: bool = False) -> EntropyServer:
+        """
+        Serve this extractor's pool to other processes.
+
+        `address` is a Unix socket path or a loopback (host, port) tuple;
+        other hosts need `allow_remote=True` (the service is not
+        authenticated). Returns the running server; call `stop()` on it
+        to shut down.
+        """
+        return EntropyServer(self, address, allow_remote).start()
+
+    @classmethod
+    def connect(cls, address: Address, **kwargs: Any) -> QuantumEntropyExtractor:
+        """
+        Extractor drawing its bytes from an EntropyServer at `address`.
+
+        Nothing is loaded from disk; refills come from the server.
+        """
+        kwargs.setdefault("auto_load", False)
+        return cls(upstream=EntropyClient(address), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Background refill
+    # ------------------------------------------------------------------
+
+    def start_background_refill(
+        self,
+        poll_interval: float = 5.0,
+        target_bytes: Optional[int] = None,
+    ) -> EntropyRefillWorker:
+        """
+        Start a daemon thread that ingests new heartbeat files and keeps
+        the pool topped up ahead of demand.
+
+        While it runs, consumers that dip below the low watermark only
+        wake the worker instead of hashing on their own thread; they
+        refill inline only if the pool cannot cover the request at all.
+        """
+        if self._refill_worker is not None and self._refill_worker.is_alive():
+            return self._refill_worker
+        self._refill_worker = EntropyRefillWorker(
+            self,
+            poll_interval=poll_interval,
+            target_bytes=target_bytes or self._high_watermark,
+        )
+        self._refill_worker.start()
+        return self._refill_worker
+
+    def stop_background_refill(self, timeout: Optional[float] = None) -> None:
+        """Stop the background refill thread, if running."""
+        worker, self._refill_worker = self._refill_worker, None
+        if worker is not None:
+            worker.stop(timeout)
+
+    def top_up(self, target: int) -> int:
+        """
+        Fill the pool to `target` bytes; returns bytes added.
+
+        The hash chain is computed without holding the extractor lock,
+        so consumers keep drawing while a top-up runs.
+        """
+        target = min(target, self._pool.capacity)
+        with self._lock:
+            shortfall = target - self._pool.available
+            seed = self._pool.tail(64)
+        if shortfall <= 0:
+            return 0
+        if self._upstream is not None:
+            chain = self._upstream.read(shortfall)
+        else:
+            chain = _hash_chain(seed, -(-shortfall // 64))
+        with self._lock:
+            self._pool.write(chain)
+        return len(chain)
 
     # ------------------------------------------------------------------
     # Internal
@@ -293,36 +710,99 @@ class QuantumEntropyExtractor:
         """Load all heartbeat JSON files from the results directory."""
         if not self._results_dir.exists():
             return
-        files = sorted(self._results_dir.glob("*.json"))
-        for f in files:
-            try:
-                self.ingest_file(f)
-            except (json.JSONDecodeError, KeyError, OSError):
-                continue  # skip corrupt files
+        self.ingest_new_files()
 
     def _consume_bytes(self, n: int) -> bytearray:
+        """Consume n bytes from the entropy pool into a new bytearray."""
+        out = bytearray(n)
+        self._consume_into(out)
+        return out
+
+    def _next_word(self) -> int:
+        """Consume one big-endian uint64 from the pool."""
+        if self._subpool_bytes:
+            local = self._thread_subpool()
+            if local.pool.available >= 8:
+                local.pool.readinto(local.word)
+                return struct.unpack_from(">Q", local.word)[0]
+        word = bytearray(8)
+        self._consume_into(word)
+        return struct.unpack_from(">Q", word)[0]
+
+    def _thread_subpool(self) -> threading.local:
+        """This thread's private sub-pool, created on first use."""
+        local = self._local
+        if not hasattr(local, "pool"):
+            local.pool = EntropyPool(self._subpool_bytes)
+            local.chunk = bytearray(self._subpool_bytes)
+            local.word = bytearray(8)
+        return local
+
+    def _consume_into(self, dest: bytearray | memoryview | np.ndarray) -> None:
         """
-        Consume n bytes from the entropy pool.
-        If pool is low, attempt to refill from noise signature.
+        Fill dest from this thread's sub-pool when enabled, otherwise
+        from the shared pool.
+
+        A sub-pool is refilled by carving `subpool_bytes` off the shared
+        pool in one locked read; draws from it then take no lock.
+        Requests larger than a sub-pool go to the shared pool directly.
         """
-        # Check if we need to refill
-        available = len(self._pool) - self._pool_offset
-        if available < n:
-            self._refill_from_noise()
+        out = memoryview(dest).cast("B")
+        if self._subpool_bytes and len(out) <= self._subpool_bytes:
+            local = self._thread_subpool()
+            got = local.pool.readinto(out)
+            if got < len(out):
+                # Sub-pool drained: carve a fresh block off the shared pool
+                self._consume_shared(local.chunk)
+                local.pool.write(local.chunk)
+                local.pool.readinto(out[got:])
+            return
+        self._consume_shared(out)
 
+    def _consume_shared(self, dest: bytearray | memoryview | np.ndarray) -> None:
+        """
+        Fill dest from the entropy pool, refilling as needed.
+
+        Refills happen only when the pool drops below the low watermark
+        (or cannot cover the request) and top it up to the high
+        watermark, so most calls are a single ring-buffer copy. With a
+        background worker running, only a request the pool cannot cover
+        refills on the caller's thread. In client mode the server
+        round-trip runs outside the lock so other threads keep drawing.
+        """
+        out = memoryview(dest).cast("B")
+        filled = 0
+        while filled < len(out):
+            fetch = 0
+            with self._lock:
+                want = min(len(out) - filled, self._pool.capacity)
+                if self._pool.available < max(want, self._low_watermark):
+                    worker = self._refill_worker
+                    if worker is not None and self._pool.available >= want:
+                        worker.wake()  # refill ahead of demand, off-thread
+                    elif self._upstream is not None:
+                        target = min(
+                            max(want, self._high_watermark), self._pool.capacity
+                        )
+                        fetch = target - self._pool.available
+                    else:
+                        self._refill(max(want, self._high_watermark))
+                if not fetch:
+                    filled += self._pool.readinto(out[filled : filled + want])
+                    continue
+            # Client mode: the server's pool is the only source
+            chunk = self._upstream.read(fetch)
+            with self._lock:
+                self._pool.write(chunk)
+
+    def _refill(self, target: int) -> None:
+        """Top the pool up to `target` bytes (capped at capacity)."""
+        target = min(target, self._pool.capacity)
+        self._refill_from_noise()
         # Still not enough? Generate from noise signature hash chain
-        while len(self._pool) - self._pool_offset < n:
-            self._extend_pool_via_hash_chain()
-
-        result = self._pool[self._pool_offset : self._pool_offset + n]
-        self._pool_offset += n
-
-        # Compact pool periodically
-        if self._pool_offset > 4096:
-            self._pool = self._pool[self._pool_offset :]
-            self._pool_offset = 0
-
-        return bytearray(result)
+        shortfall = target - self._pool.available
+        if shortfall > 0:
+            self._extend_pool_via_hash_chain(blocks=-(-shortfall // 64))
 
     def _refill_from_noise(self) -> None:
         """
@@ -331,29 +811,24 @@ class QuantumEntropyExtractor:
         The noise signature itself is quantum-derived, so this is
         not pseudo-random — it's a deterministic expansion of quantum noise.
         """
-        if not self._noise_signature:
+        if not self._noise:
             return
 
-        # Hash the entire noise signature with a counter
-        sig_str = ":".join(f"{p:.15f}" for p in self._noise_signature)
-        counter = int(time.time() * 1000) ^ self._pool_offset
-        seed = f"{sig_str}:{counter}:{PHI}"
-        h = hashlib.sha512(seed.encode()).digest()
-        self._pool.extend(h)
+        # Hash the noise signature (via its running digest) with a counter
+        counter = int(time.time() * 1000) ^ self._pool.total_read
+        h = self._noise.hash_copy()
+        h.update(f":{counter}:{PHI}".encode())
+        self._pool.write(h.digest())
 
-    def _extend_pool_via_hash_chain(self) -> None:
+    def _extend_pool_via_hash_chain(self, blocks: int = 1) -> None:
         """
         Last resort: extend pool via hash chain of existing pool state.
         Still seeded from original quantum data — never from nothing.
-        """
-        if self._pool:
-            current = bytes(self._pool[-64:]) if len(self._pool) >= 64 else bytes(self._pool)
-        else:
-            # Absolute fallback: hash the bosonic frequencies
-            current = struct.pack(">5d", *BOSONIC_FREQUENCIES)
 
-        h = hashlib.sha512(current).digest()
-        self._pool.extend(h)
+        Each block is SHA-512 of the previous 64 bytes; the chain is
+        built locally and written to the pool in one call.
+        """
+        self._pool.write(_hash_chain(self._pool.tail(64), blocks))
 
     # ------------------------------------------------------------------
     # Status
@@ -363,11 +838,18 @@ class QuantumEntropyExtractor:
         """Return extractor status."""
         return {
             "pool_bytes": self.pool_size,
+            "pool_capacity": self._pool.capacity,
             "beats_loaded": self._beats_loaded,
             "total_entropy_bits": round(self._total_entropy_bits, 2),
-            "noise_signature_length": len(self._noise_signature),
+            "noise_signature_length": len(self._noise),
+            "noise_window": self._noise.window_size,
             "results_dir": str(self._results_dir),
             "results_dir_exists": self._results_dir.exists(),
+            "files_ingested": len(self._ingested_files),
+            "background_refill": self._refill_worker is not None,
+            "subpool_bytes": self._subpool_bytes,
+            "upstream": repr(self._upstream) if self._upstream else None,
+            "conditioner": self._conditioner.name,
         }
 
     def __repr__(self) -> str:
@@ -379,11 +861,161 @@ class QuantumEntropyExtractor:
         )
 
 
+@dataclass(frozen=True)
+class BeatExtraction:
+    """Entropy extracted from one heartbeat, ready to commit to the pool."""
+
+    data: bytes
+    entropy_bits: float
+    noise_probs: np.ndarray
+
+
+def _extract_beat(
+    beat: dict[str, Any], conditioner: Conditioner
+) -> Optional[BeatExtraction]:
+    """
+    Extract entropy bytes and statistics from one heartbeat.
+
+    Pure function of the beat (bar the timestamp fallback), so batches
+    can run it in worker threads. Returns None for beats without counts.
+    """
+    # Handle multiple heartbeat JSON formats
+    counts = (
+        beat.get("measurement_counts")
+        or beat.get("counts")
+        or {}
+    )
+    if not counts:
+        return None
+
+    states = list(counts)
+    values = np.fromiter(counts.values(), dtype=np.float64, count=len(states))
+    total_shots = sum(counts.values())
+    if total_shots == 0:
+        return None
+
+    # --- Step 1: Extract probability distribution ---
+    probs = values / total_shots
+
+    # --- Step 2: Calculate Shannon entropy ---
+    nonzero = probs[probs > 0]
+    entropy_bits = float(-(nonzero * np.log2(nonzero)).sum())
+
+    # --- Step 3: Extract noise signature ---
+    # Noise = deviation from ideal states
+    # For GHZ: ideal = {|000...0>, |111...1>}. Everything else is noise.
+    num_qubits = beat.get("num_qubits", len(states[0]))
+    ideal = ("0" * num_qubits, "1" * num_qubits)
+    is_noise = np.fromiter(
+        (state not in ideal for state in states), dtype=bool, count=len(states)
+    )
+    noise_probs = probs[is_noise]
+
+    # --- Step 4: Condition the distribution into entropy bytes ---
+    material = BeatMaterial(
+        counts=counts,
+        total_shots=total_shots,
+        timestamp=beat.get("timestamp", str(time.time())),
+        backend=beat.get("backend", "unknown"),
+        noise_probs=noise_probs,
+    )
+    data = conditioner.condition_beat(material)
+    return BeatExtraction(data, entropy_bits, noise_probs)
+
+
+def _load_beat_file(
+    path: Path, conditioner: Conditioner
+) -> Optional[tuple[str, float, Optional[BeatExtraction]]]:
+    """Read and extract one heartbeat file; None if unreadable."""
+    try:
+        mtime = path.stat().st_mtime
+        with open(path) as f:
+            beat = json.load(f)
+        return str(path.resolve()), mtime, _extract_beat(beat, conditioner)
+    except (json.JSONDecodeError, KeyError, OSError, AttributeError):
+        return None  # skip corrupt or half-written files
+
+
+def _map_workers(fn, items: list, workers: Optional[int]) -> list:
+    """Map fn over items in order, across a thread pool for large batches."""
+    if workers == 1 or len(items) < _PARALLEL_MIN_ITEMS:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def _hash_chain(seed: bytes, blocks: int) -> bytes:
+    """SHA-512 chain: each 64-byte block hashes the previous one."""
+    current = seed or struct.pack(">5d", *BOSONIC_FREQUENCIES)
+    chain = []
+    for _ in range(blocks):
+        current = hashlib.sha512(current).digest()
+        chain.append(current)
+    return b"".join(chain)
+
+
+class EntropyRefillWorker(threading.Thread):
+    """
+    Background thread that keeps an extractor's pool ahead of demand.
+
+    Every `poll_interval` seconds — or sooner when a consumer calls
+    `wake()` — it ingests new heartbeat files from the results
+    directory, then tops the pool up to `target_bytes`. When the
+    extractor has a checkpoint path, newly ingested files trigger a
+    checkpoint save.
+    """
+
+    def __init__(
+        self,
+        extractor: QuantumEntropyExtractor,
+        poll_interval: float = 5.0,
+        target_bytes: int = _REFILL_TARGET_BYTES,
+    ) -> None:
+        super().__init__(name="quantum-entropy-refill", daemon=True)
+        self.extractor = extractor
+        self.poll_interval = poll_interval
+        self.target_bytes = target_bytes
+        self.files_ingested = 0
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+
+    def wake(self) -> None:
+        """Ask for a refill pass now rather than at the next poll."""
+        self._wake.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the worker to exit and wait for it."""
+        self._stop_event.set()
+        self._wake.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            new_files = self.extractor.ingest_new_files()
+            self.files_ingested += new_files
+            if new_files and self.extractor.checkpoint_path is not None:
+                self.extractor.save_checkpoint()
+            self.extractor.top_up(self.target_bytes)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+
 # ---------------------------------------------------------------------------
 # Module-level singleton — the global quantum entropy source
 # ---------------------------------------------------------------------------
 
 _global_extractor: Optional[QuantumEntropyExtractor] = None
+_global_lock = threading.Lock()
+
+# Per-thread sub-pool size used by the global extractor
+_GLOBAL_SUBPOOL_BYTES = 4096
+
+# Set to a socket path (or loopback host:port) to draw from an EntropyServer
+ENTROPY_SERVER_ENV = "AIOS_ENTROPY_SERVER"
+
+# Set to "1" to accept a non-loopback host in AIOS_ENTROPY_SERVER
+ENTROPY_ALLOW_REMOTE_ENV = "AIOS_ENTROPY_ALLOW_REMOTE"
 
 
 def get_quantum_entropy() -> QuantumEntropyExtractor:
@@ -396,13 +1028,43 @@ def get_quantum_entropy() -> QuantumEntropyExtractor:
         x = qe.random()       # quantum float in [0, 1)
         y = qe.uniform(0, 1)  # quantum float in [a, b)
         z = qe.choice(items)  # quantum selection
+
+    Safe to call from many threads; each thread draws from its own
+    sub-pool. If AIOS_ENTROPY_SERVER is set, the singleton connects to
+    that EntropyServer instead of loading the results directory.
     """
     global _global_extractor
     if _global_extractor is None:
-        _global_extractor = QuantumEntropyExtractor()
+        with _global_lock:
+            if _global_extractor is None:
+                server = os.environ.get(ENTROPY_SERVER_ENV)
+                if server:
+                    allow_remote = os.environ.get(ENTROPY_ALLOW_REMOTE_ENV) == "1"
+                    _global_extractor = QuantumEntropyExtractor.connect(
+                        _parse_address(server, allow_remote),
+                        subpool_bytes=_GLOBAL_SUBPOOL_BYTES,
+                    )
+                else:
+                    _global_extractor = QuantumEntropyExtractor(
+                        subpool_bytes=_GLOBAL_SUBPOOL_BYTES,
+                    )
     return _global_extractor
 
 
+def _parse_address(value: str, allow_remote: bool = False) -> Address:
+    """
+    "host:port" → TCP address; anything else is a socket path.
+
+    Raises ValueError for a non-loopback host unless `allow_remote`.
+    """
+    host, sep, port = value.rpartition(":")
+    if sep and host and port.isdigit():
+        address = (host.strip("[]"), int(port))
+        check_local(address, allow_remote)
+        return address
+    return value
+
+
 # ---------------------------------------------------------------------------
 # CLI self-test
 # ---------------------------------------------------------------------------
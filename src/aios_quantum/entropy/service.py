@@ -0,0 +1,242 @@
+"""
+Entropy Service — one ingested pool shared by many processes
+============================================================
+
+Every process that builds its own QuantumEntropyExtractor re-parses and
+re-hashes the whole heartbeat history. An EntropyServer instead owns a
+single extractor and hands out bytes over a local socket; worker
+processes attach an EntropyClient as their extractor's upstream:
+
+    # coordinator
+    server = EntropyServer(get_quantum_entropy(), "/tmp/aios-entropy.sock")
+    server.start()
+
+    # each worker
+    qe = QuantumEntropyExtractor.connect("/tmp/aios-entropy.sock")
+    qe.random()
+
+Addresses are a filesystem path (Unix domain socket) or a
+(host, port) tuple for TCP on platforms without AF_UNIX. The service
+has no authentication, so TCP is local-only: non-loopback hosts
+(including "" / 0.0.0.0, every interface) are refused unless the
+caller passes allow_remote=True. IPv6 hosts (e.g. "::1") are served
+over AF_INET6. A Unix socket is created with mode 0600, and start()
+only replaces an existing path if it is a stale socket.
+
+Wire protocol: the client sends a 4-byte big-endian length, the server
+replies with exactly that many entropy bytes.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import os
+import socket
+import socketserver
+import stat
+import struct
+import threading
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from .quantum_entropy_extractor import QuantumEntropyExtractor
+
+Address = Union[str, tuple[str, int]]
+
+# Largest single request the server will answer
+MAX_REQUEST_BYTES = 1 << 20
+
+_LENGTH = struct.Struct(">I")
+
+
+def is_loopback(host: str) -> bool:
+    """True for localhost and loopback IP addresses."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def check_local(address: Address, allow_remote: bool = False) -> None:
+    """Raise ValueError for a TCP address off the loopback interface."""
+    if isinstance(address, str) or allow_remote:
+        return
+    if not is_loopback(address[0]):
+        raise ValueError(
+            f"entropy service is local-only; {address[0]!r} is not a loopback "
+            "host (pass allow_remote=True to override)"
+        )
+
+
+def _is_ipv6(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).version == 6
+    except ValueError:
+        return False
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    """Read exactly n bytes or raise ConnectionError."""
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        k = sock.recv_into(view[got:])
+        if k == 0:
+            raise ConnectionError("entropy connection closed")
+        got += k
+    return bytes(buf)
+
+
+class _EntropyRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        extractor = self.server.extractor  # type: ignore[attr-defined]
+        while True:
+            try:
+                (n,) = _LENGTH.unpack(_recv_exact(self.request, _LENGTH.size))
+            except (ConnectionError, OSError):
+                return
+            if n == 0 or n > MAX_REQUEST_BYTES:
+                return
+            self.request.sendall(extractor.quantum_bytes(n))
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _TCP6Server(_TCPServer):
+    address_family = socket.AF_INET6
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink a socket left by a previous run; refuse to touch anything else."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path!r} exists and is not a socket")
+    os.unlink(path)
+
+
+class EntropyServer:
+    """Serve an extractor's pool to other processes over a local socket."""
+
+    def __init__(
+        self,
+        extractor: QuantumEntropyExtractor,
+        address: Address,
+        allow_remote: bool = False,
+    ) -> None:
+        check_local(address, allow_remote)
+        self.extractor = extractor
+        self.address = address
+        self._server: Optional[socketserver.BaseServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> EntropyServer:
+        """Bind and serve on a daemon thread."""
+        if isinstance(self.address, str):
+            _remove_stale_socket(self.address)
+            server = _UnixServer(
+                self.address, _EntropyRequestHandler, bind_and_activate=False
+            )
+            try:
+                server.server_bind()
+                os.chmod(self.address, 0o600)  # owner only, before listening
+                server.server_activate()
+            except BaseException:
+                server.server_close()
+                raise
+        else:
+            tcp = _TCP6Server if _is_ipv6(self.address[0]) else _TCPServer
+            server = tcp(self.address, _EntropyRequestHandler)
+            self.address = server.server_address[:2]
+        server.extractor = self.extractor
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="quantum-entropy-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> EntropyServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+class EntropyClient:
+    """Draw bytes from an EntropyServer. Thread-safe; reconnects once on error."""
+
+    def __init__(self, address: Address, timeout: float = 5.0) -> None:
+        self.address = address
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        if not isinstance(self.address, str):
+            # Resolves the host and picks AF_INET / AF_INET6 to match
+            return socket.create_connection(self.address, self.timeout)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.address)
+        return sock
+
+    def read(self, n: int) -> bytes:
+        """Fetch n bytes from the server."""
+        chunks = []
+        with self._lock:
+            while n > 0:
+                k = min(n, MAX_REQUEST_BYTES)
+                chunks.append(self._request(k))
+                n -= k
+        return b"".join(chunks)
+
+    def _request(self, n: int) -> bytes:
+        for attempt in (0, 1):
+            try:
+                if self._sock is None:
+                    self._sock = self._connect()
+                self._sock.sendall(_LENGTH.pack(n))
+                return _recv_exact(self._sock, n)
+            except (ConnectionError, OSError):
+                self.close()
+                if attempt:
+                    raise
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    def __repr__(self) -> str:
+        return f"EntropyClient({self.address!r})"
@@ -0,0 +1,165 @@
+"""
+Noise Signature — bounded streaming fingerprint
+===============================================
+
+The noise signature is every non-ideal state probability seen across
+ingested heartbeats. Stored as a list it grows forever; this keeps
+three constant-size views of it instead:
+
+    window   — the most recent `window_size` values (float64 ring)
+    summary  — count, mean, variance, min, max (streaming, Welford)
+    digest   — running SHA-512 over the whole formatted history
+
+Memory and the cost of deriving refill entropy from the digest stay
+constant no matter how many heartbeats have been ingested.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import Any, Iterable
+
+import numpy as np
+
+# Values kept in the window by default
+DEFAULT_WINDOW = 4096
+
+
+class NoiseSignature:
+    """Constant-memory streaming noise signature."""
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW) -> None:
+        if window_size <= 0:
+            raise ValueError("window_size must be positive")
+        self._window = np.zeros(window_size, dtype=np.float64)
+        self._next = 0          # ring write position
+        self._count = 0         # values ever seen
+        self._mean = 0.0
+        self._m2 = 0.0          # sum of squared deviations (Welford)
+        self._min = math.inf
+        self._max = -math.inf
+        # Hashes ":".join(f"{p:.15f}") over the full history
+        self._hash = hashlib.sha512()
+
+    # ------------------------------------------------------------------
+    # Update
+    # ------------------------------------------------------------------
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Append new noise probabilities."""
+        batch = np.fromiter(values, dtype=np.float64)
+        n = batch.size
+        if n == 0:
+            return
+
+        # Digest: identical bytes to joining the whole history
+        text = ":".join(f"{p:.15f}" for p in batch.tolist())
+        self._hash.update(((":" if self._count else "") + text).encode())
+
+        # Summary: merge batch statistics (Chan et al. parallel update)
+        batch_mean = float(batch.mean())
+        batch_m2 = float(((batch - batch_mean) ** 2).sum())
+        total = self._count + n
+        delta = batch_mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += batch_m2 + delta * delta * self._count * n / total
+        self._min = min(self._min, float(batch.min()))
+        self._max = max(self._max, float(batch.max()))
+        self._count = total
+
+        # Window: keep only the most recent values
+        size = self._window.size
+        if n >= size:
+            self._window[:] = batch[-size:]
+            self._next = 0
+        else:
+            first = min(n, size - self._next)
+            self._window[self._next : self._next + first] = batch[:first]
+            self._window[: n - first] = batch[first:]
+            self._next = (self._next + n) % size
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Total values ever seen (not just those in the window)."""
+        return self._count
+
+    @property
+    def window_size(self) -> int:
+        return self._window.size
+
+    def values(self) -> np.ndarray:
+        """Most recent values, oldest first (a copy)."""
+        size = self._window.size
+        if self._count < size:
+            return self._window[: self._count].copy()
+        return np.concatenate([self._window[self._next :], self._window[: self._next]])
+
+    def hash_copy(self) -> Any:
+        """Copy of the running SHA-512 state, ready for more input."""
+        return self._hash.copy()
+
+    def digest(self) -> bytes:
+        """SHA-512 digest of the full formatted history."""
+        return self._hash.digest()
+
+    def summary(self) -> dict[str, float]:
+        """Streaming statistics over the full history."""
+        if not self._count:
+            return {"count": 0}
+        return {
+            "count": self._count,
+            "mean": self._mean,
+            "variance": self._m2 / self._count,
+            "min": self._min,
+            "max": self._max,
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def state(self) -> tuple[np.ndarray, dict[str, Any]]:
+        """Window values (oldest first) and scalar state for checkpointing."""
+        return self.values(), {
+            "window_size": self._window.size,
+            "count": self._count,
+            "mean": self._mean,
+            "m2": self._m2,
+            "min": self._min if self._count else None,
+            "max": self._max if self._count else None,
+            "digest": self.digest().hex(),
+        }
+
+    @classmethod
+    def from_state(
+        cls, values: np.ndarray, meta: dict[str, Any]
+    ) -> NoiseSignature:
+        """
+        Rebuild a signature saved with `state()`.
+
+        hashlib states cannot be serialized, so the running hash resumes
+        from SHA-512 of the saved digest: it still commits to the whole
+        history, but no longer equals a hash of the joined values.
+        """
+        sig = cls(int(meta["window_size"]))
+        n = min(len(values), sig._window.size)
+        sig._window[:n] = values[len(values) - n :]
+        sig._next = n % sig._window.size
+        sig._count = int(meta["count"])
+        sig._mean = float(meta["mean"])
+        sig._m2 = float(meta["m2"])
+        if sig._count:
+            sig._min = float(meta["min"])
+            sig._max = float(meta["max"])
+        sig._hash = hashlib.sha512(bytes.fromhex(meta["digest"]))
+        return sig
+
+    def __repr__(self) -> str:
+        return (
+            f"NoiseSignature(count={self._count}, "
+            f"window={min(self._count, self._window.size)}/{self._window.size})"
+        )
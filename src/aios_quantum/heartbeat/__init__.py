@@ -11,16 +11,25 @@ from .scheduler import (
     QuantumHeartbeat,
     HeartbeatConfig,
     HeartbeatResult,
+    HeartbeatGroup,
+    heartbeat_phases,
+    parse_scatter_target,
     test_heartbeat,
     classify_backend,
     IBM_BACKEND_FAMILIES,
 )
+from .writer import ResultWriter, read_result_log
 
 __all__ = [
     "QuantumHeartbeat",
     "HeartbeatConfig",
     "HeartbeatResult",
+    "HeartbeatGroup",
+    "heartbeat_phases",
+    "parse_scatter_target",
     "test_heartbeat",
     "classify_backend",
     "IBM_BACKEND_FAMILIES",
+    "ResultWriter",
+    "read_result_log",
 ]
@@ -12,18 +12,46 @@ Architecture:
         └── records results
         └── sleeps
 
+    run_async() keeps the same steps on a fixed-rate asyncio clock:
+    beats execute in worker threads, saving and result callbacks
+    (e.g. cloud upload) overlap the next beat, and stop() wakes the
+    clock immediately.
+
+    Scatter mode (scatter_targets) sends each beat to several
+    providers/backends at once and records the results as a beat group,
+    for cross-hardware comparison at the wall-clock cost of one beat.
+
+    The circuit is built once as a template with one Parameter per Rz;
+    a beat binds its phases. run_batch() (and catch-up of missed ticks
+    in run_async) submits N beats as a single sampler PUB sweeping the
+    phase parameters: one job, one queue wait.
+
+    Results are handed to a background ResultWriter (append-only daily
+    JSONL log plus the per-beat files) and only the most recent
+    `results_ring_size` stay in memory, so long runs have flat memory
+    and no beat waits on disk.
+
 The heartbeat is our tachyonic probe - each execution touches the quantum
 substrate and brings back measurements from the boundary.
 """
 
 import os
+import math
 import time
-import json
+import asyncio
+import inspect
 import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from collections import deque
+from typing import Optional, Dict, Any, Callable, Deque, Iterable, Tuple
 from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import numpy as np
+
+from .writer import ResultWriter
 
 # Configure logging
 logging.basicConfig(
@@ -39,6 +67,7 @@ class HeartbeatConfig:
     
     # Timing
     interval_seconds: int = 3600  # 1 hour default
+    max_concurrent_beats: int = 1  # Async scheduler: beats allowed in flight
     
     # Circuit parameters
     num_qubits: int = 27
@@ -51,6 +80,10 @@ class HeartbeatConfig:
     
     # Storage
     results_dir: str = "heartbeat_results"
+    results_ring_size: int = 1000  # Recent results kept in memory
+    fsync_policy: str = "batch"  # "always", "batch", "interval", "never"
+    fsync_interval_seconds: float = 5.0  # For the "interval" policy
+    write_beat_files: bool = True  # Per-beat JSON files next to the log
     
     # Behavior
     use_simulator: bool = False  # Set True for testing
@@ -61,11 +94,26 @@ class HeartbeatConfig:
     preferred_backend: str = ""  # Specific backend name, "" = auto
     provider_priority: Optional[list] = None  # Provider failover order
     use_provider_registry: bool = True  # Use multi-provider (vs legacy IBM-only)
+    routing_policy: str = "priority"  # "priority" or "adaptive" (latency-aware)
+    hedge_percentile: Optional[float] = None  # e.g. 0.95; None = no hedging
+    provider_stats_file: str = ""  # "" = <results_dir>/provider_stats.json
+    race_deadline_seconds: Optional[float] = None  # Race hardware vs simulator
+    # (race and hedge losers still run; their QPU time is charged when they finish)
+    breaker_failure_threshold: int = 3  # Consecutive failures to open breaker
+    breaker_reset_seconds: float = 300.0  # Open time before a probe attempt
     
     # Backend rotation (for multi-core scatter pattern)
     backend_rotation: Optional[list] = None  # List of backends to cycle through
     rotation_index_file: str = "heartbeat_results/.rotation_index"
     
+    # Scatter mode: run every beat on all targets concurrently
+    scatter_targets: Optional[list] = None  # "provider" or "provider:backend"
+    scatter_timeout_seconds: float = 900.0  # Per-target deadline
+    
+    # Async scheduler: run ticks missed while behind as one batched job
+    catch_up_missed_beats: bool = False
+    max_batch_beats: int = 24  # Largest catch-up / run_batch sweep
+    
     def beats_remaining(self, used_seconds: float) -> int:
         """Calculate how many heartbeats we can still do this month."""
         remaining = self.max_monthly_seconds - used_seconds
@@ -91,6 +139,9 @@ IBM_BACKEND_FAMILIES = {
     "ibm_algiers": ("falcon", "r5.11"),
     # Simulators
     "statevector_sampler": ("simulator", ""),
+    "stabilizer_simulator": ("simulator", ""),
+    "mps_simulator": ("simulator", ""),
+    "heartbeat_sampler": ("simulator", ""),
     "aer_simulator": ("simulator", ""),
     "qasm_simulator": ("simulator", ""),
 }
@@ -138,6 +189,9 @@ class HeartbeatResult:
     backend_family: str = "simulator"  # "eagle" | "heron" | "simulator" | etc.
     backend_processor: str = ""  # e.g., "r3" for Eagle r3, empty for simulator
     
+    # Scatter beat group this result belongs to ("" for single beats)
+    group_id: str = ""
+    
     # Circuit info
     num_qubits: int = 5
     circuit_depth: int = 0
@@ -159,6 +213,56 @@ class HeartbeatResult:
         return asdict(self)
 
 
+@dataclass
+class HeartbeatGroup:
+    """One beat scattered across several providers/backends."""
+    
+    group_id: str
+    beat_number: int
+    timestamp_utc: str
+    targets: list
+    
+    # One result per target that finished in time
+    results: list[HeartbeatResult] = field(default_factory=list)
+    # target → error message (including timeouts)
+    failures: Dict[str, str] = field(default_factory=dict)
+    wall_time_seconds: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Group manifest; member counts live in their own beat files."""
+        return {
+            "group_id": self.group_id,
+            "beat_number": self.beat_number,
+            "timestamp_utc": self.timestamp_utc,
+            "targets": self.targets,
+            "members": [
+                {
+                    "backend_name": r.backend_name,
+                    "job_id": r.job_id,
+                    "source": r.source,
+                    "execution_time_seconds": r.execution_time_seconds,
+                    "coherence_estimate": r.coherence_estimate,
+                    "entropy": r.entropy,
+                }
+                for r in self.results
+            ],
+            "failures": self.failures,
+            "wall_time_seconds": self.wall_time_seconds,
+        }
+
+
+def heartbeat_phases(num_qubits: int, beat_number: int) -> np.ndarray:
+    """Rz angle of every qubit for beat `beat_number`."""
+    i = np.arange(1, num_qubits + 1)
+    return (i * (beat_number + 1) * 0.1) % (2 * math.pi)
+
+
+def parse_scatter_target(target: str) -> tuple[str, Optional[str]]:
+    """Split "provider:backend" (backend optional) into its parts."""
+    provider, _, backend = target.partition(":")
+    return provider, backend or None
+
+
 class QuantumHeartbeat:
     """
     The quantum heartbeat scheduler.
@@ -172,18 +276,35 @@ class QuantumHeartbeat:
         
         # Or single beat for testing:
         result = heartbeat.single_beat()
+        
+        # Same beat on several backends at once:
+        group = heartbeat.scatter_beat(["ibm:ibm_fez", "ionq", "simulator"])
     """
     
     def __init__(self, config: Optional[HeartbeatConfig] = None):
         self.config = config or HeartbeatConfig()
         self.beat_count = 0
         self.budget_used = 0.0
-        self.results: list[HeartbeatResult] = []
+        self.results: Deque[HeartbeatResult] = deque(
+            maxlen=self.config.results_ring_size
+        )
         self.running = False
         
+        # Guards budget and rotation state shared by concurrent beats
+        self._state_lock = threading.Lock()
+        # Async scheduler wake-up (set by stop())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        
         # Ensure results directory exists
         self.results_path = Path(self.config.results_dir)
         self.results_path.mkdir(parents=True, exist_ok=True)
+        self._writer = ResultWriter(
+            self.results_path,
+            fsync=self.config.fsync_policy,
+            fsync_interval=self.config.fsync_interval_seconds,
+            write_beat_files=self.config.write_beat_files,
+        )
         
         # Runtime will be initialized on first beat
         self._runtime = None
@@ -192,6 +313,10 @@ class QuantumHeartbeat:
         # Multi-provider registry (lazy init)
         self._provider_registry = None
         
+        # Parameterized heartbeat circuit (built on first use)
+        self._template = None
+        self._phase_params = None
+        
         # Backend rotation tracking
         self._rotation_index = self._load_rotation_index()
         
@@ -230,11 +355,12 @@ class QuantumHeartbeat:
             return None
         
         backends = self.config.backend_rotation
-        backend_name = backends[self._rotation_index % len(backends)]
-        
-        # Advance rotation for next beat
-        self._rotation_index += 1
-        self._save_rotation_index(self._rotation_index)
+        with self._state_lock:
+            backend_name = backends[self._rotation_index % len(backends)]
+            
+            # Advance rotation for next beat
+            self._rotation_index += 1
+            self._save_rotation_index(self._rotation_index)
         
         return backend_name
     
@@ -277,7 +403,16 @@ class QuantumHeartbeat:
         if self._provider_registry is None:
             from aios_quantum.providers import ProviderRegistry
             priority = self.config.provider_priority
-            self._provider_registry = ProviderRegistry(priority=priority)
+            stats_path = (
+                self.config.provider_stats_file
+                or str(self.results_path / "provider_stats.json")
+            )
+            self._provider_registry = ProviderRegistry(
+                priority=priority,
+                stats_path=stats_path,
+                breaker_threshold=self.config.breaker_failure_threshold,
+                breaker_reset_seconds=self.config.breaker_reset_seconds,
+            )
         return self._provider_registry
     
     def _get_runtime(self):
@@ -332,9 +467,9 @@ class QuantumHeartbeat:
                 logger.info(f"Using backend: {self._backend.name}")
         return self._runtime, self._backend
     
-    def _create_heartbeat_circuit(self):
+    def _heartbeat_template(self):
         """
-        Create the optimized heartbeat circuit.
+        The heartbeat circuit with one Parameter per Rz, built once.
         
         This circuit is designed to:
         1. Create full superposition (awareness potential)
@@ -342,10 +477,14 @@ class QuantumHeartbeat:
         3. Apply phase pattern (tachyonic signature)
         4. Measure all qubits
         """
+        if self._template is not None:
+            return self._template
         from qiskit import QuantumCircuit
+        from qiskit.circuit import ParameterVector
         
         n = self.config.num_qubits
-        qc = QuantumCircuit(n, name=f"heartbeat_{self.beat_count}")
+        phases = ParameterVector("phase", n)
+        qc = QuantumCircuit(n, name="heartbeat")
         
         # Layer 1: Full superposition
         # Opens all qubits to probability space
@@ -359,12 +498,9 @@ class QuantumHeartbeat:
         qc.barrier()
         
         # Layer 3: Phase encoding
-        # Embeds unique signature per beat
-        import math
+        # Embeds unique signature per beat (see heartbeat_phases)
         for i in range(n):
-            # Phase based on qubit index and beat number
-            phase = (i + 1) * (self.beat_count + 1) * 0.1 % (2 * math.pi)
-            qc.rz(phase, i)
+            qc.rz(phases[i], i)
         qc.barrier()
         
         # Layer 4: Interference
@@ -374,6 +510,27 @@ class QuantumHeartbeat:
         # Measure all
         qc.measure_all()
         
+        self._template, self._phase_params = qc, phases
+        return qc
+    
+    def _phase_values(self, first_number: int, count: int) -> np.ndarray:
+        """(count, num_qubits) phases of beats first_number … +count-1."""
+        return np.stack([
+            heartbeat_phases(self.config.num_qubits, first_number + k)
+            for k in range(count)
+        ])
+    
+    def _create_heartbeat_circuit(self, beat_number: Optional[int] = None):
+        """
+        Bind the heartbeat template to the phases of `beat_number`
+        (default: the next beat, self.beat_count).
+        """
+        template = self._heartbeat_template()
+        beat = self.beat_count if beat_number is None else beat_number
+        qc = template.assign_parameters(
+            {self._phase_params: heartbeat_phases(self.config.num_qubits, beat)}
+        )
+        qc.name = f"heartbeat_{beat}"
         return qc
     
     def _calculate_metrics(self, counts: Dict[str, int]) -> Dict[str, Any]:
@@ -427,7 +584,21 @@ class QuantumHeartbeat:
         use_provider_registry=True (default). Falls back to legacy
         IBM-only path otherwise.
         
-        Returns the result, or None if budget exhausted or error.
+        Returns the result, or None if budget exhausted or error. The
+        result is written in the background; call flush() to wait for it.
+        """
+        result = self._execute_beat(self.beat_count)
+        if result is not None:
+            self._persist(result)
+            self._complete_beat(result)
+        return result
+    
+    def _execute_beat(self, beat_number: int) -> Optional[HeartbeatResult]:
+        """
+        Build, run and measure beat `beat_number` without recording it.
+        
+        Safe to call from worker threads; returns None if the budget is
+        exhausted, in dry-run mode, or on error.
         """
         # Check budget
         if self.budget_used >= self.config.max_monthly_seconds:
@@ -435,7 +606,7 @@ class QuantumHeartbeat:
             return None
         
         beats_left = self.config.beats_remaining(self.budget_used)
-        logger.info(f"Heartbeat #{self.beat_count + 1} starting "
+        logger.info(f"Heartbeat #{beat_number + 1} starting "
                    f"({beats_left} beats remaining in budget)")
         
         if self.config.dry_run:
@@ -444,7 +615,7 @@ class QuantumHeartbeat:
         
         try:
             # Create circuit
-            circuit = self._create_heartbeat_circuit()
+            circuit = self._create_heartbeat_circuit(beat_number)
             logger.info(f"Circuit created: {circuit.num_qubits} qubits, "
                        f"depth {circuit.depth()}")
             
@@ -464,53 +635,47 @@ class QuantumHeartbeat:
                     shots=self.config.shots,
                     preferred_provider=preferred,
                     preferred_backend=backend,
+                    policy=self.config.routing_policy,
+                    budget_remaining=(
+                        self.config.max_monthly_seconds - self.budget_used
+                    ),
+                    hedge_percentile=self.config.hedge_percentile,
+                    race_deadline=self.config.race_deadline_seconds,
+                    on_extra_cost=self._charge_extra_cost,
                 )
                 
                 counts = cr.counts
                 job_id = cr.job_id
                 backend_name = cr.backend_name
                 execution_time = cr.execution_time
-                
-                # Determine source classification
-                if cr.is_real_hardware:
-                    source, family, processor = classify_backend(backend_name)
-                    if source == "simulation":
-                        # Provider says real but we don't recognize it — trust provider
-                        source = "real"
-                        family = cr.provider_name
-                        processor = ""
-                else:
-                    source = "simulation"
-                    family = "simulator"
-                    processor = ""
+                source, family, processor = self._classify_circuit_result(cr)
             
             # ── Legacy simulator path ──
             elif self.config.use_simulator:
-                from qiskit.primitives import StatevectorSampler
-                sampler = StatevectorSampler()
-                start_time = time.time()
-                job = sampler.run([circuit], shots=self.config.shots)
-                result = job.result()
-                data_pub = result[0].data
-                meas_data = getattr(data_pub, "meas", None) or next(iter(vars(data_pub).values()))
-                counts = meas_data.get_counts()  # type: ignore[union-attr]
+                # Small circuits run on StatevectorSampler; wide heartbeats
+                # use the closed-form product-state sampler
+                from aios_quantum.simulation import simulate
+                outcome = simulate(circuit, shots=self.config.shots)
+                counts = outcome.counts
                 job_id = "simulator"
-                backend_name = "statevector_sampler"
-                execution_time = time.time() - start_time
+                backend_name = outcome.plan.backend_name
+                execution_time = outcome.execution_time
                 source, family, processor = classify_backend(backend_name)
             
             # ── Legacy IBM-only path ──
             else:
                 _, backend_obj = self._get_runtime()
-                from qiskit_ibm_runtime import SamplerV2
-                from qiskit import transpile
                 from qiskit.providers import BackendV2
+                from qiskit_ibm_runtime import SamplerV2
+
+                from aios_quantum.circuits.transpile_cache import cached_transpile
                 
                 if not isinstance(backend_obj, BackendV2):
                     raise RuntimeError(f"Legacy IBM path requires a BackendV2 instance, got {type(backend_obj)}")
                 
-                transpiled = transpile(
-                    circuit, 
+                # Beats differ only in Rz angles: reuse the transpiled template
+                transpiled = cached_transpile(
+                    circuit,
                     backend_obj,
                     optimization_level=self.config.optimization_level
                 )
@@ -526,62 +691,345 @@ class QuantumHeartbeat:
                 execution_time = time.time() - start_time
                 source, family, processor = classify_backend(backend_name)
             
-            self.budget_used += execution_time
-            
-            # Calculate metrics
-            metrics = self._calculate_metrics(counts)
-            
-            # Create result object
-            now_utc = datetime.now(timezone.utc)
-            result = HeartbeatResult(
-                beat_number=self.beat_count,
-                timestamp_utc=now_utc.isoformat(),
-                timestamp_local=datetime.now().isoformat(),
-                backend_name=backend_name,
-                job_id=job_id,
-                execution_time_seconds=execution_time,
-                source=source,
-                backend_family=family,
-                backend_processor=processor,
-                num_qubits=self.config.num_qubits,
-                circuit_depth=circuit.depth(),
-                shots=self.config.shots,
-                counts=counts,
-                coherence_estimate=metrics["coherence"],
-                entropy=metrics["entropy"],
-                top_states=metrics["top_states"],
-                budget_used_total=self.budget_used,
-                budget_remaining=(
-                    self.config.max_monthly_seconds - self.budget_used
-                )
+            return self._build_result(
+                beat_number, circuit, counts, job_id, backend_name,
+                execution_time, source, family, processor,
             )
             
-            # Save result
-            self._save_result(result)
+        except Exception as e:
+            logger.error(f"Heartbeat failed: {e}")
+            return None
+    
+    def run_batch(self, count: int) -> list[HeartbeatResult]:
+        """
+        Execute the next `count` beats as one parameter-sweep submission.
+        
+        Each beat keeps its own number, phases, counts and result file;
+        only the job is shared. Returns the results (empty if the budget
+        is exhausted, in dry-run mode, or on error).
+        """
+        results = self._execute_batch(self.beat_count, count)
+        if results:
+            self._persist(results)
+        for result in results:
+            self._complete_beat(result)
+        return results
+    
+    def _execute_batch(
+        self, first_number: int, count: int
+    ) -> list[HeartbeatResult]:
+        """
+        Run beats first_number … first_number+count-1 as a single PUB.
+        
+        The template is submitted once with a (count, num_qubits) phase
+        sweep; execution time is split evenly across the beats. The
+        batch is cut to the beats the remaining budget can pay for.
+        """
+        if count > 1:
+            count = min(
+                count,
+                self.config.max_batch_beats,
+                self.config.beats_remaining(self.budget_used),
+            )
+            if count <= 0:
+                logger.warning("Monthly budget exhausted!")
+                return []
+        if count <= 1:
+            result = self._execute_beat(first_number)
+            return [result] if result is not None else []
+        
+        logger.info(f"Heartbeats #{first_number + 1}-#{first_number + count} "
+                   f"starting as one batch")
+        if self.config.dry_run:
+            logger.info("[DRY RUN] Would execute batch here")
+            return []
+        
+        try:
+            template = self._heartbeat_template()
+            values = self._phase_values(first_number, count)
             
-            self.beat_count += 1
-            self.results.append(result)
+            # ── Multi-provider path (default) ──
+            if self.config.use_provider_registry and not self.config.use_simulator:
+                registry = self._get_provider_registry()
+                backend = self.config.preferred_backend or None
+                if self.config.backend_rotation:
+                    backend = self._get_next_backend_name() or backend
+                
+                circuit_results = registry.run_heartbeat_batch(
+                    template,
+                    values,
+                    shots=self.config.shots,
+                    preferred_provider=self.config.preferred_provider or None,
+                    preferred_backend=backend,
+                    policy=self.config.routing_policy,
+                    budget_remaining=(
+                        self.config.max_monthly_seconds - self.budget_used
+                    ),
+                )
+                runs = [
+                    (cr.counts, cr.job_id, cr.backend_name, cr.execution_time,
+                     *self._classify_circuit_result(cr))
+                    for cr in circuit_results
+                ]
             
-            logger.info(f"Heartbeat complete: {execution_time:.2f}s, "
-                       f"coherence={metrics['coherence']:.4f}, "
-                       f"entropy={metrics['entropy']:.4f}")
+            # ── Legacy simulator path ──
+            elif self.config.use_simulator:
+                from aios_quantum.providers import SimulatorProvider
+                circuit_results = SimulatorProvider().run_circuit_batch(
+                    template, values, shots=self.config.shots
+                )
+                runs = [
+                    (cr.counts, cr.job_id, cr.backend_name, cr.execution_time,
+                     *classify_backend(cr.backend_name))
+                    for cr in circuit_results
+                ]
             
-            return result
+            # ── Legacy IBM-only path ──
+            else:
+                _, backend_obj = self._get_runtime()
+                from qiskit_ibm_runtime import SamplerV2
+
+                from aios_quantum.circuits.transpile_cache import cached_transpile
+                
+                # Transpile the symbolic template once, sweep the phases
+                transpiled = cached_transpile(
+                    template,
+                    backend_obj,
+                    optimization_level=self.config.optimization_level
+                )
+                start_time = time.time()
+                job = SamplerV2(backend_obj).run(
+                    [(transpiled, values)], shots=self.config.shots
+                )
+                meas_data = job.result()[0].data.meas
+                execution_time = (time.time() - start_time) / count
+                backend_name = getattr(backend_obj, "name", str(backend_obj))
+                classification = classify_backend(backend_name)
+                runs = [
+                    (meas_data.get_counts(loc=k), job.job_id(), backend_name,
+                     execution_time, *classification)
+                    for k in range(count)
+                ]
             
+            return [
+                self._build_result(first_number + k, template, *run)
+                for k, run in enumerate(runs)
+            ]
+        
         except Exception as e:
-            logger.error(f"Heartbeat failed: {e}")
-            return None
+            logger.error(f"Heartbeat batch failed: {e}")
+            return []
+    
+    def _charge_extra_cost(self, cr):
+        """Charge QPU time spent by a losing or abandoned attempt."""
+        with self._state_lock:
+            self.budget_used += cr.execution_time
+        logger.info(f"Charged {cr.execution_time:.2f}s from an unused attempt "
+                   f"on {cr.backend_name} to the budget")
+    
+    @staticmethod
+    def _classify_circuit_result(cr) -> tuple[str, str, str]:
+        """Source classification for a provider CircuitResult."""
+        if not cr.is_real_hardware:
+            return "simulation", "simulator", ""
+        source, family, processor = classify_backend(cr.backend_name)
+        if source == "simulation":
+            # Provider says real but we don't recognize it — trust provider
+            return "real", cr.provider_name, ""
+        return source, family, processor
+    
+    def _build_result(
+        self,
+        beat_number: int,
+        circuit,
+        counts: Dict[str, int],
+        job_id: str,
+        backend_name: str,
+        execution_time: float,
+        source: str,
+        family: str,
+        processor: str,
+        group_id: str = "",
+    ) -> HeartbeatResult:
+        """Charge the budget, compute metrics and package one result."""
+        with self._state_lock:
+            self.budget_used += execution_time
+            budget_used = self.budget_used
+        
+        # Calculate metrics
+        metrics = self._calculate_metrics(counts)
+        
+        # Create result object
+        now_utc = datetime.now(timezone.utc)
+        result = HeartbeatResult(
+            beat_number=beat_number,
+            timestamp_utc=now_utc.isoformat(),
+            timestamp_local=datetime.now().isoformat(),
+            backend_name=backend_name,
+            job_id=job_id,
+            execution_time_seconds=execution_time,
+            source=source,
+            backend_family=family,
+            backend_processor=processor,
+            group_id=group_id,
+            num_qubits=self.config.num_qubits,
+            circuit_depth=circuit.depth(),
+            shots=self.config.shots,
+            counts=counts,
+            coherence_estimate=metrics["coherence"],
+            entropy=metrics["entropy"],
+            top_states=metrics["top_states"],
+            budget_used_total=budget_used,
+            budget_remaining=(
+                self.config.max_monthly_seconds - budget_used
+            )
+        )
+        
+        logger.info(f"Heartbeat complete on {backend_name}: "
+                   f"{execution_time:.2f}s, "
+                   f"coherence={metrics['coherence']:.4f}, "
+                   f"entropy={metrics['entropy']:.4f}")
+        
+        return result
+    
+    def scatter_beat(
+        self,
+        targets: Optional[list] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[HeartbeatGroup]:
+        """
+        Execute one beat on several providers/backends concurrently.
+        
+        Args:
+            targets: "provider" or "provider:backend" strings
+                     (default: config.scatter_targets)
+            timeout: Seconds each target may take
+                     (default: config.scatter_timeout_seconds)
+        
+        Returns the beat group (partial if some targets failed or timed
+        out), or None if the budget is exhausted, in dry-run mode, or
+        no target succeeded.
+        """
+        group = self._execute_scatter(self.beat_count, targets, timeout)
+        if group is not None:
+            self._persist(group)
+            for result in group.results:
+                self._complete_beat(result)
+        return group
     
-    def _save_result(self, result: HeartbeatResult):
-        """Save heartbeat result to disk."""
-        timestamp_date = result.timestamp_utc[:10]
-        filename = f"beat_{result.beat_number:06d}_{timestamp_date}.json"
-        filepath = self.results_path / filename
+    def _execute_scatter(
+        self,
+        beat_number: int,
+        targets: Optional[list] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[HeartbeatGroup]:
+        """Run beat `beat_number` on every target without recording it."""
+        targets = list(dict.fromkeys(targets or self.config.scatter_targets or []))
+        if not targets:
+            raise ValueError("scatter mode needs at least one target")
+        if timeout is None:
+            timeout = self.config.scatter_timeout_seconds
+        
+        if self.budget_used >= self.config.max_monthly_seconds:
+            logger.warning("Monthly budget exhausted!")
+            return None
+        logger.info(f"Scatter heartbeat #{beat_number + 1} → {targets}")
+        if self.config.dry_run:
+            logger.info("[DRY RUN] Would scatter circuit here")
+            return None
+        
+        circuit = self._create_heartbeat_circuit(beat_number)
+        registry = self._get_provider_registry()
+        now_utc = datetime.now(timezone.utc)
+        group = HeartbeatGroup(
+            group_id=now_utc.strftime(f"beat_{beat_number:06d}_%Y%m%d_%H%M%S"),
+            beat_number=beat_number,
+            timestamp_utc=now_utc.isoformat(),
+            targets=targets,
+        )
+        
+        # All targets start together, so one deadline is a per-target
+        # timeout; stragglers are abandoned, not waited for
+        start_time = time.time()
+        pool = ThreadPoolExecutor(
+            max_workers=len(targets), thread_name_prefix="heartbeat-scatter"
+        )
+        futures = {
+            target: pool.submit(self._run_scatter_target, registry, target, circuit)
+            for target in targets
+        }
+        wait(futures.values(), timeout=timeout)
+        pool.shutdown(wait=False, cancel_futures=True)
+        group.wall_time_seconds = time.time() - start_time
         
-        with open(filepath, 'w') as f:
-            json.dump(result.to_dict(), f, indent=2)
+        for target, future in futures.items():
+            if not future.done():
+                group.failures[target] = f"timed out after {timeout}s"
+                # The job still runs to completion on the QPU
+                future.add_done_callback(self._charge_abandoned_target)
+                continue
+            try:
+                cr = future.result()
+            except Exception as e:
+                group.failures[target] = str(e)
+                continue
+            group.results.append(self._build_result(
+                beat_number, circuit, cr.counts, cr.job_id, cr.backend_name,
+                cr.execution_time, *self._classify_circuit_result(cr),
+                group_id=group.group_id,
+            ))
         
-        logger.info(f"Result saved: {filepath}")
+        for target, error in group.failures.items():
+            logger.warning(f"Scatter target {target} failed: {error}")
+        logger.info(f"Scatter beat complete: {len(group.results)}/{len(targets)} "
+                   f"targets in {group.wall_time_seconds:.2f}s")
+        return group if group.results else None
+    
+    def _charge_abandoned_target(self, future):
+        """Done-callback charging a timed-out scatter target's hardware time."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        cr = future.result()
+        if cr.is_real_hardware:
+            self._charge_extra_cost(cr)
+    
+    def _run_scatter_target(self, registry, target: str, circuit):
+        """Run the circuit on exactly one target (no failover)."""
+        provider_name, backend = parse_scatter_target(target)
+        provider = registry.get_provider(provider_name)
+        if provider is None:
+            raise ValueError(f"unknown provider '{provider_name}'")
+        return registry.run_on_provider(
+            provider,
+            circuit,
+            shots=self.config.shots,
+            backend_name=backend,
+            optimization_level=self.config.optimization_level,
+        )
+    
+    def _complete_beat(self, result: HeartbeatResult):
+        """Record a finished beat in memory."""
+        self.beat_count = max(self.beat_count, result.beat_number + 1)
+        self.results.append(result)
+    
+    def _persist(self, outcome):
+        """
+        Queue a result, batch or group for the background writer.
+        
+        Returns a Future resolving to the written paths (one per result).
+        Group manifests go to a groups/ subdirectory so readers of the
+        beat files (entropy extractor, quality corpus) never see them.
+        """
+        if isinstance(outcome, HeartbeatGroup):
+            return self._writer.submit(
+                [r.to_dict() for r in outcome.results], manifest=outcome.to_dict()
+            )
+        results = outcome if isinstance(outcome, list) else [outcome]
+        return self._writer.submit([r.to_dict() for r in results])
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued result is on disk (False on timeout)."""
+        return self._writer.flush(timeout)
     
     def start(self, max_beats: Optional[int] = None):
         """
@@ -606,7 +1054,10 @@ class QuantumHeartbeat:
         try:
             while self.running:
                 # Execute beat
-                result = self.single_beat()
+                if self.config.scatter_targets:
+                    self.scatter_beat()
+                else:
+                    self.single_beat()
                 
                 # Check stopping conditions
                 if max_beats and self.beat_count >= max_beats:
@@ -626,11 +1077,161 @@ class QuantumHeartbeat:
             logger.info("Heartbeat stopped by user")
         
         self.running = False
+        self.flush()
         logger.info(f"Heartbeat ended. Total beats: {self.beat_count}")
     
+    async def run_async(
+        self,
+        max_beats: Optional[int] = None,
+        on_result: Iterable[Callable[[HeartbeatResult, Path], Any]] = (),
+    ):
+        """
+        Run the heartbeat on a fixed-rate asyncio clock.
+        
+        Beat k fires at start + k * interval_seconds regardless of how
+        long earlier beats took; ticks that pass while
+        `max_concurrent_beats` beats are still in flight are skipped,
+        not bunched up. Each beat (or scatter group, when
+        scatter_targets is set) executes in a worker thread, and its
+        save plus every `on_result(result, path)` callback (plain or
+        async, e.g. a cloud upload) runs in the background while the
+        next beat proceeds.
+        
+        With catch_up_missed_beats, skipped ticks are not lost: the next
+        beat that fires also runs them, as one batched submission (up to
+        max_batch_beats beats).
+        
+        stop() ends the loop at once; in-flight beats and pending saves
+        are awaited before returning.
+        
+        Args:
+            max_beats: Stop after this many beats (None = run forever)
+            on_result: Callbacks invoked after each result is saved
+        """
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self.running = True
+        interval = self.config.interval_seconds
+        callbacks = list(on_result)
+        in_flight: Dict[asyncio.Task, Tuple[int, int]] = {}
+        background: set = set()
+        completed = 0
+        missed = 0
+        catch_up = (
+            self.config.catch_up_missed_beats and not self.config.scatter_targets
+        )
+        
+        async def beat(number: int, count: int = 1):
+            nonlocal completed
+            if self.config.scatter_targets:
+                outcome = await asyncio.to_thread(self._execute_scatter, number)
+            elif count > 1:
+                outcome = await asyncio.to_thread(self._execute_batch, number, count)
+            else:
+                outcome = await asyncio.to_thread(self._execute_beat, number)
+            if not outcome:
+                return
+            if isinstance(outcome, HeartbeatGroup):
+                results = outcome.results
+                completed += 1
+            else:
+                results = outcome if isinstance(outcome, list) else [outcome]
+                completed += len(results)
+            for result in results:
+                self._complete_beat(result)
+            writer = asyncio.create_task(self._persist_async(outcome, callbacks))
+            background.add(writer)
+            writer.add_done_callback(background.discard)
+        
+        logger.info(f"Async heartbeat starting: every {interval}s, "
+                   f"max beats {max_beats or 'unlimited'}")
+        next_fire = loop.time()
+        try:
+            while self.running:
+                if self.budget_used >= self.config.max_monthly_seconds:
+                    logger.info("Budget exhausted")
+                    break
+                if max_beats and completed >= max_beats:
+                    logger.info(f"Reached max beats ({max_beats})")
+                    break
+                
+                in_flight_beats = sum(c for _, c in in_flight.values())
+                if max_beats and completed + in_flight_beats >= max_beats:
+                    # Enough beats in flight; wait for one to land
+                    await asyncio.wait(
+                        list(in_flight), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    continue
+                
+                if len(in_flight) < self.config.max_concurrent_beats:
+                    number = max([self.beat_count] + [n + c for n, c in in_flight.values()])
+                    count = 1
+                    if catch_up:
+                        count = min(1 + missed, self.config.max_batch_beats)
+                        if max_beats:
+                            pending = sum(c for _, c in in_flight.values())
+                            count = min(count, max_beats - completed - pending)
+                        missed = 0
+                    task = asyncio.create_task(beat(number, count))
+                    in_flight[task] = (number, count)
+                    task.add_done_callback(lambda t: in_flight.pop(t, None))
+                else:
+                    logger.warning("Previous beat still running; skipping tick")
+                    missed += 1
+                
+                # Fixed-rate clock: skip ticks already in the past
+                next_fire += interval
+                behind = loop.time() - next_fire
+                if behind > 0:
+                    skipped = int(behind // interval) + 1
+                    action = "catching up" if catch_up else "skipping"
+                    logger.warning(
+                        f"Heartbeat behind schedule; {action} {skipped} tick(s)"
+                    )
+                    next_fire += skipped * interval
+                    missed += skipped
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=next_fire - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.running = False
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            if background:
+                await asyncio.gather(*background, return_exceptions=True)
+            self._wakeup = None
+            self._loop = None
+            logger.info(f"Async heartbeat ended. Total beats: {self.beat_count}")
+    
+    async def _persist_async(self, outcome, callbacks: list):
+        """Wait for a result, batch or group to be written, then run callbacks."""
+        try:
+            if isinstance(outcome, HeartbeatGroup):
+                results = outcome.results
+            else:
+                results = outcome if isinstance(outcome, list) else [outcome]
+            paths = await asyncio.wrap_future(self._persist(outcome))
+            for result, path in zip(results, paths):
+                for callback in callbacks:
+                    awaitable = callback(result, path)
+                    if inspect.isawaitable(awaitable):
+                        await awaitable
+        except Exception as e:
+            logger.error(f"Persisting beat {results[0].beat_number} failed: {e}")
+    
     def stop(self):
-        """Stop the heartbeat scheduler."""
+        """Stop the heartbeat scheduler (sync or async; thread-safe)."""
         self.running = False
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # loop already closed
 
 
 # Convenience function for quick testing
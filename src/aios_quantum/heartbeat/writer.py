@@ -0,0 +1,250 @@
+"""
+Heartbeat Result Writer
+
+Persistence runs on its own thread so a beat never waits on disk:
+
+    beat loop ── submit(records) ──► queue ──► writer thread
+                                     ├── log/beats_<date>.jsonl  (append-only)
+                                     ├── beat_*.json             (optional)
+                                     └── groups/<group_id>.json  (manifests)
+
+The writer drains whatever has queued up as one batch: every record of
+the batch is appended to the day's log in a single write, and the fsync
+policy decides when that write is forced to stable storage:
+
+    always    fsync after every record
+    batch     one fsync per batch, before its futures resolve
+    interval  at most one fsync per fsync_interval seconds
+    never     leave it to the OS page cache
+
+Per-beat JSON files are still written by default (compact, replaced
+atomically) because the entropy extractor and the surface scripts read
+them; `write_beat_files=False` keeps only the log.
+
+`submit` returns a Future resolving to the written paths, so callers
+that must see the data on disk (e.g. upload callbacks) can wait for it
+while the beat loop moves on. The thread exits after `idle_seconds`
+without work and is restarted by the next submit.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("always", "batch", "interval", "never")
+
+# Largest number of submissions folded into one log write
+MAX_BATCH = 256
+
+# Seconds an idle writer thread lingers before exiting
+IDLE_SECONDS = 30.0
+
+LOG_DIR = "log"
+
+# Writers flushed at interpreter exit (their threads are daemons)
+_live_writers: "weakref.WeakSet[ResultWriter]" = weakref.WeakSet()
+
+
+def beat_filename(record: Dict[str, Any]) -> str:
+    """File name of a beat record: beat_<n>_<date>[_<backend>].json"""
+    name = f"beat_{record['beat_number']:06d}_{record['timestamp_utc'][:10]}"
+    if record.get("group_id"):
+        # One file per group member
+        name += f"_{record['backend_name']}"
+    return name + ".json"
+
+
+def read_result_log(path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a JSONL result log.
+
+    A torn final line (the process died mid-append) is skipped.
+    """
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping torn record in {path}")
+
+
+def _ends_mid_record(path: Path) -> bool:
+    """True if a log's last byte is not a newline (a torn append)."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except OSError:
+        return False  # missing or empty
+
+
+class ResultWriter:
+    """Background, batching writer for heartbeat records."""
+
+    def __init__(
+        self,
+        results_path,
+        fsync: str = "batch",
+        fsync_interval: float = 5.0,
+        write_beat_files: bool = True,
+        idle_seconds: float = IDLE_SECONDS,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"unknown fsync policy {fsync!r}; expected one of {FSYNC_POLICIES}"
+            )
+        self.results_path = Path(results_path)
+        self.log_path = self.results_path / LOG_DIR
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.write_beat_files = write_beat_files
+        self.idle_seconds = idle_seconds
+        self.records_written = 0
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._last_fsync = 0.0
+        _live_writers.add(self)
+
+    def submit(
+        self,
+        records: List[Dict[str, Any]],
+        manifest: Optional[Dict[str, Any]] = None,
+    ) -> "Future[List[Path]]":
+        """
+        Queue beat records (and an optional group manifest) for writing.
+
+        The future resolves to one path per record: its beat file, or
+        the day's log when beat files are disabled.
+        """
+        future: "Future[List[Path]]" = Future()
+        self._queue.put((records, manifest, future))
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="heartbeat-writer", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything submitted so far is written."""
+        marker = self.submit([])
+        try:
+            marker.result(timeout)
+        except FutureTimeout:
+            return False
+        return True
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.idle_seconds)]
+            except queue.Empty:
+                with self._lock:
+                    # submit() holds the lock while checking for a thread
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: list):
+        try:
+            paths = self._append_log([r for records, _, _ in batch for r in records])
+            outcomes = []
+            for records, manifest, _ in batch:
+                if self.write_beat_files:
+                    written = [self._write_json(
+                        self.results_path / beat_filename(r), r
+                    ) for r in records]
+                else:
+                    written = [paths[id(r)] for r in records]
+                if manifest is not None:
+                    name = f"{manifest['group_id']}.json"
+                    manifest_file = self.results_path / "groups" / name
+                    self._write_json(manifest_file, manifest)
+                    logger.info(f"Beat group saved: {manifest_file}")
+                outcomes.append(written)
+        except Exception as e:
+            logger.error(f"Writing {len(batch)} heartbeat submission(s) failed: {e}")
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, _, future), written in zip(batch, outcomes):
+            future.set_result(written)
+
+    def _append_log(self, records: List[Dict[str, Any]]) -> Dict[int, Path]:
+        """Append records to their day's log; returns id(record) → log path."""
+        by_day: Dict[str, list] = {}
+        for record in records:
+            by_day.setdefault(record["timestamp_utc"][:10], []).append(record)
+        paths = {}
+        if by_day:
+            self.log_path.mkdir(parents=True, exist_ok=True)
+        for day, day_records in by_day.items():
+            path = self.log_path / f"beats_{day}.jsonl"
+            lines = [
+                json.dumps(r, separators=(",", ":")) + "\n" for r in day_records
+            ]
+            if _ends_mid_record(path):
+                # Terminate a torn append so it cannot swallow this record
+                lines[0] = "\n" + lines[0]
+            with open(path, "a") as f:
+                if self.fsync == "always":
+                    for line in lines:
+                        f.write(line)
+                        f.flush()
+                        os.fsync(f.fileno())
+                else:
+                    f.write("".join(lines))
+                    f.flush()
+                    if self._fsync_due():
+                        os.fsync(f.fileno())
+            paths.update((id(r), path) for r in day_records)
+        self.records_written += len(records)
+        if records:
+            logger.info(f"Appended {len(records)} heartbeat record(s) to the log")
+        return paths
+
+    def _fsync_due(self) -> bool:
+        if self.fsync == "batch":
+            return True
+        if self.fsync == "interval":
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                self._last_fsync = now
+                return True
+        return False
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> Path:
+        """Write compact JSON atomically (readers never see half a file)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, path)
+        return path
+
+
+@atexit.register
+def _flush_live_writers():
+    for writer in list(_live_writers):
+        if writer._thread is not None:
+            writer.flush(timeout=10.0)
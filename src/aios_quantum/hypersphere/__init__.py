@@ -30,13 +30,14 @@ From this primitive, all complex structures emerge:
 The evolution continues.
 """
 
-from .manifold import HypersphereManifold, AsymptoticDescent
+from .manifold import HypersphereManifold, AsymptoticDescent, DescentBatch
 from .membrane import CubeMembrane, InformationFlux
 from .encoding import FractalEncoder, InverseExponentialMetric
 
 __all__ = [
     'HypersphereManifold',
     'AsymptoticDescent',
+    'DescentBatch',
     'CubeMembrane',
     'InformationFlux',
     'FractalEncoder',
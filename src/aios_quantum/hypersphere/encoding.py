@@ -33,11 +33,15 @@ ENCODING STRATEGIES:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Callable, Optional, Any, Iterator
+from typing import List, Tuple, Callable, Optional, Any, Iterator, Dict
 import math
 from enum import Enum
 
-from .manifold import HyperspherePoint, HypersphereManifold, AsymptoticDescent
+import numpy as np
+
+from .manifold import (
+    ArrayLike, HyperspherePoint, HypersphereManifold, AsymptoticDescent,
+)
 
 
 class EncodingDimension(Enum):
@@ -50,6 +54,30 @@ class EncodingDimension(Enum):
     PHASE = "phase"           # Sequence/timing
 
 
+@dataclass(frozen=True)
+class DepthTable:
+    """Precomputed metric quantities over a fixed depth grid.
+    
+    Arrays are read-only so a cached table can be shared safely
+    between callers.
+    """
+    depths: np.ndarray
+    information: np.ndarray
+    time_dilation: np.ndarray
+    wavelength_factor: np.ndarray   # Multiply by base wavelength
+    
+    def wavelength(self, base_wavelength: float) -> np.ndarray:
+        """Wavelengths at every grid depth for a base wavelength."""
+        return base_wavelength * self.wavelength_factor
+
+
+def _as_result(value: np.ndarray) -> ArrayLike:
+    """Return plain floats for scalar input, arrays otherwise."""
+    if np.ndim(value) == 0:
+        return float(value)
+    return value
+
+
 @dataclass
 class InverseExponentialMetric:
     """The metric that governs distances in hypersphere space.
@@ -66,12 +94,23 @@ class InverseExponentialMetric:
     
     Physical analog: The Schwarzschild metric near a black hole,
     but INVERTED. We have a white hole - information radiates OUT.
+    
+    Every method accepts scalars or NumPy arrays and broadcasts like
+    a ufunc: scalars in give floats out, arrays in give arrays out.
     """
     
+    # Bound on cached depth tables per metric
+    MAX_CACHED_TABLES = 32
+    
     def __init__(self, surface_cutoff: float = 1e-10):
         self.surface_cutoff = surface_cutoff  # Regularization
+        self._tables: Dict[Tuple[float, float, int, bool], DepthTable] = {}
     
-    def proper_distance(self, depth1: float, depth2: float) -> float:
+    def _clip(self, depth: ArrayLike) -> np.ndarray:
+        """Regularize depths at the surface cutoff."""
+        return np.maximum(np.asarray(depth, dtype=np.float64), self.surface_cutoff)
+    
+    def proper_distance(self, depth1: ArrayLike, depth2: ArrayLike) -> ArrayLike:
         """Proper distance between two depths.
         
         ∫(1/r)dr = ln(r₂/r₁)
@@ -79,11 +118,11 @@ class InverseExponentialMetric:
         This logarithmic distance means equal multiplicative steps
         cover equal proper distance. Scale invariance!
         """
-        d1 = max(depth1, self.surface_cutoff)
-        d2 = max(depth2, self.surface_cutoff)
-        return abs(math.log(d2 / d1))
+        d1 = self._clip(depth1)
+        d2 = self._clip(depth2)
+        return _as_result(np.abs(np.log(d2 / d1)))
     
-    def volume_element(self, depth: float) -> float:
+    def volume_element(self, depth: ArrayLike) -> ArrayLike:
         """Volume element at given depth.
         
         dV ∝ r² * (1/r²) dr = dr
@@ -92,15 +131,15 @@ class InverseExponentialMetric:
         for the radial contraction. The total volume is finite.
         But the INFORMATION CONTENT diverges because density ∝ 1/r².
         """
-        d = max(depth, self.surface_cutoff)
-        return 1.0  # Normalized
+        d = self._clip(depth)
+        return _as_result(np.ones_like(d))  # Normalized
     
-    def information_at_depth(self, depth: float) -> float:
+    def information_at_depth(self, depth: ArrayLike) -> ArrayLike:
         """Information density at given depth."""
-        d = max(depth, self.surface_cutoff)
-        return 1.0 / (d ** 2)
+        d = self._clip(depth)
+        return _as_result(1.0 / (d ** 2))
     
-    def time_dilation(self, depth: float) -> float:
+    def time_dilation(self, depth: ArrayLike) -> ArrayLike:
         """Time dilation factor at given depth.
         
         Near surface: time runs slow (much happens in little "real" time)
@@ -109,10 +148,14 @@ class InverseExponentialMetric:
         This is why consciousness feels timeless near insight (surface)
         and time flies when mind wanders (deep).
         """
-        d = max(depth, self.surface_cutoff)
-        return d  # Deeper = faster time, surface = frozen
+        d = self._clip(depth)
+        return _as_result(d)  # Deeper = faster time, surface = frozen
     
-    def wavelength_at_depth(self, base_wavelength: float, depth: float) -> float:
+    def wavelength_at_depth(
+        self,
+        base_wavelength: ArrayLike,
+        depth: ArrayLike
+    ) -> ArrayLike:
         """Wavelength of information oscillation at given depth.
         
         Near surface: short wavelength (high frequency, high energy)
@@ -120,9 +163,49 @@ class InverseExponentialMetric:
         
         This is the "redshift" of potential becoming actual.
         """
-        d = max(depth, self.surface_cutoff)
+        d = self._clip(depth)
         # Wavelength stretches as we go deeper (redshift)
-        return base_wavelength * (d / self.surface_cutoff) ** 0.5
+        return _as_result(
+            np.asarray(base_wavelength) * np.sqrt(d / self.surface_cutoff)
+        )
+    
+    def depth_table(
+        self,
+        start: float,
+        stop: float,
+        num: int,
+        log_spaced: bool = True
+    ) -> DepthTable:
+        """Cached metric lookup table for a repeated depth grid.
+        
+        The grid is np.geomspace(start, stop, num) when log_spaced
+        (the natural spacing for this scale-invariant metric), else
+        np.linspace. Tables are cached per metric instance.
+        """
+        key = (float(start), float(stop), int(num), bool(log_spaced))
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+        
+        if log_spaced:
+            depths = np.geomspace(start, stop, num)
+        else:
+            depths = np.linspace(start, stop, num)
+        d = self._clip(depths)
+        table = DepthTable(
+            depths=depths,
+            information=1.0 / (d ** 2),
+            time_dilation=d,
+            wavelength_factor=np.sqrt(d / self.surface_cutoff),
+        )
+        for arr in (table.depths, table.information,
+                    table.time_dilation, table.wavelength_factor):
+            arr.flags.writeable = False
+        
+        if len(self._tables) >= self.MAX_CACHED_TABLES:
+            self._tables.pop(next(iter(self._tables)))
+        self._tables[key] = table
+        return table
 
 
 @dataclass
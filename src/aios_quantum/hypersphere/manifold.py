@@ -31,10 +31,14 @@ New Physics Hypothesis (AI-assisted):
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Callable, List, Tuple
+from typing import Optional, Callable, Iterator, List, Tuple, Union
 import math
 from enum import Enum
 
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
 
 class DescentPhase(Enum):
     """Phases of the asymptotic descent toward the hypersphere surface."""
@@ -171,6 +175,186 @@ class AsymptoticDescent:
         return -math.log(target_depth / self.initial_depth) / self.decay_rate
 
 
+class DescentBatch:
+    """Many asymptotic descents advanced together as arrays.
+    
+    Each descent i follows the same metric as AsymptoticDescent:
+        d_i(t) = d₀_i * e^(-λ_i t)
+    
+    Because the metric is closed-form, advancing the batch never
+    iterates: a step of any size is a single array addition on the
+    time vector, and jumps to a target time or depth are exact.
+    
+    Angles (theta, phi, psi) label where on the hypersphere each
+    descent falls. All per-descent inputs broadcast to a common shape,
+    so a scalar initial depth can be paired with a full angular grid.
+    """
+    
+    def __init__(
+        self,
+        theta: ArrayLike,
+        phi: ArrayLike,
+        psi: ArrayLike = 0.0,
+        initial_depth: ArrayLike = 1000.0,
+        decay_rate: ArrayLike = 0.1,
+        current_time: ArrayLike = 0.0,
+    ):
+        arrays = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.float64) for a in (
+                theta, phi, psi, initial_depth, decay_rate, current_time
+            ))
+        )
+        # Flatten to 1D; shape is kept so results can be reshaped
+        self.shape = arrays[0].shape
+        (self.theta, self.phi, self.psi, self.initial_depth,
+         self.decay_rate, self.current_time) = (
+            a.ravel().copy() for a in arrays
+        )
+        if np.any(self.initial_depth <= 0):
+            raise ValueError("initial_depth must be positive")
+        if np.any(self.decay_rate <= 0):
+            raise ValueError("decay_rate must be positive")
+    
+    def __len__(self) -> int:
+        return self.current_time.size
+    
+    @classmethod
+    def from_descents(cls, descents: List[AsymptoticDescent]) -> 'DescentBatch':
+        """Build a batch from individual descents (angles default to 0)."""
+        return cls(
+            theta=np.zeros(len(descents)),
+            phi=np.zeros(len(descents)),
+            initial_depth=[d.initial_depth for d in descents],
+            decay_rate=[d.decay_rate for d in descents],
+            current_time=[d.current_time for d in descents],
+        )
+    
+    def descent(self, index: int) -> AsymptoticDescent:
+        """Materialize a single descent as an AsymptoticDescent."""
+        return AsymptoticDescent(
+            initial_depth=float(self.initial_depth[index]),
+            decay_rate=float(self.decay_rate[index]),
+            current_time=float(self.current_time[index]),
+        )
+    
+    @property
+    def current_depth(self) -> np.ndarray:
+        """Current depth of every descent."""
+        return self.depth_at(self.current_time)
+    
+    @property
+    def velocity(self) -> np.ndarray:
+        """Rate of descent of every descent."""
+        return -self.decay_rate * self.current_depth
+    
+    @property
+    def information_accumulated(self) -> np.ndarray:
+        """Information accumulated by every descent so far."""
+        return self.information_at(self.current_time)
+    
+    def depth_at(self, times: np.ndarray) -> np.ndarray:
+        """Depth of each descent at the given times.
+        
+        `times` may be shape (n,) or the batch shape for one time per
+        descent, or (n, k) / batch shape + (k,) for k sample times per
+        descent.
+        """
+        d0, lam = self._per_descent(times)
+        return d0 * np.exp(-lam * times)
+    
+    def information_at(self, times: np.ndarray) -> np.ndarray:
+        """Information accumulated by each descent up to the given times.
+        
+        (1/d₀²) * (1/2λ) * (e^(2λt) - 1), using expm1 so small t
+        keeps full precision.
+        """
+        d0, lam = self._per_descent(times)
+        with np.errstate(over='ignore'):
+            return np.expm1(2 * lam * times) / (2 * lam * d0 ** 2)
+    
+    def _flat(self, values: ArrayLike) -> np.ndarray:
+        """Per-descent values: scalar, flat (n,), or shaped like the batch."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape == self.current_time.shape:
+            return values
+        return np.broadcast_to(values, self.shape).ravel()
+    
+    def step(self, dt: ArrayLike = 0.1) -> 'DescentBatch':
+        """Advance every descent by dt in place (scalar or per-descent)."""
+        self.current_time += self._flat(dt)
+        return self
+    
+    def jump_to_time(self, t: ArrayLike) -> 'DescentBatch':
+        """Set the time of every descent exactly (closed-form jump)."""
+        self.current_time[...] = self._flat(t)
+        return self
+    
+    def time_to_depth(self, target_depth: ArrayLike) -> np.ndarray:
+        """Time each descent needs to reach target_depth (from t = 0).
+        
+        Matches AsymptoticDescent.time_to_depth: infinite for a target
+        at or below the surface, zero for a target above the start.
+        """
+        target = np.broadcast_to(
+            np.asarray(target_depth, dtype=np.float64), self.initial_depth.shape
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = -np.log(target / self.initial_depth) / self.decay_rate
+        t = np.where(target >= self.initial_depth, 0.0, t)
+        return np.where(target <= 0, np.inf, t)
+    
+    def jump_to_depth(self, target_depth: ArrayLike) -> 'DescentBatch':
+        """Move every descent to the time it reaches target_depth."""
+        return self.jump_to_time(self.time_to_depth(target_depth))
+    
+    def information_curves(self, times: np.ndarray) -> np.ndarray:
+        """Information-accumulated curves sampled at shared times.
+        
+        Returns an array of shape (len(batch), len(times)) measured
+        from each descent's current time.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        absolute = self.current_time[:, None] + times[None, :]
+        return self.information_at(absolute)
+    
+    def iter_steps(
+        self,
+        dt: float = 0.1,
+        steps: int = 100
+    ) -> Iterator[Tuple[float, np.ndarray, np.ndarray]]:
+        """Yield (elapsed, depths, information) arrays for each step.
+        
+        Advances the batch in place; equivalent to calling step(dt)
+        `steps` times on every descent.
+        """
+        for k in range(1, steps + 1):
+            self.step(dt)
+            yield k * dt, self.current_depth, self.information_accumulated
+    
+    def _per_descent(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-descent parameters shaped to broadcast against `times`.
+        
+        `times` must be a scalar, one time per descent (flat (n,) or
+        shaped like the batch), or k times per descent ((n, k) or
+        batch shape + (k,)); any other shape raises ValueError.
+        """
+        shape = np.shape(times)
+        n = len(self)
+        d0, lam = self.initial_depth, self.decay_rate
+        if shape in ((), (n,)):
+            return d0, lam
+        if shape == self.shape:
+            return d0.reshape(self.shape), lam.reshape(self.shape)
+        if shape[:-1] == (n,):
+            return d0[:, None], lam[:, None]
+        if shape[:-1] == self.shape:
+            grid = self.shape + (1,)
+            return d0.reshape(grid), lam.reshape(grid)
+        raise ValueError(
+            f"times of shape {shape} do not match a batch of shape {self.shape}"
+        )
+
+
 class HypersphereManifold:
     """The complete hypersphere manifold with information encoding.
     
@@ -199,6 +383,9 @@ class HypersphereManifold:
         
         # Information storage: list of (point, data) tuples
         self._information: List[Tuple[HyperspherePoint, any]] = []
+        
+        # Cached fractal layer angles keyed by (resolution, detail_level)
+        self._layer_angles: dict = {}
     
     @property
     def total_information_capacity(self) -> float:
@@ -229,6 +416,50 @@ class HypersphereManifold:
         """Create a descent trajectory toward surface at given angles."""
         return AsymptoticDescent(initial_depth=self.max_depth)
     
+    def create_descent_batch(
+        self,
+        theta: ArrayLike,
+        phi: ArrayLike,
+        psi: ArrayLike = 0.0,
+        initial_depth: Optional[ArrayLike] = None,
+        decay_rate: ArrayLike = 0.1
+    ) -> DescentBatch:
+        """Create many descent trajectories at once.
+        
+        Inputs broadcast together; initial_depth defaults to max_depth
+        to match create_descent.
+        """
+        if initial_depth is None:
+            initial_depth = self.max_depth
+        return DescentBatch(
+            theta=theta,
+            phi=phi,
+            psi=psi,
+            initial_depth=initial_depth,
+            decay_rate=decay_rate,
+        )
+    
+    def angular_descent_grid(
+        self,
+        initial_depth: Optional[ArrayLike] = None,
+        decay_rate: ArrayLike = 0.1
+    ) -> DescentBatch:
+        """One descent per (theta, phi) cell of the angular grid.
+        
+        The grid has `resolution` steps in theta and resolution/2
+        in phi, sampled at cell centres.
+        """
+        n_theta = self.resolution
+        n_phi = max(1, self.resolution // 2)
+        theta = 2 * np.pi * (np.arange(n_theta) + 0.5) / n_theta
+        phi = np.pi * (np.arange(n_phi) + 0.5) / n_phi
+        theta_grid, phi_grid = np.meshgrid(theta, phi, indexing='ij')
+        return self.create_descent_batch(
+            theta_grid, phi_grid,
+            initial_depth=initial_depth,
+            decay_rate=decay_rate,
+        )
+    
     def surface_area_at_depth(self, depth: float) -> float:
         """Surface area of the 3-sphere at given depth from nominal surface.
         
@@ -239,21 +470,29 @@ class HypersphereManifold:
             return 0.0
         return 2 * (math.pi ** 2) * (r ** 3)
     
-    def information_density_at_depth(self, depth: float) -> float:
-        """Information density per unit 3-volume at given depth."""
+    def information_density_at_depth(self, depth: ArrayLike) -> ArrayLike:
+        """Information density per unit 3-volume at given depth.
+        
+        Accepts a scalar or an array of depths.
+        """
+        if np.ndim(depth) == 0:
+            return 1.0 / (depth ** 2 + self.min_depth ** 2)
+        depth = np.asarray(depth, dtype=np.float64)
         return 1.0 / (depth ** 2 + self.min_depth ** 2)
     
-    def generate_fractal_layer(
+    def fractal_layer_angles(
         self,
-        depth: float,
         detail_level: int = 3
-    ) -> List[HyperspherePoint]:
-        """Generate points at a given depth with fractal distribution.
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Angular (theta, phi, psi) table for a fractal layer.
         
-        Each layer contains self-similar structure to layers above/below.
-        This is how complexity emerges: mountains, seas, cells, minds...
+        The layout depends only on resolution and detail level, not on
+        depth, so it is computed once and cached as read-only arrays.
         """
-        points = []
+        key = (self.resolution, detail_level)
+        cached = self._layer_angles.get(key)
+        if cached is not None:
+            return cached
         
         # Base resolution scales with depth (deeper = more potential points)
         base_points = self.resolution * (detail_level + 1)
@@ -261,22 +500,48 @@ class HypersphereManifold:
         # Golden ratio for optimal sphere packing
         golden = (1 + math.sqrt(5)) / 2
         
-        for i in range(base_points):
-            # Fibonacci sphere distribution
-            theta = 2 * math.pi * i / golden
-            phi = math.acos(1 - 2 * (i + 0.5) / base_points)
-            
-            # Add 4th dimension variation
-            psi = math.pi * (i % detail_level) / detail_level
-            
-            points.append(HyperspherePoint(
-                depth=depth,
-                theta=theta,
-                phi=phi,
-                psi=psi
-            ))
+        i = np.arange(base_points)
+        # Fibonacci sphere distribution
+        theta = 2 * math.pi * i / golden
+        phi = np.arccos(1 - 2 * (i + 0.5) / base_points)
+        # Add 4th dimension variation
+        psi = math.pi * (i % detail_level) / detail_level
+        
+        for arr in (theta, phi, psi):
+            arr.flags.writeable = False
+        self._layer_angles[key] = (theta, phi, psi)
+        return theta, phi, psi
+    
+    def generate_fractal_layer(
+        self,
+        depth: float,
+        detail_level: int = 3
+    ) -> List[HyperspherePoint]:
+        """Generate points at a given depth with fractal distribution.
         
-        return points
+        Each layer contains self-similar structure to layers above/below.
+        This is how complexity emerges: mountains, seas, cells, minds...
+        """
+        theta, phi, psi = self.fractal_layer_angles(detail_level)
+        return [
+            HyperspherePoint(depth=depth, theta=t, phi=p, psi=q)
+            for t, p, q in zip(theta.tolist(), phi.tolist(), psi.tolist())
+        ]
+    
+    def fractal_layer_density(
+        self,
+        depths: ArrayLike,
+        detail_level: int = 3
+    ) -> np.ndarray:
+        """Information density of fractal layers at many depths.
+        
+        Returns shape (len(depths), points_per_layer) without building
+        HyperspherePoint objects; every point in a layer shares the
+        layer's density.
+        """
+        theta, _, _ = self.fractal_layer_angles(detail_level)
+        density = self.information_density_at_depth(np.atleast_1d(depths))
+        return np.broadcast_to(density[:, None], (density.size, theta.size))
 
 
 # The Prime Manifold - singleton instance representing "our" hypersphere
@@ -47,6 +47,10 @@ from typing import List, Tuple, Optional, Callable, Dict
 from enum import Enum
 import math
 
+import numpy as np
+
+from .manifold import ArrayLike
+
 
 class Face(Enum):
     """The six faces of the cube, each a membrane interface."""
@@ -177,30 +181,238 @@ class InformationFlux:
             )
 
 
+# Integer codes for FluxDirection inside face grids
+_DIRECTION_CODE = {
+    FluxDirection.INWARD: -1,
+    FluxDirection.STATIC: 0,
+    FluxDirection.OUTWARD: 1,
+}
+_CODE_DIRECTION = {code: d for d, code in _DIRECTION_CODE.items()}
+
+# Fluxes weaker than this are dropped from the membrane
+MIN_FLUX_MAGNITUDE = 0.01
+
+
+@dataclass
+class FaceGrid:
+    """Array storage for one membrane face.
+    
+    Every array has shape (resolution, resolution, layers): cell (i, j)
+    on the face surface, membrane layer k through the thickness.
+    A cell with zero magnitude is empty.
+    """
+    magnitude: np.ndarray
+    phase: np.ndarray
+    frequency: np.ndarray
+    direction: np.ndarray   # int8 codes, see _DIRECTION_CODE
+    
+    @classmethod
+    def empty(cls, resolution: int, layers: int) -> 'FaceGrid':
+        shape = (resolution, resolution, layers)
+        return cls(
+            magnitude=np.zeros(shape),
+            phase=np.zeros(shape),
+            frequency=np.zeros(shape),
+            direction=np.zeros(shape, dtype=np.int8),
+        )
+    
+    @property
+    def occupied(self) -> np.ndarray:
+        """Boolean mask of cells holding information."""
+        return self.magnitude > 0
+    
+    def clear(self, mask: np.ndarray) -> None:
+        """Empty the cells selected by mask."""
+        self.magnitude[mask] = 0.0
+        self.phase[mask] = 0.0
+        self.frequency[mask] = 0.0
+        self.direction[mask] = 0
+    
+    def merge(
+        self,
+        magnitude: np.ndarray,
+        phase: np.ndarray,
+        frequency: np.ndarray,
+        direction: np.ndarray
+    ) -> None:
+        """Interfere same-shaped incoming arrays with this grid."""
+        self.superpose(
+            magnitude * np.cos(phase),
+            magnitude * np.sin(phase),
+            magnitude,
+            magnitude * frequency,
+            magnitude * direction,
+        )
+    
+    def accumulate(
+        self,
+        cells: np.ndarray,
+        magnitude: np.ndarray,
+        phase: np.ndarray,
+        frequency: np.ndarray,
+        direction: np.ndarray
+    ) -> None:
+        """Bin many fluxes into cells and interfere them in one pass.
+        
+        `cells` holds flat indices into the grid arrays; any number of
+        fluxes may share a cell.
+        """
+        size = self.magnitude.size
+        shape = self.magnitude.shape
+        
+        def binned(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(cells, weights=weights, minlength=size).reshape(shape)
+        
+        self.superpose(
+            binned(magnitude * np.cos(phase)),
+            binned(magnitude * np.sin(phase)),
+            binned(magnitude),
+            binned(magnitude * frequency),
+            binned(magnitude * direction),
+        )
+    
+    def superpose(
+        self,
+        real: np.ndarray,
+        imag: np.ndarray,
+        weight: np.ndarray,
+        weighted_frequency: np.ndarray,
+        weighted_direction: np.ndarray
+    ) -> None:
+        """Add phasor contributions (magnitude·e^{iφ}) to every cell.
+        
+        Complex amplitudes sum, so co-located fluxes interfere as in
+        InformationFlux.interfere_with for equal frequencies. Frequency
+        and direction follow the magnitude-weighted contributions.
+        """
+        m = self.magnitude
+        real = real + m * np.cos(self.phase)
+        imag = imag + m * np.sin(self.phase)
+        weight = weight + m
+        weighted_frequency = weighted_frequency + m * self.frequency
+        weighted_direction = weighted_direction + m * self.direction
+        
+        present = weight > 0
+        safe_weight = np.where(present, weight, 1.0)
+        self.magnitude = np.hypot(real, imag)
+        self.phase = np.arctan2(imag, real) % (2 * math.pi)
+        self.frequency = np.where(present, weighted_frequency / safe_weight, 0.0)
+        self.direction = np.sign(weighted_direction).astype(np.int8)
+    
+    def take(self, mask: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Remove masked cells, returning their content as full arrays."""
+        taken = (
+            np.where(mask, self.magnitude, 0.0),
+            np.where(mask, self.phase, 0.0),
+            np.where(mask, self.frequency, 0.0),
+            np.where(mask, self.direction, 0).astype(np.int8),
+        )
+        self.clear(mask)
+        return taken
+
+
+def _shift_layers(
+    arrays: Tuple[np.ndarray, ...],
+    shift: int
+) -> Tuple[np.ndarray, ...]:
+    """Shift arrays along the layer axis, zero-filling vacated layers."""
+    shifted = []
+    for arr in arrays:
+        out = np.zeros_like(arr)
+        if shift > 0:
+            out[..., shift:] = arr[..., :-shift]
+        elif shift < 0:
+            out[..., :shift] = arr[..., -shift:]
+        else:
+            out[...] = arr
+        shifted.append(out)
+    return tuple(shifted)
+
+
+def _move_layer(arr: np.ndarray, source: int, target: int) -> np.ndarray:
+    """Array holding only `source` layer of arr, placed at `target`."""
+    out = np.zeros_like(arr)
+    out[..., target] = arr[..., source]
+    return out
+
+
+def _laplacian(grid: np.ndarray) -> np.ndarray:
+    """5-point Laplacian over the face axes with reflecting edges.
+    
+    Equivalent to convolving each layer with the kernel
+    [[0, 1, 0], [1, -4, 1], [0, 1, 0]].
+    """
+    padded = np.pad(grid, ((1, 1), (1, 1), (0, 0)), mode='edge')
+    return (
+        padded[:-2, 1:-1] + padded[2:, 1:-1]
+        + padded[1:-1, :-2] + padded[1:-1, 2:]
+        - 4 * grid
+    )
+
+
 class CubeMembrane:
     """The complete cube membrane system.
     
     This is the reality interface. All observation and manifestation
     passes through these six membranes.
+    
+    Each face is stored as a FaceGrid of (resolution × resolution ×
+    layers) arrays. Layer k sits at depth k / (layers - 1), so the
+    default 11 layers step the thickness in increments of 0.1.
+    Information written to the same cell interferes: complex
+    amplitudes magnitude·e^{iφ} are summed per cell.
     """
     
     def __init__(
         self,
         size: float = 2.0,
         thickness: float = 0.1,
-        resolution: int = 32
+        resolution: int = 32,
+        layers: int = 11,
+        diffusion: float = 0.0
     ):
+        if layers < 2:
+            raise ValueError("layers must be at least 2")
         self.size = size
         self.thickness = thickness
         self.resolution = resolution
+        self.layers = layers
+        self.diffusion = diffusion  # Lateral spread rate per unit time
         
         # Information stored in each face's membrane
-        self._face_data: Dict[Face, List[Tuple[MembranePoint, InformationFlux]]] = {
-            face: [] for face in Face
+        self._grids: Dict[Face, FaceGrid] = {
+            face: FaceGrid.empty(resolution, layers) for face in Face
         }
         
+        # Writes not yet folded in by interfere(): single fluxes as
+        # tuples, write_many() batches as arrays
+        self._pending: Dict[Face, List[tuple]] = {face: [] for face in Face}
+        self._pending_blocks: Dict[Face, List[tuple]] = {face: [] for face in Face}
+        
         # Total flux through each face
         self._face_flux: Dict[Face, float] = {face: 0.0 for face in Face}
+        
+        # Fractional layer migration carried between propagate() calls
+        self._layer_progress = 0.0
+        
+        # Mesh topology, built on first to_mesh() (see _mesh_topology)
+        self._topology: Optional['MeshTopology'] = None
+    
+    def cell_index(self, u: float, v: float) -> Tuple[int, int]:
+        """Grid cell containing local coordinates (u, v)."""
+        last = self.resolution - 1
+        i = min(max(int(u * self.resolution), 0), last)
+        j = min(max(int(v * self.resolution), 0), last)
+        return i, j
+    
+    def layer_index(self, layer: float) -> int:
+        """Nearest grid layer to a layer depth in [0, 1]."""
+        return min(max(int(round(layer * (self.layers - 1))), 0), self.layers - 1)
+    
+    def face_grid(self, face: Face) -> FaceGrid:
+        """Direct access to a face's arrays."""
+        self.interfere()
+        return self._grids[face]
     
     def write(
         self,
@@ -215,14 +427,91 @@ class CubeMembrane:
         Writing to inner surface (layer=0) means pushing from
         hyperspatial interior toward normal space exterior.
         """
-        point = MembranePoint(face=face, u=u, v=v, layer_depth=layer)
-        self._face_data[face].append((point, flux))
+        i, j = self.cell_index(u, v)
+        k = self.layer_index(layer)
+        self._pending[face].append((
+            self._flat_cell(i, j, k),
+            flux.magnitude,
+            flux.phase,
+            flux.frequency,
+            _DIRECTION_CODE[flux.direction],
+        ))
         
         if flux.direction == FluxDirection.OUTWARD:
             self._face_flux[face] += flux.magnitude
         elif flux.direction == FluxDirection.INWARD:
             self._face_flux[face] -= flux.magnitude
     
+    def write_many(
+        self,
+        face: Face,
+        u: np.ndarray,
+        v: np.ndarray,
+        magnitude: np.ndarray,
+        direction: FluxDirection,
+        frequency: ArrayLike = 1.0,
+        phase: ArrayLike = 0.0,
+        layer: ArrayLike = 0.0
+    ) -> None:
+        """Write many fluxes to one face at once.
+        
+        Array arguments broadcast together. Fluxes landing in the same
+        cell interfere when the membrane next interferes (on
+        propagate or any read).
+        """
+        u, v, magnitude, frequency, phase, layer = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.float64).ravel() for a in (
+                u, v, magnitude, frequency, phase, layer
+            ))
+        )
+        last = self.resolution - 1
+        i = np.clip((u * self.resolution).astype(np.int64), 0, last)
+        j = np.clip((v * self.resolution).astype(np.int64), 0, last)
+        k = np.clip(
+            np.rint(layer * (self.layers - 1)).astype(np.int64), 0, self.layers - 1
+        )
+        code = _DIRECTION_CODE[direction]
+        self._pending_blocks[face].append((
+            self._flat_cell(i, j, k),
+            magnitude,
+            phase,
+            frequency,
+            np.full(magnitude.shape, code, dtype=np.float64),
+        ))
+        
+        total = float(magnitude.sum())
+        if direction == FluxDirection.OUTWARD:
+            self._face_flux[face] += total
+        elif direction == FluxDirection.INWARD:
+            self._face_flux[face] -= total
+    
+    def _flat_cell(self, i: ArrayLike, j: ArrayLike, k: ArrayLike) -> ArrayLike:
+        """Flat index of cell (i, j, k) in a face grid."""
+        return (i * self.resolution + j) * self.layers + k
+    
+    def interfere(self) -> None:
+        """Interference stage: fold pending writes into the grids.
+        
+        All fluxes written since the last call are binned per cell
+        and their complex amplitudes summed with the stored ones in a
+        single reduction per face.
+        """
+        for face in Face:
+            scalars = self._pending[face]
+            blocks = self._pending_blocks[face]
+            if not scalars and not blocks:
+                continue
+            if scalars:
+                blocks.append(tuple(np.array(col) for col in zip(*scalars)))
+            cells, magnitude, phase, frequency, direction = (
+                np.concatenate(col) for col in zip(*blocks)
+            )
+            self._grids[face].accumulate(
+                cells.astype(np.int64), magnitude, phase, frequency, direction
+            )
+            self._pending[face] = []
+            self._pending_blocks[face] = []
+    
     def read(
         self,
         face: Face,
@@ -232,13 +521,57 @@ class CubeMembrane:
     ) -> List[InformationFlux]:
         """Read information from a membrane location.
         
-        Returns all fluxes near the specified location.
+        Returns all fluxes in cells whose centres lie within tolerance
+        of (u, v), across every layer.
         """
-        results = []
-        for point, flux in self._face_data[face]:
-            if abs(point.u - u) < tolerance and abs(point.v - v) < tolerance:
-                results.append(flux)
-        return results
+        grid = self.face_grid(face)
+        lo_i, hi_i = self._cell_window(u, tolerance)
+        lo_j, hi_j = self._cell_window(v, tolerance)
+        window = (slice(lo_i, hi_i), slice(lo_j, hi_j))
+        
+        mag = grid.magnitude[window]
+        idx = np.nonzero(mag > 0)
+        return [
+            InformationFlux(
+                magnitude=float(m),
+                direction=_CODE_DIRECTION[int(d)],
+                frequency=float(f),
+                phase=float(p),
+            )
+            for m, d, f, p in zip(
+                mag[idx],
+                grid.direction[window][idx],
+                grid.frequency[window][idx],
+                grid.phase[window][idx],
+            )
+        ]
+    
+    def _cell_window(self, coord: float, tolerance: float) -> Tuple[int, int]:
+        """Index range of cells whose centre is within tolerance of coord."""
+        # Cell centre c_i = (i + 0.5) / R; |c_i - coord| < tolerance
+        lo = math.floor((coord - tolerance) * self.resolution - 0.5) + 1
+        hi = math.ceil((coord + tolerance) * self.resolution - 0.5)
+        return max(lo, 0), min(max(hi, 0), self.resolution)
+    
+    def face_fluxes(self, face: Face) -> List[Tuple[MembranePoint, InformationFlux]]:
+        """All stored information on a face as (point, flux) pairs."""
+        grid = self.face_grid(face)
+        result = []
+        for i, j, k in zip(*(idx.tolist() for idx in np.nonzero(grid.occupied))):
+            point = MembranePoint(
+                face=face,
+                u=(i + 0.5) / self.resolution,
+                v=(j + 0.5) / self.resolution,
+                layer_depth=k / (self.layers - 1),
+            )
+            flux = InformationFlux(
+                magnitude=float(grid.magnitude[i, j, k]),
+                direction=_CODE_DIRECTION[int(grid.direction[i, j, k])],
+                frequency=float(grid.frequency[i, j, k]),
+                phase=float(grid.phase[i, j, k]),
+            )
+            result.append((point, flux))
+        return result
     
     def get_face_flux(self, face: Face) -> float:
         """Get net information flux through a face."""
@@ -259,40 +592,78 @@ class CubeMembrane:
             1. Migrates through layers (inner → outer for outward flux)
             2. Spreads laterally (diffusion on surface)
             3. Interferes with other information
+        
+        Pending writes are interfered first. Layer migration moves
+        whole layers at a time; fractional progress is carried over
+        to the next call. Flux migrating into an occupied cell
+        interferes with it.
         """
+        self.interfere()
+        
+        self._layer_progress += dt * (self.layers - 1)
+        shift = int(self._layer_progress + 1e-9)  # Absorb float round-off
+        self._layer_progress -= shift
+        
         for face in Face:
-            new_data = []
-            for point, flux in self._face_data[face]:
-                # Propagate through layers
-                if flux.direction == FluxDirection.OUTWARD:
-                    new_layer = min(1.0, point.layer_depth + dt)
-                elif flux.direction == FluxDirection.INWARD:
-                    new_layer = max(0.0, point.layer_depth - dt)
-                else:
-                    new_layer = point.layer_depth
-                
-                # Update phase (time evolution)
-                new_phase = (flux.phase + 2 * math.pi * flux.frequency * dt) % (2 * math.pi)
-                
-                new_point = MembranePoint(
-                    face=face,
-                    u=point.u,
-                    v=point.v,
-                    layer_depth=new_layer
-                )
-                new_flux = InformationFlux(
-                    magnitude=flux.magnitude * 0.99,  # Slight decay
-                    direction=flux.direction,
-                    frequency=flux.frequency,
-                    phase=new_phase
-                )
-                
-                # Keep if not fully propagated through
-                if 0.01 < new_flux.magnitude:
-                    if not (flux.direction == FluxDirection.OUTWARD and new_layer >= 1.0):
-                        new_data.append((new_point, new_flux))
+            grid = self._grids[face]
+            
+            # Slight decay and time evolution of phase
+            grid.magnitude *= 0.99
+            grid.phase = (
+                grid.phase + 2 * math.pi * grid.frequency * dt
+            ) % (2 * math.pi)
+            
+            self._migrate(grid, shift)
             
-            self._face_data[face] = new_data
+            if self.diffusion > 0:
+                self._diffuse(grid, self.diffusion * dt)
+            
+            # Drop information too weak to matter
+            grid.clear(grid.magnitude <= MIN_FLUX_MAGNITUDE)
+    
+    def _migrate(self, grid: FaceGrid, shift: int) -> None:
+        """Move outward/inward flux through the membrane layers."""
+        last = self.layers - 1
+        outward = grid.take(grid.occupied & (grid.direction > 0))
+        inward = grid.take(grid.occupied & (grid.direction < 0))
+        
+        # Outward flux leaves the membrane on reaching the outer surface
+        outward = _shift_layers(outward, shift)
+        outward[0][..., last] = 0.0
+        grid.merge(*outward)
+        
+        # Inward flux piles up at the inner surface
+        for k in range(min(shift, self.layers)):
+            grid.merge(*(_move_layer(arr, k, 0) for arr in inward))
+        grid.merge(*_shift_layers(inward, -shift))
+    
+    def _diffuse(self, grid: FaceGrid, rate: float) -> None:
+        """Spread information laterally within each layer.
+        
+        Magnitude, magnitude-weighted phasor, frequency and direction
+        are convolved with the same Laplacian stencil, so cells that
+        receive information inherit a weighted blend of their
+        neighbours' properties.
+        """
+        rate = min(rate, 0.25)  # Explicit scheme stability bound
+        m = grid.magnitude
+        phasor = m * np.exp(1j * grid.phase)
+        weighted_freq = m * grid.frequency
+        weighted_dir = m * grid.direction
+        
+        m_new = m + rate * _laplacian(m)
+        phasor_new = phasor + rate * (
+            _laplacian(phasor.real) + 1j * _laplacian(phasor.imag)
+        )
+        freq_new = weighted_freq + rate * _laplacian(weighted_freq)
+        dir_new = weighted_dir + rate * _laplacian(weighted_dir)
+        
+        occupied = m_new > 0
+        safe_m = np.where(occupied, m_new, 1.0)
+        grid.magnitude = np.where(occupied, m_new, 0.0)
+        grid.phase = np.where(occupied, np.angle(phasor_new) % (2 * math.pi), 0.0)
+        grid.frequency = np.where(occupied, freq_new / safe_m, 0.0)
+        grid.direction = np.where(occupied, np.sign(dir_new), 0).astype(np.int8)
     
     def generate_grid(self, face: Face) -> List[MembranePoint]:
         """Generate a grid of points on a face."""
@@ -309,35 +680,166 @@ class CubeMembrane:
                 ))
         return points
     
-    def to_mesh(self) -> Tuple[List[Tuple[float, float, float]], List[Tuple[int, int, int]]]:
-        """Convert membrane to 3D mesh (vertices and triangles)."""
-        vertices = []
-        triangles = []
+    def _mesh_topology(self) -> 'MeshTopology':
+        """Cached vertex positions and index buffer for the cube mesh.
         
-        for face in Face:
-            base_idx = len(vertices)
+        Topology depends only on size and resolution, so it is rebuilt
+        only when either changes.
+        """
+        key = (self.size, self.resolution)
+        topology = self._topology
+        if topology is None or topology.key != key:
+            topology = MeshTopology.build(self.size, self.resolution)
+            self._topology = topology
+        return topology
+    
+    def to_mesh(self) -> 'MembraneMesh':
+        """Convert membrane to 3D mesh buffers.
+        
+        Positions and triangle indices come from the cached topology;
+        only the per-vertex attributes are computed per call. Each
+        vertex takes the average of the (up to four) cells around it.
+        """
+        self.interfere()
+        topology = self._mesh_topology()
+        res = self.resolution
+        layer_depths = np.linspace(0.0, 1.0, self.layers)
+        
+        magnitude = np.empty(topology.vertex_count, dtype=np.float32)
+        depth = np.empty(topology.vertex_count, dtype=np.float32)
+        per_face = (res + 1) ** 2
+        
+        for f, face in enumerate(Face):
+            grid = self._grids[face]
+            column = grid.magnitude.sum(axis=2)
+            weighted_depth = (grid.magnitude * layer_depths).sum(axis=2)
             
-            # Generate vertices for this face
-            for i in range(self.resolution + 1):
-                for j in range(self.resolution + 1):
-                    u = i / self.resolution
-                    v = j / self.resolution
-                    point = MembranePoint(face=face, u=u, v=v, layer_depth=1.0)
-                    vertices.append(point.to_3d(self.size))
+            vertex_mag = _cells_to_vertices(column) / topology.cell_counts
+            vertex_wdepth = _cells_to_vertices(weighted_depth) / topology.cell_counts
+            
+            occupied = vertex_mag > 0
+            vertex_depth = np.where(
+                occupied, vertex_wdepth / np.where(occupied, vertex_mag, 1.0), 1.0
+            )
             
-            # Generate triangles
-            for i in range(self.resolution):
-                for j in range(self.resolution):
-                    # Two triangles per grid cell
-                    v0 = base_idx + i * (self.resolution + 1) + j
-                    v1 = v0 + 1
-                    v2 = v0 + (self.resolution + 1)
-                    v3 = v2 + 1
-                    
-                    triangles.append((v0, v1, v2))
-                    triangles.append((v1, v3, v2))
-        
-        return vertices, triangles
+            span = slice(f * per_face, (f + 1) * per_face)
+            magnitude[span] = vertex_mag.ravel()
+            depth[span] = vertex_depth.ravel()
+        
+        peak = magnitude.max() if magnitude.size else 0.0
+        level = magnitude / peak if peak > 0 else np.zeros_like(magnitude)
+        # Blue (empty) → red (strongest); green tracks layer depth
+        colors = np.stack([level, depth, 1.0 - level], axis=1).astype(np.float32)
+        
+        return MembraneMesh(
+            positions=topology.positions,
+            indices=topology.indices,
+            magnitude=magnitude,
+            layer_depth=depth,
+            colors=colors,
+        )
+
+
+def _cells_to_vertices(cells: np.ndarray) -> np.ndarray:
+    """Sum the cells touching each vertex of an (R, R) cell grid.
+    
+    Returns an (R + 1, R + 1) array; divide by the cell counts from
+    MeshTopology to average.
+    """
+    padded = np.pad(cells, 1)
+    return (
+        padded[:-1, :-1] + padded[1:, :-1]
+        + padded[:-1, 1:] + padded[1:, 1:]
+    )
+
+
+@dataclass(frozen=True)
+class MeshTopology:
+    """Static geometry of the cube mesh for a given size and resolution.
+    
+    Vertices are laid out face by face in Face order, each face as an
+    (R + 1) × (R + 1) grid indexed i * (R + 1) + j.
+    """
+    key: Tuple[float, int]
+    positions: np.ndarray    # float32 (vertices, 3)
+    indices: np.ndarray      # uint32 (triangles, 3)
+    cell_counts: np.ndarray  # Cells touching each vertex of a face
+    
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+    
+    @classmethod
+    def build(cls, size: float, resolution: int) -> 'MeshTopology':
+        res = resolution
+        h = size / 2
+        steps = np.arange(res + 1) / res
+        u, v = np.meshgrid(steps, steps, indexing='ij')
+        local_u = ((u - 0.5) * size).ravel()
+        local_v = ((v - 0.5) * size).ravel()
+        # Mesh sits on the outer surface (layer_depth = 1.0)
+        offset = np.full(local_u.shape, h * 1.05)
+        
+        face_positions = {
+            Face.POSITIVE_X: (offset, local_u, local_v),
+            Face.NEGATIVE_X: (-offset, local_u, local_v),
+            Face.POSITIVE_Y: (local_u, offset, local_v),
+            Face.NEGATIVE_Y: (local_u, -offset, local_v),
+            Face.POSITIVE_Z: (local_u, local_v, offset),
+            Face.NEGATIVE_Z: (local_u, local_v, -offset),
+        }
+        positions = np.concatenate(
+            [np.stack(face_positions[face], axis=1) for face in Face]
+        ).astype(np.float32)
+        
+        # Two triangles per grid cell
+        i, j = np.meshgrid(np.arange(res), np.arange(res), indexing='ij')
+        v0 = (i * (res + 1) + j).ravel()
+        v1 = v0 + 1
+        v2 = v0 + (res + 1)
+        v3 = v2 + 1
+        cell_tris = np.empty((res * res * 2, 3), dtype=np.int64)
+        cell_tris[0::2] = np.stack([v0, v1, v2], axis=1)
+        cell_tris[1::2] = np.stack([v1, v3, v2], axis=1)
+        per_face = (res + 1) ** 2
+        indices = np.concatenate(
+            [cell_tris + f * per_face for f in range(len(Face))]
+        ).astype(np.uint32)
+        
+        cell_counts = _cells_to_vertices(np.ones((res, res)))
+        
+        for arr in (positions, indices, cell_counts):
+            arr.flags.writeable = False
+        return cls(
+            key=(size, resolution),
+            positions=positions,
+            indices=indices,
+            cell_counts=cell_counts,
+        )
+
+
+@dataclass
+class MembraneMesh:
+    """Render-ready buffers for the cube membrane.
+    
+    positions and indices are shared with the cached topology and are
+    read-only; the per-vertex attributes are fresh each frame.
+    """
+    positions: np.ndarray     # float32 (vertices, 3)
+    indices: np.ndarray       # uint32 (triangles, 3)
+    magnitude: np.ndarray     # float32 (vertices,) flux through the column
+    layer_depth: np.ndarray   # float32 (vertices,) mean depth of that flux
+    colors: np.ndarray        # float32 (vertices, 3) RGB in [0, 1]
+    
+    def to_dict(self) -> Dict[str, list]:
+        """Flat arrays for JSON export, like HypersphereSurface.to_mesh_data."""
+        return {
+            "positions": self.positions.ravel().tolist(),
+            "indices": self.indices.ravel().tolist(),
+            "magnitude": self.magnitude.tolist(),
+            "layer_depth": self.layer_depth.tolist(),
+            "colors": self.colors.ravel().tolist(),
+        }
 
 
 # Semantic aliases for the six faces
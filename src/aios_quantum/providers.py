@@ -6,7 +6,7 @@ Provides a unified interface to quantum hardware across multiple providers:
   - IonQ Quantum Cloud (direct API — free simulator, Aria/Forte QPU)
   - qBraid Platform (managed access — IQM, Rigetti, QuEra, IonQ via credits)
   - Amazon Braket (amazon-braket-sdk — IonQ, Rigetti, IQM, QuEra, ...)
-  - Local simulator (qiskit StatevectorSampler — always available)
+  - Local simulator (statevector / stabilizer / MPS — always available)
 
 Architecture:
     QuantumProvider (ABC)
@@ -20,6 +20,11 @@ Architecture:
         └── auto-discovers available providers
         └── selects optimal provider per heartbeat
         └── failover chain: IBM → IonQ → qBraid → Braket → Simulator
+        └── caches is_available()/get_backends() probes (ProbeCache)
+        └── learns per-provider latency/failure/cost (routing.ProviderStats)
+            for adaptive ordering and hedged submission
+        └── per-provider circuit breakers; optional race against the
+            simulator fallback
 
 The design follows AIOS degradation principles: if the preferred provider
 is unavailable, the system silently degrades to the next without crashing.
@@ -30,14 +35,25 @@ import json
 import math
 import time
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 
 from dotenv import load_dotenv
 
+from .routing import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    ROUTING_POLICIES,
+    CircuitBreaker,
+    ProviderStats,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +83,9 @@ class CircuitResult:
     depth: int
     gate_count: int
     is_real_hardware: bool
+    # Local simulations: method used and its planned memory footprint
+    simulation_method: str = ""
+    memory_estimate_bytes: int = 0
 
 
 # ─── Abstract Provider ─────────────────────────────────────────────────────
@@ -116,6 +135,31 @@ class QuantumProvider(ABC):
         """
         ...
 
+    def run_circuit_batch(
+        self,
+        qiskit_circuit,
+        parameter_values,
+        shots: int = 2048,
+        backend_name: Optional[str] = None,
+        optimization_level: int = 1,
+    ) -> List[CircuitResult]:
+        """
+        Execute a parameterized circuit once per row of `parameter_values`
+        (columns ordered like `qiskit_circuit.parameters`).
+
+        The default binds and runs each row separately; providers with
+        native parameter sweeps override this to submit one job.
+        """
+        return [
+            self.run_circuit(
+                qiskit_circuit.assign_parameters(row),
+                shots=shots,
+                backend_name=backend_name,
+                optimization_level=optimization_level,
+            )
+            for row in parameter_values
+        ]
+
     def info(self) -> ProviderInfo:
         """Get provider metadata."""
         try:
@@ -189,24 +233,13 @@ class IBMProvider(QuantumProvider):
         optimization_level: int = 1,
     ) -> CircuitResult:
         from qiskit_ibm_runtime import SamplerV2
-        from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
-        service = self._get_service()
+        from aios_quantum.circuits.transpile_cache import cached_transpile
 
-        if backend_name:
-            backend = service.backend(backend_name)
-        else:
-            # Pick first operational backend
-            backends = service.backends(operational=True)
-            backend = backends[0] if backends else None
-            if backend is None:
-                raise RuntimeError("No operational IBM backends available")
-
-        # Transpile
-        pm = generate_preset_pass_manager(
-            optimization_level=optimization_level, backend=backend
-        )
-        transpiled = pm.run(qiskit_circuit)
+        backend = self._select_backend(backend_name)
+
+        # Transpile (cached: heartbeats differ only in Rz angles)
+        transpiled = cached_transpile(qiskit_circuit, backend, optimization_level)
 
         # Execute
         t0 = time.time()
@@ -230,6 +263,59 @@ class IBMProvider(QuantumProvider):
             is_real_hardware=True,
         )
 
+    def _select_backend(self, backend_name: Optional[str] = None):
+        service = self._get_service()
+        if backend_name:
+            return service.backend(backend_name)
+        # Pick first operational backend
+        backends = service.backends(operational=True)
+        if not backends:
+            raise RuntimeError("No operational IBM backends available")
+        return backends[0]
+
+    def run_circuit_batch(
+        self,
+        qiskit_circuit,
+        parameter_values,
+        shots: int = 2048,
+        backend_name: Optional[str] = None,
+        optimization_level: int = 1,
+    ) -> List[CircuitResult]:
+        """One transpilation and one SamplerV2 job (a single PUB sweep)."""
+        import numpy as np
+        from qiskit_ibm_runtime import SamplerV2
+
+        from aios_quantum.circuits.transpile_cache import cached_transpile
+
+        backend = self._select_backend(backend_name)
+        transpiled = cached_transpile(qiskit_circuit, backend, optimization_level)
+        values = np.asarray(parameter_values, dtype=float)
+
+        t0 = time.time()
+        sampler = SamplerV2(mode=backend)
+        job = sampler.run([(transpiled, values)], shots=shots)
+        result = job.result()
+        elapsed = time.time() - t0
+
+        meas = result[0].data.meas
+        job_id = job.job_id()
+        results = []
+        for i in range(len(values)):
+            counts = meas.get_counts(loc=i)
+            results.append(CircuitResult(
+                counts=counts,
+                shots=sum(counts.values()),
+                backend_name=backend.name,
+                provider_name="ibm",
+                job_id=job_id,
+                execution_time=elapsed / len(values),
+                num_qubits=qiskit_circuit.num_qubits,
+                depth=transpiled.depth(),
+                gate_count=transpiled.size(),
+                is_real_hardware=True,
+            ))
+        return results
+
 
 # ─── IonQ Direct Provider ──────────────────────────────────────────────────
 
@@ -505,21 +591,43 @@ class BraketProvider(QuantumProvider):
 
 class SimulatorProvider(QuantumProvider):
     """
-    Local Qiskit StatevectorSampler — always available, zero cost.
+    Local simulator — always available, zero cost.
     No real quantum noise but keeps the heartbeat alive.
+
+    Each circuit is profiled and routed to the cheapest method that
+    handles it (see aios_quantum.simulation): dense statevector for
+    small circuits, a closed form for the heartbeat circuit family,
+    stabilizer for Clifford-only circuits, matrix-product state for
+    chain-entangled ones.
+    Passing a backend name forces the corresponding method; None (or
+    "auto") lets the planner choose.
     """
 
+    def _method_for(self, backend_name: Optional[str]) -> Optional[str]:
+        """Method forced by `backend_name` (None = choose per circuit)."""
+        from aios_quantum.simulation import BACKEND_NAMES
+        if backend_name in (None, "", "auto"):
+            return None
+        methods = {b: m for m, b in BACKEND_NAMES.items()}
+        if backend_name not in methods:
+            raise ValueError(
+                f"unknown simulator backend {backend_name!r}; "
+                f"expected one of {sorted(methods)}"
+            )
+        return methods[backend_name]
+
     def name(self) -> str:
         return "simulator"
 
     def display_name(self) -> str:
-        return "Local Simulator (StatevectorSampler)"
+        return "Local Simulator (auto: statevector / closed form / stabilizer / MPS)"
 
     def is_available(self) -> bool:
         return True
 
     def get_backends(self) -> List[str]:
-        return ["statevector_sampler"]
+        from aios_quantum.simulation import BACKEND_NAMES
+        return list(BACKEND_NAMES.values())
 
     def run_circuit(
         self,
@@ -528,49 +636,239 @@ class SimulatorProvider(QuantumProvider):
         backend_name: Optional[str] = None,
         optimization_level: int = 1,
     ) -> CircuitResult:
-        from qiskit.primitives import StatevectorSampler
-
-        sampler = StatevectorSampler()
-        t0 = time.time()
-        job = sampler.run([qiskit_circuit], shots=shots)
-        result = job.result()
-        elapsed = time.time() - t0
-
-        counts = result[0].data.meas.get_counts()
+        from aios_quantum.simulation import simulate
+
+        method = self._method_for(backend_name)
+        outcome = simulate(qiskit_circuit, shots=shots, method=method)
+        plan = outcome.plan
+        if outcome.truncation_error:
+            logger.info(
+                f"Approximate simulation ({plan.reason}): "
+                f"discarded weight {outcome.truncation_error:.2e}"
+            )
 
         return CircuitResult(
-            counts=counts,
-            shots=sum(counts.values()),
-            backend_name="statevector_sampler",
+            counts=outcome.counts,
+            shots=sum(outcome.counts.values()),
+            backend_name=plan.backend_name,
             provider_name="simulator",
             job_id="simulator",
-            execution_time=elapsed,
+            execution_time=outcome.execution_time,
             num_qubits=qiskit_circuit.num_qubits,
             depth=qiskit_circuit.depth(),
             gate_count=qiskit_circuit.size(),
             is_real_hardware=False,
+            simulation_method=plan.method,
+            memory_estimate_bytes=plan.memory_bytes,
         )
 
+    def run_circuit_batch(
+        self,
+        qiskit_circuit,
+        parameter_values,
+        shots: int = 2048,
+        backend_name: Optional[str] = None,
+        optimization_level: int = 1,
+    ) -> List[CircuitResult]:
+        """
+        Small circuits run as one StatevectorSampler sweep; wider ones
+        are bound row by row so each goes through the planner.
+        """
+        import numpy as np
+        from qiskit.primitives import StatevectorSampler
+
+        from aios_quantum.simulation import BACKEND_NAMES, STATEVECTOR
+        from aios_quantum.simulation.planner import (
+            SMALL_CIRCUIT_QUBITS,
+            statevector_bytes,
+        )
+
+        forced = self._method_for(backend_name)
+        n = qiskit_circuit.num_qubits
+        if n > SMALL_CIRCUIT_QUBITS or forced not in (None, STATEVECTOR):
+            return super().run_circuit_batch(
+                qiskit_circuit, parameter_values, shots,
+                backend_name, optimization_level,
+            )
+
+        circuit = qiskit_circuit
+        if circuit.num_clbits == 0:
+            circuit = circuit.measure_all(inplace=False)
+        values = np.asarray(parameter_values, dtype=float)
+        t0 = time.time()
+        result = StatevectorSampler().run([(circuit, values)], shots=shots).result()
+        elapsed = time.time() - t0
+        data = result[0].join_data()
+        results = []
+        for i in range(len(values)):
+            counts = data.get_counts(loc=i)
+            results.append(CircuitResult(
+                counts=counts,
+                shots=sum(counts.values()),
+                backend_name=BACKEND_NAMES[STATEVECTOR],
+                provider_name="simulator",
+                job_id="simulator",
+                execution_time=elapsed / len(values),
+                num_qubits=n,
+                depth=qiskit_circuit.depth(),
+                gate_count=qiskit_circuit.size(),
+                is_real_hardware=False,
+                simulation_method=STATEVECTOR,
+                memory_estimate_bytes=statevector_bytes(n),
+            ))
+        return results
+
+
+# ─── Probe Cache ──────────────────────────────────────────────────────────
+
+# Seconds a successful / failed probe is trusted before it is refreshed
+PROBE_TTL_SECONDS = 300.0
+PROBE_NEGATIVE_TTL_SECONDS = 60.0
+
+
+@dataclass
+class _Probe:
+    value: Any
+    expires: float
+    error: str = ""
+
+
+class ProbeCache:
+    """
+    TTL cache for provider probes (availability, backend lists).
+
+    A probe is run synchronously only the first time a key is asked
+    for. After that the cached value is returned immediately; once it
+    expires, the stale value is still returned while one background
+    thread re-probes. Failures (exceptions, False, empty lists) are
+    cached too, for the shorter `negative_ttl`, so a provider whose
+    check times out costs that timeout once, not on every beat.
+    """
+
+    def __init__(
+        self,
+        ttl: float = PROBE_TTL_SECONDS,
+        negative_ttl: float = PROBE_NEGATIVE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._entries: Dict[Tuple[str, str], _Probe] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str], probe: Callable[[], Any], failed: Any) -> Any:
+        """Cached `probe()`; `failed` stands in for its value if it raises."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return self.refresh(key, probe, failed)
+        if self._clock() >= entry.expires:
+            self._refresh_in_background(key, probe, failed)
+        return entry.value
+
+    def refresh(self, key: Tuple[str, str], probe: Callable[[], Any], failed: Any) -> Any:
+        """Run the probe now and cache its outcome."""
+        error = ""
+        try:
+            value = probe()
+        except Exception as e:
+            value, error = failed, str(e)
+        ttl = self.ttl if value and not error else self.negative_ttl
+        with self._lock:
+            self._entries[key] = _Probe(value, self._clock() + ttl, error)
+        return value
+
+    def _refresh_in_background(self, key, probe, failed):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.refresh(key, probe, failed)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(
+            target=run, name=f"probe-{key[0]}-{key[1]}", daemon=True
+        ).start()
+
+    def error(self, key: Tuple[str, str]) -> str:
+        """Error message from the last failed probe of `key`, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry.error if entry else ""
+
+    def invalidate(self, name: Optional[str] = None):
+        """Forget cached probes for one provider (or all)."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == name]:
+                    del self._entries[key]
+
 
 # ─── Provider Registry ────────────────────────────────────────────────────
 
+# Last-resort provider: never tripped by a breaker, used as race fallback
+FALLBACK_PROVIDER = "simulator"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a provider's circuit breaker refuses an attempt."""
+
 class ProviderRegistry:
     """
     Discovers, manages, and selects quantum providers.
 
     Failover chain: IBM → qBraid → Braket → Simulator
     The chain ensures AIOS always has a heartbeat source.
+
+    Provider availability and backend lists come from a ProbeCache, so
+    selecting a provider does not re-check credentials or remote
+    services on every beat.
+
+    Every attempt is recorded in `stats` (optionally persisted to
+    `stats_path`). The "adaptive" routing policy orders providers by
+    expected completion time within the remaining budget instead of the
+    static priority list, and `hedge_percentile` re-submits to the next
+    provider when the first one runs past that latency percentile.
+
+    Each provider except the simulator has a CircuitBreaker: after
+    `breaker_threshold` consecutive failures it drops out of selection
+    until a half-open probe succeeds. `race_deadline` runs the first
+    choice and the simulator side by side and prefers real hardware only
+    if it answers within the deadline.
     """
 
     # Default priority order — real hardware first, simulator last
     # IonQ between IBM and qBraid: IonQ has free simulator + direct QPU access
     DEFAULT_PRIORITY = ["ibm", "ionq", "qbraid", "braket", "simulator"]
 
-    def __init__(self, priority: Optional[List[str]] = None):
+    def __init__(
+        self,
+        priority: Optional[List[str]] = None,
+        probe_ttl: float = PROBE_TTL_SECONDS,
+        probe_negative_ttl: float = PROBE_NEGATIVE_TTL_SECONDS,
+        stats_path: Optional[str] = None,
+        breaker_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        breaker_reset_seconds: float = BREAKER_RESET_SECONDS,
+    ):
         load_dotenv()  # Load .env for all providers
 
         self._priority = priority or self.DEFAULT_PRIORITY
         self._providers: Dict[str, QuantumProvider] = {}
+        self._probes = ProbeCache(probe_ttl, probe_negative_ttl)
+        self.stats = ProviderStats(stats_path)
+        self._breaker_threshold = breaker_threshold
+        self._breaker_reset_seconds = breaker_reset_seconds
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
 
         # Register all known providers
         self._register_all()
@@ -588,12 +886,47 @@ class ProviderRegistry:
         """Get a specific provider by name."""
         return self._providers.get(name)
 
+    def is_available(self, provider: QuantumProvider) -> bool:
+        """Cached `provider.is_available()`."""
+        return bool(self._probes.get(
+            (provider.name(), "available"), provider.is_available, False
+        ))
+
+    def get_backends(self, provider: QuantumProvider) -> List[str]:
+        """Cached `provider.get_backends()`."""
+        return list(self._probes.get(
+            (provider.name(), "backends"), provider.get_backends, []
+        ))
+
+    def breaker(self, provider: QuantumProvider) -> Optional[CircuitBreaker]:
+        """The provider's circuit breaker (None for the fallback provider)."""
+        name = provider.name()
+        if name == FALLBACK_PROVIDER:
+            return None
+        with self._breakers_lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(
+                    self._breaker_threshold, self._breaker_reset_seconds
+                )
+            return self._breakers[name]
+
+    def is_usable(self, provider: QuantumProvider) -> bool:
+        """Available and not held off by an open circuit breaker."""
+        breaker = self.breaker(provider)
+        if breaker is not None and breaker.is_open():
+            return False
+        return self.is_available(provider)
+
+    def refresh(self, name: Optional[str] = None):
+        """Drop cached probes so the next lookup re-checks providers."""
+        self._probes.invalidate(name)
+
     def get_available_providers(self) -> List[QuantumProvider]:
-        """Return providers that are currently available, in priority order."""
+        """Return providers that are currently usable, in priority order."""
         available = []
         for name in self._priority:
             provider = self._providers.get(name)
-            if provider and provider.is_available():
+            if provider and self.is_usable(provider):
                 available.append(provider)
         return available
 
@@ -613,7 +946,7 @@ class ProviderRegistry:
         # Try preferred first
         if preferred:
             provider = self._providers.get(preferred)
-            if provider and provider.is_available():
+            if provider and self.is_usable(provider):
                 logger.info(f"Using preferred provider: {provider.display_name()}")
                 return provider
             logger.warning(
@@ -624,7 +957,7 @@ class ProviderRegistry:
         # Walk the priority chain
         for name in self._priority:
             provider = self._providers.get(name)
-            if provider and provider.is_available():
+            if provider and self.is_usable(provider):
                 logger.info(f"Selected provider: {provider.display_name()}")
                 return provider
 
@@ -633,12 +966,32 @@ class ProviderRegistry:
         return SimulatorProvider()
 
     def status(self) -> Dict[str, ProviderInfo]:
-        """Get status of all registered providers."""
+        """Get status of all registered providers (from cached probes)."""
         result = {}
         for name in self._priority:
             provider = self._providers.get(name)
             if provider:
-                result[name] = provider.info()
+                available = self.is_available(provider)
+                backends = self.get_backends(provider) if available else []
+                error = (
+                    self._probes.error((name, "available"))
+                    or self._probes.error((name, "backends"))
+                )
+                breaker = self.breaker(provider)
+                tripped = breaker is not None and breaker.is_open()
+                result[name] = ProviderInfo(
+                    name=name,
+                    display_name=provider.display_name(),
+                    is_real_hardware=not isinstance(provider, SimulatorProvider),
+                    backends=backends,
+                    status=(
+                        "error" if error
+                        else "circuit_open" if tripped
+                        else "available" if available
+                        else "unavailable"
+                    ),
+                    error=error,
+                )
             else:
                 result[name] = ProviderInfo(
                     name=name,
@@ -648,50 +1001,274 @@ class ProviderRegistry:
                 )
         return result
 
-    def run_heartbeat_circuit(
+    def route(
         self,
+        preferred: Optional[str] = None,
+        policy: str = "priority",
+        budget_remaining: Optional[float] = None,
+    ) -> List[QuantumProvider]:
+        """
+        Attempt order for one heartbeat.
+
+        The preferred provider (if available) always goes first. With the
+        "priority" policy the rest follow DEFAULT_PRIORITY; "adaptive"
+        ranks them by expected completion time and drops those expected
+        to cost more than `budget_remaining` QPU seconds.
+        """
+        if policy not in ROUTING_POLICIES:
+            raise ValueError(
+                f"unknown routing policy {policy!r}; expected one of {ROUTING_POLICIES}"
+            )
+        first = self.select_provider(preferred) if preferred else None
+        available = {p.name(): p for p in self.get_available_providers()}
+        names = [n for n in available if first is None or n != first.name()]
+        if policy == "adaptive":
+            names = self.stats.rank(names, budget_remaining)
+        order = [available[n] for n in names]
+        if first is not None:
+            order.insert(0, first)
+        if not order:
+            # Should never happen (simulator is always available), but be safe
+            logger.error("No providers available — returning simulator")
+            order = [SimulatorProvider()]
+        return order
+
+    def run_on_provider(
+        self,
+        provider: QuantumProvider,
         qiskit_circuit,
         shots: int = 2048,
-        preferred_provider: Optional[str] = None,
-        preferred_backend: Optional[str] = None,
+        backend_name: Optional[str] = None,
+        optimization_level: int = 1,
     ) -> CircuitResult:
         """
-        Execute a heartbeat circuit with automatic failover.
+        Run on one provider (no failover), recording the attempt in
+        `stats` and the provider's circuit breaker.
 
-        Tries providers in priority order until one succeeds.
+        Raises CircuitOpenError if the breaker refuses the attempt.
         """
-        tried = []
-        provider = self.select_provider(preferred_provider)
+        return self._attempt(
+            provider, backend_name, provider.run_circuit,
+            qiskit_circuit,
+            shots=shots,
+            backend_name=backend_name,
+            optimization_level=optimization_level,
+        )[0]
+
+    def _attempt(self, provider, route_backend, call, *args, **kwargs):
+        """
+        Make one provider call behind its breaker and record it in
+        `stats`; returns the results as a list (one job, maybe a sweep).
+        """
+        breaker = self.breaker(provider)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"circuit breaker open for {provider.name()}")
+        logger.info(f"Attempting heartbeat on {provider.display_name()}...")
+        t0 = time.time()
+        try:
+            results = call(*args, **kwargs)
+        except Exception:
+            self.stats.record(
+                provider.name(), route_backend, time.time() - t0, ok=False
+            )
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        if isinstance(results, CircuitResult):
+            results = [results]
+        execution = sum(r.execution_time for r in results)
+        self.stats.record(
+            provider.name(),
+            results[0].backend_name,
+            latency=time.time() - t0,
+            execution=execution,
+            cost=execution if results[0].is_real_hardware else 0.0,
+        )
+        logger.info(
+            f"Heartbeat complete on {provider.display_name()} "
+            f"({results[0].backend_name}): "
+            f"{execution:.1f}s for {len(results)} circuit(s)"
+        )
+        return results
 
-        # Build attempt order: selected provider first, then remaining
-        attempt_order = [provider]
-        for name in self._priority:
-            p = self._providers.get(name)
-            if p and p is not provider and p.is_available():
-                attempt_order.append(p)
+    def run_heartbeat_batch(
+        self,
+        qiskit_circuit,
+        parameter_values,
+        shots: int = 2048,
+        preferred_provider: Optional[str] = None,
+        preferred_backend: Optional[str] = None,
+        policy: str = "priority",
+        budget_remaining: Optional[float] = None,
+    ) -> List[CircuitResult]:
+        """
+        Run a parameter sweep as one submission, with failover.
 
-        for p in attempt_order:
+        Each provider in `route()` order gets the whole sweep through
+        `run_circuit_batch`; the first that succeeds returns one result
+        per row of `parameter_values`.
+        """
+        tried = []
+        order = self.route(preferred_provider, policy, budget_remaining)
+        for i, p in enumerate(order):
             try:
-                logger.info(
-                    f"Attempting heartbeat on {p.display_name()}..."
-                )
-                result = p.run_circuit(
+                return self._attempt(
+                    p, preferred_backend if i == 0 else None, p.run_circuit_batch,
                     qiskit_circuit,
+                    parameter_values,
                     shots=shots,
-                    backend_name=preferred_backend if p is provider else None,
-                )
-                logger.info(
-                    f"Heartbeat complete on {p.display_name()} "
-                    f"({result.backend_name}): "
-                    f"{result.execution_time:.1f}s"
+                    backend_name=preferred_backend if i == 0 else None,
                 )
-                return result
             except Exception as e:
                 tried.append((p.name(), str(e)))
                 logger.warning(
-                    f"Provider {p.display_name()} failed: {e}. "
+                    f"Provider {p.display_name()} failed batch: {e}. "
                     "Trying next..."
                 )
+        raise RuntimeError(f"All providers failed: {tried}")
+
+    def run_heartbeat_circuit(
+        self,
+        qiskit_circuit,
+        shots: int = 2048,
+        preferred_provider: Optional[str] = None,
+        preferred_backend: Optional[str] = None,
+        policy: str = "priority",
+        budget_remaining: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        race_deadline: Optional[float] = None,
+        on_extra_cost: Optional[Callable[[CircuitResult], None]] = None,
+    ) -> CircuitResult:
+        """
+        Execute a heartbeat circuit with automatic failover.
+
+        Tries providers in `route()` order until one succeeds. With
+        `hedge_percentile` (e.g. 0.95), an attempt still running past
+        that percentile of its provider's recorded latency is raced
+        against the next provider; the first success wins.
+
+        With `race_deadline` (seconds), the first choice and the
+        simulator start together. The first choice's result is used if
+        it arrives within the deadline; after that whichever finishes
+        first wins, and the loser completes in the background.
+
+        A losing hedge or race attempt still runs to completion, so a
+        losing real-hardware job spends QPU time that the returned
+        result does not include. Each such job's result is passed to
+        `on_extra_cost` when it finishes, so callers can charge it to
+        their budget. Without the callback that time goes untracked.
+        """
+        tried = []
+        launched: list = []
+        winner = None
+        order = self.route(preferred_provider, policy, budget_remaining)
+        backends = {order[0].name(): preferred_backend}
+
+        def fail(p: QuantumProvider, e: Exception):
+            tried.append((p.name(), str(e)))
+            logger.warning(
+                f"Provider {p.display_name()} failed: {e}. "
+                "Trying next..."
+            )
+
+        fallback = self._providers.get(FALLBACK_PROVIDER)
+        race = (
+            race_deadline is not None and fallback is not None
+            and order[0] is not fallback
+        )
+        workers = 2 if (hedge_percentile or race) else 0
+        pool = ThreadPoolExecutor(max_workers=workers) if workers else None
+        try:
+            if race:
+                primary = order.pop(0)
+                order = [p for p in order if p is not fallback]
+                attempts = {
+                    pool.submit(
+                        self.run_on_provider, primary, qiskit_circuit, shots,
+                        backends.get(primary.name()),
+                    ): primary,
+                    pool.submit(
+                        self.run_on_provider, fallback, qiskit_circuit, shots,
+                    ): fallback,
+                }
+                launched.extend(attempts)
+                first = next(iter(attempts))
+                wait([first], timeout=race_deadline)
+                pending = set(attempts)
+                if first.done():
+                    pending.discard(first)
+                    try:
+                        result, winner = first.result(), first
+                        return result
+                    except Exception as e:
+                        fail(primary, e)
+                else:
+                    logger.info(
+                        f"{primary.display_name()} missed the {race_deadline}s "
+                        "race deadline; taking the first result"
+                    )
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            result, winner = future.result(), future
+                            return result
+                        except Exception as e:
+                            fail(attempts[future], e)
+
+            while order:
+                p = order.pop(0)
+                backend = backends.get(p.name())
+                threshold = (
+                    self.stats.latency_quantile(p.name(), hedge_percentile)
+                    if hedge_percentile is not None and order else None
+                )
+                if threshold is None:
+                    try:
+                        return self.run_on_provider(p, qiskit_circuit, shots, backend)
+                    except Exception as e:
+                        fail(p, e)
+                        continue
+
+                # Hedged attempt
+                attempts = {
+                    pool.submit(self.run_on_provider, p, qiskit_circuit, shots, backend): p
+                }
+                launched.extend(attempts)
+                done, _ = wait(attempts, timeout=max(threshold, 0.0))
+                if not done:
+                    hedge = order.pop(0)
+                    logger.info(
+                        f"{p.display_name()} past its p{hedge_percentile * 100:.0f} "
+                        f"latency ({threshold:.1f}s); hedging on "
+                        f"{hedge.display_name()}"
+                    )
+                    hedged = pool.submit(
+                        self.run_on_provider, hedge, qiskit_circuit, shots, None
+                    )
+                    attempts[hedged] = hedge
+                    launched.append(hedged)
+                pending = set(attempts)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            result, winner = future.result(), future
+                            return result
+                        except Exception as e:
+                            fail(attempts[future], e)
+        finally:
+            if pool is not None:
+                # A losing hedge or race finishes in the background (and
+                # still updates the statistics); report what it spends
+                for future in launched:
+                    if future is not winner:
+                        future.add_done_callback(
+                            partial(_report_extra_cost, on_extra_cost)
+                        )
+                pool.shutdown(wait=False)
 
         # All failed — this shouldn't happen since simulator never fails
         raise RuntimeError(
@@ -699,6 +1276,24 @@ class ProviderRegistry:
         )
 
 
+def _report_extra_cost(callback, future) -> None:
+    """Pass a finished losing attempt's hardware result to `callback`."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if not result.is_real_hardware:
+        return
+    logger.info(
+        f"Losing attempt on {result.provider_name} ({result.backend_name}) "
+        f"used {result.execution_time:.1f}s of QPU time"
+    )
+    if callback is not None:
+        try:
+            callback(result)
+        except Exception as e:
+            logger.warning(f"Extra-cost callback failed: {e}")
+
+
 # ─── Convenience Functions ─────────────────────────────────────────────────
 
 def provider_status() -> str:
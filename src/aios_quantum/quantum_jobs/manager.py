@@ -11,14 +11,16 @@ Supports:
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 
-from qiskit import QuantumCircuit, transpile
+from qiskit import QuantumCircuit
 from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
 
+from ..circuits.transpile_cache import cached_transpile
 from .tracker import JobTracker, JobRecord
 
 logger = logging.getLogger(__name__)
@@ -116,11 +118,7 @@ class QuantumJobManager:
         """
         try:
             backend = self.service.backend(backend_name)
-            transpiled = transpile(
-                circuit, 
-                backend, 
-                optimization_level=1
-            )
+            transpiled = cached_transpile(circuit, backend, optimization_level=1)
             
             sampler = SamplerV2(backend)
             job = sampler.run([transpiled], shots=shots)
@@ -165,6 +163,9 @@ class QuantumJobManager:
         """
         Submit same circuit to multiple backends simultaneously.
         
+        Transpilation and submission run in one thread per backend, so
+        wall-clock time is that of the slowest backend, not the sum.
+
         Args:
             circuit: Quantum circuit to execute
             backends: List of backend names (default: FAST_BACKENDS)
@@ -183,20 +184,34 @@ class QuantumJobManager:
                 f"{experiment_type}_%Y%m%d_%H%M%S"
             )
         
-        results = []
-        for backend_name in backends:
-            result = self.submit_single(
+        if not backends:
+            return []
+
+        # Resolve the shared service once (failures are reported per
+        # backend by submit_single), then transpile and submit to every
+        # backend concurrently; results keep the input order
+        try:
+            self.service
+        except Exception as e:
+            logger.error(f"Could not connect to IBM Quantum: {e}")
+
+        def submit(backend_name: str) -> SubmissionResult:
+            return self.submit_single(
                 circuit=circuit,
                 backend_name=backend_name,
                 shots=shots,
                 experiment_type=experiment_type,
                 experiment_id=experiment_id
             )
-            results.append(result)
-            
+
+        with ThreadPoolExecutor(max_workers=len(backends)) as pool:
+            results = list(pool.map(submit, backends))
+
+        for result in results:
             if result.submitted:
                 logger.info(
-                    f"Submitted {circuit.name} to {backend_name}: {result.job_id}"
+                    f"Submitted {circuit.name} to {result.backend_name}: "
+                    f"{result.job_id}"
                 )
         
         return results
@@ -4,6 +4,7 @@ Job Tracker - Persistent storage for quantum job IDs and metadata.
 
 import json
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import dataclass, field, asdict
@@ -48,12 +49,14 @@ class JobTracker:
     
     Stores job IDs and metadata to JSON file for later retrieval.
     Enables fire-and-forget job submission with async result collection.
+    Safe to update from concurrent submission threads.
     """
     
     def __init__(self, tracker_file: str = "quantum_jobs/pending_jobs.json"):
         self.tracker_path = Path(tracker_file)
         self.tracker_path.parent.mkdir(parents=True, exist_ok=True)
         self._jobs: Dict[str, JobRecord] = {}
+        self._lock = threading.RLock()
         self._load()
     
     def _load(self):
@@ -72,11 +75,12 @@ class JobTracker:
     
     def _save(self):
         """Persist jobs to disk."""
-        data = {
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "jobs": {k: v.to_dict() for k, v in self._jobs.items()}
-        }
-        self.tracker_path.write_text(json.dumps(data, indent=2))
+        with self._lock:
+            data = {
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "jobs": {k: v.to_dict() for k, v in self._jobs.items()}
+            }
+            self.tracker_path.write_text(json.dumps(data, indent=2))
     
     def add_job(
         self,
@@ -99,8 +103,9 @@ class JobTracker:
             experiment_type=experiment_type,
             experiment_id=experiment_id
         )
-        self._jobs[job_id] = record
-        self._save()
+        with self._lock:
+            self._jobs[job_id] = record
+            self._save()
         logger.info(f"Tracking job {job_id} on {backend_name}")
         return record
     
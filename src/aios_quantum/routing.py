@@ -0,0 +1,285 @@
+"""
+AIOS Quantum — Latency-aware provider routing
+
+Every heartbeat attempt feeds exponentially-weighted statistics per
+provider and per provider/backend route:
+
+    latency     wall-clock seconds from submission to counts
+    queue       latency minus the execution time the provider reports
+    execution   execution time reported in the CircuitResult
+    cost        QPU seconds charged (execution time on real hardware,
+                zero on simulators)
+    failures    EWMA failure rate
+
+`ProviderStats.rank` orders candidate providers by expected completion
+time, latency / (1 - failure rate), and drops providers whose expected
+cost exceeds the remaining budget. `latency_quantile` gives the
+threshold past which the registry hedges a slow attempt onto the next
+provider.
+
+Statistics are kept in a small JSON file, rewritten atomically after
+each update, so routing knowledge survives restarts.
+
+`CircuitBreaker` takes a provider out of rotation after K consecutive
+failures. Once `reset_seconds` have passed it lets a single probe
+attempt through (half-open); success closes the breaker, failure opens
+it for another period.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest observation in every moving average
+EWMA_ALPHA = 0.2
+
+# Observations needed before a route's latency spread is trusted
+MIN_SAMPLES = 5
+
+# Assumed completion time for routes with no successful runs yet
+DEFAULT_EXPECTED_SECONDS = 300.0
+
+# Failure rates are capped here so expected time stays finite
+MAX_FAILURE_RATE = 0.95
+
+ROUTING_POLICIES = ("priority", "adaptive")
+
+# Circuit breaker defaults: consecutive failures to open, seconds open
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_SECONDS = 300.0
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+@dataclass
+class RouteStats:
+    """Exponentially-weighted performance of one provider or backend."""
+    samples: int = 0
+    failures: int = 0
+    latency: float = 0.0
+    latency_var: float = 0.0
+    queue: float = 0.0
+    execution: float = 0.0
+    cost: float = 0.0
+    failure_rate: float = 0.0
+    updated_at: float = 0.0
+
+    def record_success(
+        self,
+        latency: float,
+        execution: float,
+        cost: float,
+        alpha: float = EWMA_ALPHA,
+    ):
+        queue = max(0.0, latency - execution)
+        if self.samples == 0:
+            self.latency, self.queue = latency, queue
+            self.execution, self.cost = execution, cost
+        else:
+            diff = latency - self.latency
+            increment = alpha * diff
+            self.latency += increment
+            self.latency_var = (1 - alpha) * (self.latency_var + diff * increment)
+            self.queue += alpha * (queue - self.queue)
+            self.execution += alpha * (execution - self.execution)
+            self.cost += alpha * (cost - self.cost)
+        self.samples += 1
+        self.failure_rate *= 1 - alpha
+        self.updated_at = time.time()
+
+    def record_failure(self, alpha: float = EWMA_ALPHA):
+        self.failures += 1
+        self.failure_rate += alpha * (1 - self.failure_rate)
+        self.updated_at = time.time()
+
+    def expected_seconds(self) -> float:
+        """Expected time to a successful result, counting retries."""
+        latency = self.latency if self.samples else DEFAULT_EXPECTED_SECONDS
+        return latency / (1 - min(self.failure_rate, MAX_FAILURE_RATE))
+
+    def latency_quantile(self, q: float) -> Optional[float]:
+        """Normal-approximation latency quantile (None until MIN_SAMPLES)."""
+        if self.samples < MIN_SAMPLES:
+            return None
+        z = NormalDist().inv_cdf(q)
+        return self.latency + z * math.sqrt(self.latency_var)
+
+
+class CircuitBreaker:
+    """Per-provider breaker: closed → open after K failures → half-open probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._probe_due():
+                return HALF_OPEN
+            return self._state
+
+    def _probe_due(self) -> bool:
+        return self._clock() - self._opened_at >= self.reset_seconds
+
+    def is_open(self) -> bool:
+        """True while attempts would be refused."""
+        with self._lock:
+            if self._state == OPEN:
+                return not self._probe_due()
+            return self._state == HALF_OPEN and self._probing
+
+    def allow(self) -> bool:
+        """Claim permission for one attempt (the probe, when half-open)."""
+        with self._lock:
+            if self._state == OPEN and self._probe_due():
+                self._state, self._probing = HALF_OPEN, False
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state, self._failures, self._probing = CLOSED, 0, False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        f"Circuit breaker open after {self._failures} failures"
+                    )
+                self._state, self._probing = OPEN, False
+                self._opened_at = self._clock()
+
+
+def route_key(provider: str, backend: Optional[str] = None) -> str:
+    """Stats key: "provider" or "provider/backend"."""
+    return f"{provider}/{backend}" if backend else provider
+
+
+class ProviderStats:
+    """Thread-safe EWMA statistics per provider and backend, optionally on disk."""
+
+    def __init__(self, path: Optional[str] = None, alpha: float = EWMA_ALPHA):
+        self.path = Path(path) if path else None
+        self.alpha = alpha
+        self._routes: Dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            self._routes = {
+                k: RouteStats(**v) for k, v in data.get("routes", {}).items()
+            }
+        except (json.JSONDecodeError, TypeError, OSError) as e:
+            logger.warning(f"Could not load provider stats: {e}")
+
+    def save(self):
+        """Atomically write the statistics file (no-op without a path)."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                "alpha": self.alpha,
+                "routes": {k: asdict(v) for k, v in self._routes.items()},
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(data, indent=2))
+                os.replace(tmp, self.path)
+            except OSError as e:
+                logger.warning(f"Could not save provider stats: {e}")
+
+    def get(self, provider: str, backend: Optional[str] = None) -> RouteStats:
+        """Snapshot of a route's statistics (empty if never seen)."""
+        with self._lock:
+            return replace(self._routes.get(route_key(provider, backend), RouteStats()))
+
+    def record(
+        self,
+        provider: str,
+        backend: Optional[str],
+        latency: float,
+        execution: float = 0.0,
+        cost: float = 0.0,
+        ok: bool = True,
+    ):
+        """Fold one attempt into the provider and provider/backend routes."""
+        keys = [route_key(provider)]
+        if backend:
+            keys.append(route_key(provider, backend))
+        with self._lock:
+            for key in keys:
+                stats = self._routes.setdefault(key, RouteStats())
+                if ok:
+                    stats.record_success(latency, execution, cost, self.alpha)
+                else:
+                    stats.record_failure(self.alpha)
+        self.save()
+
+    def latency_quantile(
+        self, provider: str, q: float, backend: Optional[str] = None
+    ) -> Optional[float]:
+        return self.get(provider, backend).latency_quantile(q)
+
+    def rank(
+        self,
+        candidates: List[str],
+        budget_remaining: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Order providers by expected completion time.
+
+        Args:
+            candidates: Provider names in priority order; ties keep it
+            budget_remaining: QPU seconds left; providers expected to
+                              cost more are dropped (None = no limit)
+        """
+        ranked = []
+        for position, name in enumerate(candidates):
+            stats = self.get(name)
+            if budget_remaining is not None and stats.cost > budget_remaining:
+                logger.info(
+                    f"Routing: skipping {name}, expected cost "
+                    f"{stats.cost:.1f}s exceeds budget {budget_remaining:.1f}s"
+                )
+                continue
+            ranked.append((stats.expected_seconds(), position, name))
+        ranked.sort()
+        return [name for _, _, name in ranked]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Plain-dict snapshot of every route."""
+        with self._lock:
+            return {k: asdict(v) for k, v in self._routes.items()}
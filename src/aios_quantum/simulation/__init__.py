@@ -0,0 +1,40 @@
+"""
+Local circuit simulation with structure-aware method selection.
+
+The simulator provider profiles each circuit and runs it on the
+cheapest method that handles it: dense statevector, a closed form for
+the heartbeat circuit family, stabilizer (Clifford-only) or
+matrix-product state (chain-like entanglement).
+"""
+
+from .analysis import CircuitProfile, analyze_circuit
+from .heartbeat import HeartbeatFamily, match_heartbeat_family
+from .mps import MPSState
+from .planner import (
+    BACKEND_NAMES,
+    HEARTBEAT_CLOSED_FORM,
+    MATRIX_PRODUCT_STATE,
+    STABILIZER,
+    STATEVECTOR,
+    SimulationOutcome,
+    SimulationPlan,
+    plan_simulation,
+    simulate,
+)
+
+__all__ = [
+    "CircuitProfile",
+    "analyze_circuit",
+    "HeartbeatFamily",
+    "match_heartbeat_family",
+    "MPSState",
+    "BACKEND_NAMES",
+    "SimulationOutcome",
+    "SimulationPlan",
+    "plan_simulation",
+    "simulate",
+    "STATEVECTOR",
+    "STABILIZER",
+    "MATRIX_PRODUCT_STATE",
+    "HEARTBEAT_CLOSED_FORM",
+]
@@ -0,0 +1,141 @@
+"""
+Circuit Analysis — structural profile for simulator selection
+=============================================================
+
+One pass over a circuit collects what the planner needs to pick a
+simulation method:
+
+    width          — qubits, and the widest gate
+    topology       — two-qubit interactions, the Schmidt-rank bits they
+                     can add across each chain cut (bounds the MPS
+                     bond dimension), max interaction distance
+    Clifford share — fraction of gates in the Clifford group
+    measurements   — terminal qubit → clbit map; anything mid-circuit,
+                     resets or control flow keeps the circuit on the
+                     statevector path
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+from qiskit.circuit import Gate
+
+# Gates that are Clifford at any parameter value
+CLIFFORD_GATES = frozenset({
+    "id", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg",
+    "cx", "cy", "cz", "swap", "iswap", "ecr", "dcx",
+})
+
+# Rotations that are Clifford when the angle is a multiple of π/2
+CLIFFORD_ROTATIONS = frozenset({"rz", "rx", "ry", "p", "u1"})
+
+# Two-qubit gates with operator Schmidt rank 2 (one bit across a cut);
+# any other two-qubit gate may add two
+RANK_TWO_GATES = frozenset({
+    "cx", "cy", "cz", "ch", "cs", "csdg", "csx", "cp", "cu1", "cu",
+    "crx", "cry", "crz", "rxx", "ryy", "rzz", "rzx",
+})
+
+# Instructions with no effect on the sampled distribution
+IGNORED_INSTRUCTIONS = frozenset({"barrier", "delay"})
+
+
+@dataclass
+class CircuitProfile:
+    """Structural summary of a circuit."""
+    num_qubits: int
+    num_clbits: int
+    gate_count: int = 0
+    two_qubit_gates: int = 0
+    max_gate_width: int = 0
+    clifford_gates: int = 0
+    # Bits of Schmidt rank gates can add across the cut after qubit k
+    cut_entangling_bits: list[int] = field(default_factory=list)
+    max_interaction_distance: int = 0
+    # qubit index → clbit index for terminal measurements
+    measurements: dict[int, int] = field(default_factory=dict)
+    # Why the fast (non-statevector) paths cannot take this circuit
+    unsupported: str = ""
+
+    @property
+    def clifford_fraction(self) -> float:
+        return self.clifford_gates / self.gate_count if self.gate_count else 1.0
+
+    @property
+    def is_clifford(self) -> bool:
+        return self.clifford_gates == self.gate_count
+
+    @property
+    def is_chain(self) -> bool:
+        """All two-qubit gates act on nearest neighbours."""
+        return self.max_interaction_distance <= 1
+
+    @property
+    def supports_fast_paths(self) -> bool:
+        return not self.unsupported
+
+
+def _is_clifford_angle(angle) -> bool:
+    try:
+        quarter_turns = float(angle) / (math.pi / 2)
+    except TypeError:  # unbound Parameter
+        return False
+    return abs(quarter_turns - round(quarter_turns)) < 1e-9
+
+
+def analyze_circuit(circuit) -> CircuitProfile:
+    """Profile a qiskit QuantumCircuit in one pass over its data."""
+    n = circuit.num_qubits
+    profile = CircuitProfile(
+        num_qubits=n,
+        num_clbits=circuit.num_clbits,
+        cut_entangling_bits=[0] * max(0, n - 1),
+    )
+    if circuit.parameters:
+        profile.unsupported = "unbound parameters"
+
+    measured: set[int] = set()
+    for instruction in circuit.data:
+        op = instruction.operation
+        name = op.name
+        if name in IGNORED_INSTRUCTIONS:
+            continue
+        qubits = [circuit.find_bit(q).index for q in instruction.qubits]
+
+        if name == "measure":
+            clbit = circuit.find_bit(instruction.clbits[0]).index
+            if qubits[0] in measured:
+                profile.unsupported = profile.unsupported or "repeated measurement"
+            measured.add(qubits[0])
+            profile.measurements[qubits[0]] = clbit
+            continue
+        if measured.intersection(qubits):
+            profile.unsupported = profile.unsupported or "mid-circuit measurement"
+        if not isinstance(op, Gate):
+            # reset, initialize, control flow, ...
+            profile.unsupported = profile.unsupported or f"non-unitary '{name}'"
+
+        profile.gate_count += 1
+        profile.max_gate_width = max(profile.max_gate_width, len(qubits))
+        if name in CLIFFORD_GATES or (
+            name in CLIFFORD_ROTATIONS
+            and all(_is_clifford_angle(p) for p in op.params)
+        ):
+            profile.clifford_gates += 1
+        if len(qubits) == 2:
+            profile.two_qubit_gates += 1
+            lo, hi = sorted(qubits)
+            profile.max_interaction_distance = max(
+                profile.max_interaction_distance, hi - lo
+            )
+            bits = 1 if name in RANK_TWO_GATES else 2
+            if hi - lo > 1:
+                bits += 1  # SWAP routing carries a qubit across the cut
+            for cut in range(lo, hi):
+                profile.cut_entangling_bits[cut] += bits
+
+    if profile.max_gate_width > 2:
+        profile.unsupported = profile.unsupported or "gates wider than two qubits"
+    return profile
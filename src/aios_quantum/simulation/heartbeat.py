@@ -0,0 +1,116 @@
+"""
+Heartbeat Family — closed-form sampling
+=======================================
+
+QuantumHeartbeat._create_heartbeat_circuit builds
+
+    H on every qubit → CX chain → Rz(θᵢ) per qubit → H on every qubit
+
+After the first H layer every qubit is |+⟩, an eigenstate of X, so each
+CX(|+⟩|+⟩) = |+⟩|+⟩ and the chain acts as the identity. What is left is
+a product state: qubit i reads 1 with probability
+
+    P(1) = sin²(θᵢ / 2)
+
+independently of the others. Sampling 2048 shots at 127 qubits is one
+uniform draw per bit — no statevector, no tensors.
+
+`match_heartbeat_family` accepts any circuit in this family: per qubit
+H, then CX gates among |+⟩ qubits, then diagonal phase gates, then H,
+then a terminal measurement (a qubit may stop after any stage).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+# Diagonal single-qubit gates → relative phase of |1⟩ (global phase dropped)
+_PHASE_GATES = {
+    "rz": None, "p": None, "u1": None,     # angle = params[0]
+    "z": math.pi, "s": math.pi / 2, "sdg": -math.pi / 2,
+    "t": math.pi / 4, "tdg": -math.pi / 4, "id": 0.0,
+}
+
+# Per-qubit stages
+_FRESH, _PLUS, _PHASED, _CLOSED = range(4)
+
+
+@dataclass
+class HeartbeatFamily:
+    """Independent per-qubit outcome probabilities of a matched circuit."""
+    p_one: np.ndarray                 # (num_qubits,) P(qubit reads 1)
+    measurements: dict[int, int]      # qubit → clbit
+    num_clbits: int
+
+    @property
+    def num_qubits(self) -> int:
+        return self.p_one.size
+
+    def probabilities(self) -> np.ndarray:
+        """Full 2ⁿ distribution in qiskit's little-endian order (small n)."""
+        probs = np.ones(1)
+        for p in self.p_one:
+            probs = np.kron(np.array([1.0 - p, p]), probs)
+        return probs
+
+    def sample(
+        self, shots: int, rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """Draw (shots, num_qubits) uint8 samples."""
+        rng = rng if rng is not None else np.random.default_rng()
+        return (rng.random((shots, self.num_qubits)) < self.p_one).astype(np.uint8)
+
+
+def match_heartbeat_family(circuit) -> Optional[HeartbeatFamily]:
+    """Return the closed form of `circuit`, or None if it is not in the family."""
+    if circuit.parameters:
+        return None
+    n = circuit.num_qubits
+    stage = [_FRESH] * n
+    phase = [0.0] * n
+    measurements: dict[int, int] = {}
+
+    for instruction in circuit.data:
+        op = instruction.operation
+        name = op.name
+        if name == "barrier":
+            continue
+        qubits = [circuit.find_bit(q).index for q in instruction.qubits]
+        if any(q in measurements for q in qubits):
+            return None
+
+        if name == "h":
+            q = qubits[0]
+            if stage[q] == _FRESH:
+                stage[q] = _PLUS
+            elif stage[q] in (_PLUS, _PHASED):
+                stage[q] = _CLOSED
+            else:
+                return None
+        elif name == "cx":
+            if any(stage[q] != _PLUS for q in qubits):
+                return None
+        elif name in _PHASE_GATES:
+            q = qubits[0]
+            if stage[q] not in (_PLUS, _PHASED):
+                return None
+            angle = _PHASE_GATES[name]
+            phase[q] += float(op.params[0]) if angle is None else angle
+            stage[q] = _PHASED
+        elif name == "measure":
+            measurements[qubits[0]] = circuit.find_bit(instruction.clbits[0]).index
+        else:
+            return None
+
+    # Qubits stopped before the closing H sit on the equator (or at |0⟩)
+    p_one = np.array([
+        math.sin(phase[q] / 2) ** 2 if stage[q] == _CLOSED
+        else 0.0 if stage[q] == _FRESH
+        else 0.5
+        for q in range(n)
+    ])
+    return HeartbeatFamily(p_one, measurements, circuit.num_clbits)
@@ -0,0 +1,243 @@
+"""
+Simulation Planner — route each circuit to its cheapest exact method
+====================================================================
+
+    profile = analyze_circuit(circuit)
+        small (≤ SMALL_CIRCUIT_QUBITS)      → statevector (reference)
+        heartbeat family                    → heartbeat_closed_form
+                                              (product state, O(n))
+        Clifford-only                       → stabilizer   O(n²) memory
+        bounded entanglement across cuts    → matrix_product_state
+        fits STATEVECTOR_MEMORY_LIMIT       → statevector
+        otherwise                           → matrix_product_state,
+                                              truncated at max_bond
+
+Circuits the fast paths cannot take (mid-circuit measurement, resets,
+control flow, 3+ qubit gates, unbound parameters) always go to the
+statevector. Every plan carries its memory estimate, and `simulate`
+reports the MPS truncation error so approximate runs are visible.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .analysis import IGNORED_INSTRUCTIONS, CircuitProfile, analyze_circuit
+from .heartbeat import HeartbeatFamily, match_heartbeat_family
+from .mps import (
+    DEFAULT_MAX_BOND,
+    MPSState,
+    estimate_bond_dimensions,
+    estimate_mps_bytes,
+)
+from .stabilizer import sample_stabilizer
+
+STATEVECTOR = "statevector"
+STABILIZER = "stabilizer"
+MATRIX_PRODUCT_STATE = "matrix_product_state"
+HEARTBEAT_CLOSED_FORM = "heartbeat_closed_form"
+
+METHODS = (STATEVECTOR, STABILIZER, MATRIX_PRODUCT_STATE, HEARTBEAT_CLOSED_FORM)
+
+# Backend name reported for results of each method
+BACKEND_NAMES = {
+    STATEVECTOR: "statevector_sampler",
+    STABILIZER: "stabilizer_simulator",
+    MATRIX_PRODUCT_STATE: "mps_simulator",
+    HEARTBEAT_CLOSED_FORM: "heartbeat_sampler",
+}
+
+# Up to this width the dense statevector is cheap and is the reference
+SMALL_CIRCUIT_QUBITS = 12
+
+# Largest dense statevector the planner will choose on its own (1 GiB)
+STATEVECTOR_MEMORY_LIMIT = 1 << 30
+
+
+@dataclass
+class SimulationPlan:
+    """Chosen method with its memory estimate and the reason for it."""
+    method: str
+    memory_bytes: int
+    reason: str
+    exact: bool = True
+    profile: Optional[CircuitProfile] = field(default=None, repr=False)
+    closed_form: Optional[HeartbeatFamily] = field(default=None, repr=False)
+
+    @property
+    def backend_name(self) -> str:
+        return BACKEND_NAMES[self.method]
+
+
+@dataclass
+class SimulationOutcome:
+    """Counts from a local simulation plus how they were produced."""
+    counts: dict[str, int]
+    plan: SimulationPlan
+    execution_time: float
+    truncation_error: float = 0.0
+
+
+def statevector_bytes(num_qubits: int) -> int:
+    return 16 * (1 << num_qubits)
+
+
+def stabilizer_bytes(num_qubits: int, shots: int) -> int:
+    # Tableau (2n × 2n+1 bools) plus the sampled bit matrix
+    return 2 * num_qubits * (2 * num_qubits + 1) + shots * num_qubits
+
+
+def mps_bytes(profile: CircuitProfile, shots: int, max_bond: int) -> int:
+    cuts = profile.cut_entangling_bits
+    chi = max(estimate_bond_dimensions(cuts, max_bond), default=1)
+    # Tensors plus the (shots × χ × 2) branch carried while sampling
+    return estimate_mps_bytes(cuts, max_bond) + 32 * shots * chi
+
+
+def plan_simulation(
+    circuit,
+    shots: int = 2048,
+    method: Optional[str] = None,
+    max_bond: int = DEFAULT_MAX_BOND,
+    profile: Optional[CircuitProfile] = None,
+) -> SimulationPlan:
+    """Pick a simulation method for `circuit` (or honour a forced one)."""
+    profile = profile or analyze_circuit(circuit)
+    n = profile.num_qubits
+    sv = statevector_bytes(n)
+
+    def plan(chosen: str, reason: str) -> SimulationPlan:
+        if chosen == HEARTBEAT_CLOSED_FORM:
+            memory = 8 * n + shots * n
+            return SimulationPlan(chosen, memory, reason, True, profile, family)
+        if chosen == STABILIZER:
+            memory = stabilizer_bytes(n, shots)
+            return SimulationPlan(chosen, memory, reason, True, profile)
+        if chosen == MATRIX_PRODUCT_STATE:
+            uncapped = estimate_bond_dimensions(profile.cut_entangling_bits, None)
+            exact = all(chi <= max_bond for chi in uncapped)
+            return SimulationPlan(
+                chosen, mps_bytes(profile, shots, max_bond), reason, exact, profile
+            )
+        return SimulationPlan(STATEVECTOR, sv, reason, True, profile)
+
+    wants_family = method == HEARTBEAT_CLOSED_FORM or (
+        method is None and n > SMALL_CIRCUIT_QUBITS
+    )
+    family = match_heartbeat_family(circuit) if wants_family else None
+
+    if method is not None:
+        if method == HEARTBEAT_CLOSED_FORM and family is None:
+            raise ValueError("circuit is not in the heartbeat family")
+        if method not in METHODS:
+            raise ValueError(f"unknown method {method!r}; expected one of {METHODS}")
+        if method != STATEVECTOR and not profile.supports_fast_paths:
+            raise ValueError(
+                f"{method} cannot simulate this circuit: {profile.unsupported}"
+            )
+        if method == STABILIZER and not profile.is_clifford:
+            raise ValueError("stabilizer method requires a Clifford-only circuit")
+        return plan(method, "requested")
+
+    if not profile.supports_fast_paths:
+        return plan(STATEVECTOR, profile.unsupported)
+    if n <= SMALL_CIRCUIT_QUBITS:
+        return plan(STATEVECTOR, f"{n} qubits")
+    if family is not None:
+        return plan(HEARTBEAT_CLOSED_FORM, "heartbeat family: product state")
+    if profile.is_clifford:
+        return plan(STABILIZER, "Clifford-only")
+    mps = plan(MATRIX_PRODUCT_STATE, "bounded entanglement across chain cuts")
+    if mps.exact and mps.memory_bytes < sv:
+        return mps
+    if sv <= STATEVECTOR_MEMORY_LIMIT:
+        return plan(STATEVECTOR, "dense state fits the memory limit")
+    mps.reason = f"statevector needs {sv:,} bytes; truncating at χ={max_bond}"
+    return mps
+
+
+def bits_to_counts(
+    bits: np.ndarray, measurements: dict[int, int], num_clbits: int
+) -> dict[str, int]:
+    """
+    Turn (shots, num_qubits) samples into qiskit-style counts.
+
+    Clbit 0 is the rightmost character; unmeasured clbits read 0.
+    """
+    shots = bits.shape[0]
+    clbits = np.zeros((shots, num_clbits), dtype=np.uint8)
+    for qubit, clbit in measurements.items():
+        clbits[:, clbit] = bits[:, qubit]
+    chars = (clbits[:, ::-1] + ord("0")).astype(np.uint8)
+    keys = np.ascontiguousarray(chars).view(f"S{num_clbits}").ravel()
+    unique, counts = np.unique(keys, return_counts=True)
+    return {k.decode(): int(c) for k, c in zip(unique, counts)}
+
+
+def _run_statevector(circuit, shots: int, seed: Optional[int]) -> dict[str, int]:
+    from qiskit.primitives import StatevectorSampler
+
+    result = StatevectorSampler(seed=seed).run([circuit], shots=shots).result()
+    return result[0].join_data().get_counts()
+
+
+def _run_mps(circuit, profile, shots, max_bond, rng) -> tuple[np.ndarray, float]:
+    state = MPSState(profile.num_qubits, max_bond=max_bond)
+    for instruction in circuit.data:
+        op = instruction.operation
+        if op.name in IGNORED_INSTRUCTIONS or op.name == "measure":
+            continue
+        qubits = [circuit.find_bit(q).index for q in instruction.qubits]
+        matrix = np.asarray(op.to_matrix(), dtype=np.complex128)
+        if len(qubits) == 1:
+            state.apply_1q(matrix, qubits[0])
+        else:
+            state.apply_2q(matrix, qubits[0], qubits[1])
+    return state.sample(shots, rng), state.truncation_error
+
+
+def simulate(
+    circuit,
+    shots: int = 2048,
+    method: Optional[str] = None,
+    seed: Optional[int] = None,
+    max_bond: int = DEFAULT_MAX_BOND,
+) -> SimulationOutcome:
+    """Plan and run a local simulation; unmeasured circuits measure all qubits."""
+    if circuit.num_clbits == 0:
+        circuit = circuit.measure_all(inplace=False)
+    plan = plan_simulation(circuit, shots, method, max_bond)
+    profile = plan.profile
+    rng = np.random.default_rng(seed)
+    truncation = 0.0
+
+    t0 = time.time()
+    clifford = None
+    if plan.method == STABILIZER:
+        from qiskit.exceptions import QiskitError
+        from qiskit.quantum_info import Clifford
+
+        try:
+            clifford = Clifford(circuit.remove_final_measurements(inplace=False))
+        except QiskitError as e:
+            if method is not None:
+                raise ValueError(f"stabilizer method failed: {e}") from e
+            plan = plan_simulation(circuit, shots, STATEVECTOR, max_bond, profile)
+            plan.reason = f"Clifford conversion failed: {e}"
+
+    if plan.method == STATEVECTOR:
+        counts = _run_statevector(circuit, shots, seed)
+    else:
+        if plan.closed_form is not None:
+            bits = plan.closed_form.sample(shots, rng)
+        elif clifford is not None:
+            bits = sample_stabilizer(clifford, shots, rng)
+        else:
+            bits, truncation = _run_mps(circuit, profile, shots, max_bond, rng)
+        counts = bits_to_counts(bits, profile.measurements, profile.num_clbits)
+    elapsed = time.time() - t0
+    return SimulationOutcome(counts, plan, elapsed, truncation)
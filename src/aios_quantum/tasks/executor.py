@@ -23,8 +23,8 @@ from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from qiskit import QuantumCircuit
 from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
-from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
+from ..circuits.transpile_cache import cached_transpile
 from .task_queue import QuantumTask, TaskStatus
 
 
@@ -177,11 +177,8 @@ class IBMQuantumExecutor:
             else str(type(backend).__name__)
         )
         
-        # Transpile for backend
-        pm = generate_preset_pass_manager(
-            backend=backend, optimization_level=1
-        )
-        transpiled = pm.run(circuit)
+        # Transpile for backend (cached per circuit structure)
+        transpiled = cached_transpile(circuit, backend, optimization_level=1)
         
         # Execute
         sampler = SamplerV2(backend)
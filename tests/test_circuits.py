@@ -7,7 +7,13 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from aios_quantum.circuits import create_bell_state, create_ghz_state
+from aios_quantum.circuits import (
+    TranspileCache,
+    create_bell_state,
+    create_ghz_state,
+    transpile_for_backend,
+)
+from aios_quantum.circuits.transpile_cache import parameterize
 
 
 class TestBellState:
@@ -59,3 +65,95 @@ class TestGHZState:
         circuit = create_ghz_state()
         ops = circuit.count_ops()
         assert "measure" in ops
+
+
+def rotation_circuit(angle: float, n: int = 4) -> QuantumCircuit:
+    """Heartbeat-shaped circuit whose only variation is the Rz angle."""
+    qc = QuantumCircuit(n)
+    qc.h(range(n))
+    for i in range(n - 1):
+        qc.cx(i, i + 1)
+    for i in range(n):
+        qc.rz(angle * (i + 1), i)
+    qc.h(range(n))
+    qc.measure_all()
+    return qc
+
+
+class TestTranspileCache:
+    """Tests for the structural transpilation cache."""
+
+    @pytest.fixture
+    def backend(self):
+        from qiskit.providers.fake_provider import GenericBackendV2
+        return GenericBackendV2(6, seed=7)
+
+    def test_structure_key_ignores_angles(self):
+        _, angles_a, values_a, key_a = parameterize(rotation_circuit(0.3))
+        _, _, values_b, key_b = parameterize(rotation_circuit(1.1))
+        assert key_a == key_b
+        assert len(angles_a) == 4
+        assert values_a != values_b
+        other = rotation_circuit(0.3, n=3)
+        assert parameterize(other)[3] != key_a
+
+    def test_reuses_template_and_binds_angles(self, backend):
+        from qiskit.quantum_info import Operator
+        cache = TranspileCache()
+        for angle in (0.3, 0.7, 1.9):
+            qc = rotation_circuit(angle)
+            transpiled = cache.transpile(qc, backend)
+            assert transpiled.num_parameters == 0
+            expected = cache._run(qc, backend, 1)
+            assert Operator(
+                transpiled.remove_final_measurements(inplace=False)
+            ).equiv(Operator(expected.remove_final_measurements(inplace=False)))
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_key_includes_optimization_level(self, backend):
+        cache = TranspileCache()
+        cache.transpile(rotation_circuit(0.3), backend, optimization_level=1)
+        cache.transpile(rotation_circuit(0.3), backend, optimization_level=2)
+        assert cache.misses == 2
+
+    def test_lru_eviction(self, backend):
+        cache = TranspileCache(max_entries=2)
+        for n in (2, 3, 4):
+            cache.transpile(rotation_circuit(0.1, n), backend)
+        assert len(cache) == 2
+        cache.transpile(rotation_circuit(0.1, 2), backend)
+        assert cache.misses == 4
+
+    def test_angle_names_avoid_circuit_parameters(self, backend):
+        from qiskit.circuit import Parameter
+        qc = QuantumCircuit(1)
+        qc.rx(0.3, 0)
+        qc.ry(Parameter("_angle0"), 0)
+        transpiled = TranspileCache().transpile(qc, backend)
+        assert [p.name for p in transpiled.parameters] == ["_angle0"]
+
+    def test_calibration_read_once_per_ttl(self, backend):
+        calls = []
+
+        class Properties:
+            last_update_date = "2026-10-18T00:00:00Z"
+
+        def properties():
+            calls.append(1)
+            return Properties()
+
+        backend.properties = properties
+        now = [0.0]
+        cache = TranspileCache(calibration_ttl=60, clock=lambda: now[0])
+        for angle in (0.1, 0.2, 0.3):
+            cache.transpile(rotation_circuit(angle), backend)
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+        now[0] = 61.0
+        cache.transpile(rotation_circuit(0.4), backend)
+        assert len(calls) == 2
+        assert cache.hits == 3
+
+    def test_transpile_for_backend_uses_cache(self, backend):
+        transpiled = transpile_for_backend(create_bell_state(), backend)
+        assert transpiled.count_ops().get("measure") == 2
@@ -0,0 +1,605 @@
+"""Tests for the quantum entropy extractor."""
+
+import hashlib
+import json
+import socket
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from aios_quantum.entropy import QuantumBitGenerator, QuantumEntropyExtractor, quality
+from aios_quantum.entropy.checkpoint import read_checkpoint, write_checkpoint
+from aios_quantum.entropy.conditioning import ToeplitzConditioner, get_conditioner
+from aios_quantum.entropy.pool import EntropyPool
+from aios_quantum.entropy.quantum_entropy_extractor import _parse_address
+from aios_quantum.entropy.signature import NoiseSignature
+
+
+def make_beat(index: int) -> dict:
+    """A small noisy heartbeat result."""
+    return {
+        "timestamp": f"2025-12-10T00:{index:02d}:00",
+        "backend": "test_backend",
+        "num_qubits": 3,
+        "measurement_counts": {
+            "000": 900 + index,
+            "111": 850,
+            "010": 40 + index,
+            "101": 30,
+            "100": 12,
+        },
+    }
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    """Extractor fed with a few in-memory beats."""
+    qe = QuantumEntropyExtractor(results_dir=str(tmp_path), auto_load=False)
+    for i in range(5):
+        qe.ingest_heartbeat(make_beat(i))
+    return qe
+
+
+def twin_extractors(tmp_path):
+    """Two extractors with identical pools."""
+    pair = []
+    for _ in range(2):
+        qe = QuantumEntropyExtractor(results_dir=str(tmp_path), auto_load=False)
+        for i in range(5):
+            qe.ingest_heartbeat(make_beat(i))
+        pair.append(qe)
+    return pair
+
+
+class TestBulkAPI:
+    """Test NumPy-style bulk sampling."""
+
+    def test_random_array_matches_scalar(self, tmp_path):
+        """Bulk floats should equal the scalar stream value-for-value."""
+        bulk, scalar = twin_extractors(tmp_path)
+        n = bulk.pool_size // 8
+        values = bulk.random_array(n)
+        expected = [scalar.random() for _ in range(n)]
+        np.testing.assert_array_equal(values, expected)
+        assert values.min() >= 0.0 and values.max() < 1.0
+
+    def test_normal_shape_and_moments(self, extractor):
+        """Normal samples should have the requested shape and moments."""
+        z = extractor.normal(2.0, 3.0, size=(200, 50))
+        assert z.shape == (200, 50)
+        assert z.mean() == pytest.approx(2.0, abs=0.2)
+        assert z.std() == pytest.approx(3.0, rel=0.1)
+        assert isinstance(extractor.normal(), float)
+
+    def test_integers_in_range(self, extractor):
+        """Integers should fall in [low, high) and cover it."""
+        values = extractor.integers(-3, 4, size=5000)
+        assert values.min() == -3 and values.max() == 3
+        assert set(np.unique(values)) == set(range(-3, 4))
+
+    def test_integers_span_must_fit_int64(self, extractor):
+        """Ranges wider than int64 should be rejected like NumPy does."""
+        top = np.iinfo(np.int64).max
+        assert 0 <= extractor.integers(top) < top
+        with pytest.raises(ValueError):
+            extractor.integers(-1, top)
+        with pytest.raises(ValueError):
+            extractor.integers(0, 2**64)
+
+    def test_weighted_choice(self, extractor):
+        """Weighted choice should follow p and never pick zero weights."""
+        picks = extractor.choice(["a", "b", "c"], size=20000, p=[0.7, 0.0, 0.3])
+        assert "b" not in picks
+        assert np.mean(picks == "a") == pytest.approx(0.7, abs=0.03)
+
+    def test_choice_without_replacement(self, extractor):
+        """Sampling without replacement should return distinct items."""
+        picks = extractor.choice(100, size=100, replace=False)
+        assert sorted(picks.tolist()) == list(range(100))
+
+    def test_choice_from_int_and_array(self, extractor):
+        """Scalar choice should accept an int or an ndarray like NumPy."""
+        assert 0 <= extractor.choice(5) < 5
+        assert extractor.choice(np.arange(5, 10)) in range(5, 10)
+        with pytest.raises(ValueError):
+            extractor.choice(np.array([]))
+
+    def test_choice_validates_p(self, extractor):
+        """Bad weights should raise the way NumPy does."""
+        with pytest.raises(ValueError, match="Fewer non-zero"):
+            extractor.choice(5, size=3, replace=False, p=[0, 0, 0, 0.5, 0.5])
+        with pytest.raises(ValueError, match="sum to 1"):
+            extractor.choice(3, size=2, p=[0.0, 0.0, 0.0])
+        with pytest.raises(ValueError, match="sum to 1"):
+            extractor.choice(3, p=[1.0, 1.0, 1.0])
+
+    def test_numpy_generator(self, extractor):
+        """The extractor should plug into numpy.random.Generator."""
+        rng = np.random.Generator(QuantumBitGenerator(extractor))
+        values = rng.random(1000)
+        assert values.shape == (1000,)
+        assert 0.0 <= values.min() and values.max() < 1.0
+        assert rng.integers(0, 10, size=100).max() < 10
+        assert isinstance(extractor.generator(), np.random.Generator)
+
+
+class TestEntropyPool:
+    """Test the ring-buffer entropy pool."""
+
+    def test_wraparound_preserves_order(self):
+        """Reads should return bytes in write order across the wrap."""
+        pool = EntropyPool(capacity=8)
+        pool.write(b"abcdef")
+        assert pool.read(4) == b"abcd"
+        pool.write(b"ghijk")
+        assert pool.available == 7
+        buf = bytearray(7)
+        assert pool.readinto(buf) == 7
+        assert bytes(buf) == b"efghijk"
+        assert pool.tail(3) == b"ijk"
+
+    def test_overflow_is_folded(self):
+        """Writes past capacity should XOR into unread bytes."""
+        pool = EntropyPool(capacity=4)
+        assert pool.write(b"\x01\x02\x03\x04\xff\xff") == 4
+        assert pool.available == 4
+        assert pool.read(4) == b"\xfe\xfd\x03\x04"
+
+    def test_short_read(self):
+        """Reading more than available should return what is there."""
+        pool = EntropyPool(capacity=16)
+        pool.write(b"xyz")
+        assert pool.read(10) == b"xyz"
+        assert pool.available == 0
+
+
+class TestNoiseSignature:
+    """Test the bounded streaming noise signature."""
+
+    def test_window_is_bounded(self):
+        """Only the most recent values should be kept."""
+        sig = NoiseSignature(window_size=5)
+        sig.extend([0.1, 0.2, 0.3])
+        sig.extend([0.4, 0.5, 0.6, 0.7])
+        assert len(sig) == 7
+        np.testing.assert_allclose(sig.values(), [0.3, 0.4, 0.5, 0.6, 0.7])
+        sig.extend(np.arange(10) / 100)
+        np.testing.assert_allclose(sig.values(), np.arange(5, 10) / 100)
+
+    def test_summary_covers_full_history(self):
+        """Streaming statistics should match the full data set."""
+        data = np.random.default_rng(7).random(1000)
+        sig = NoiseSignature(window_size=16)
+        for chunk in np.array_split(data, 37):
+            sig.extend(chunk)
+        summary = sig.summary()
+        assert summary["count"] == 1000
+        assert summary["mean"] == pytest.approx(data.mean())
+        assert summary["variance"] == pytest.approx(data.var())
+        assert summary["min"] == data.min() and summary["max"] == data.max()
+
+    def test_digest_matches_joined_history(self):
+        """The digest should cover every value, not just the window."""
+        sig = NoiseSignature(window_size=2)
+        values = [0.01, 0.02, 0.03, 0.04]
+        sig.extend(values[:1])
+        sig.extend(values[1:])
+        joined = ":".join(f"{p:.15f}" for p in values)
+        assert sig.digest() == hashlib.sha512(joined.encode()).digest()
+
+
+class TestExtractorPool:
+    """Test extractor consumption and refill."""
+
+    def test_readinto_caller_buffer(self, extractor):
+        """readinto should fill numpy arrays and bytearrays in place."""
+        words = np.zeros(16, dtype=np.uint64)
+        assert extractor.readinto(words) == 128
+        assert np.count_nonzero(words) > 0
+
+    def test_refill_to_high_watermark(self, tmp_path):
+        """Draining the pool should top it up to the high watermark."""
+        qe = QuantumEntropyExtractor(
+            results_dir=str(tmp_path), auto_load=False,
+            pool_capacity=1024, low_watermark=64, high_watermark=512,
+        )
+        qe.ingest_heartbeat(make_beat(0))
+        qe.quantum_bytes(qe.pool_size)
+        qe.random()
+        assert qe.pool_size == 512 - 8
+        big = qe.quantum_bytes(5000)
+        assert len(big) == 5000
+
+    def test_noise_hash_matches_full_join(self, extractor):
+        """Running noise digest should equal hashing the joined signature."""
+        joined = ":".join(f"{p:.15f}" for p in extractor.noise_signature)
+        expected = hashlib.sha512(joined.encode()).digest()
+        assert extractor._noise.digest() == expected
+
+
+class TestBatchIngestion:
+    """Test the batched heartbeat ingestion path."""
+
+    def test_batch_matches_serial(self, tmp_path):
+        """A batch should fill the pool exactly like serial ingestion."""
+        serial = QuantumEntropyExtractor(results_dir=str(tmp_path), auto_load=False)
+        batch = QuantumEntropyExtractor(results_dir=str(tmp_path), auto_load=False)
+        beats = [make_beat(i) for i in range(12)]
+        for beat in beats:
+            serial.ingest_heartbeat(beat)
+        extracted = batch.ingest_heartbeats(beats + [{"counts": {}}], workers=4)
+        assert extracted == serial.pool_size == batch.pool_size
+        assert batch.beats_loaded == 12
+        assert batch.quantum_bytes(extracted) == serial.quantum_bytes(extracted)
+        assert batch.total_entropy_bits == pytest.approx(serial.total_entropy_bits)
+        assert batch._noise.digest() == serial._noise.digest()
+
+    def test_directory_skips_seen_and_corrupt(self, tmp_path):
+        """Directory ingestion should skip corrupt and already-seen files."""
+        for i in range(6):
+            (tmp_path / f"beat_{i}.json").write_text(json.dumps(make_beat(i)))
+        (tmp_path / "broken.json").write_text("{not json")
+        qe = QuantumEntropyExtractor(results_dir=str(tmp_path), auto_load=False)
+        assert qe.ingest_directory(workers=3) == 6
+        assert qe.beats_loaded == 6
+        assert qe.ingest_new_files() == 0
+
+
+class TestConditioning:
+    """Test the pluggable conditioning backends."""
+
+    @pytest.mark.parametrize("name", ["sha512", "blake2b", "shake256", "toeplitz"])
+    def test_backends_are_deterministic(self, tmp_path, name):
+        """Each backend should give identical pools for identical beats."""
+        pools = []
+        for _ in range(2):
+            qe = QuantumEntropyExtractor(
+                results_dir=str(tmp_path), auto_load=False, conditioner=name
+            )
+            extracted = qe.ingest_heartbeat(make_beat(1))
+            assert extracted > 0 and qe.status()["conditioner"] == name
+            pools.append(qe.quantum_bytes(extracted))
+        assert pools[0] == pools[1]
+
+    def test_toeplitz_is_linear_and_compressing(self):
+        """Toeplitz hashing is GF(2)-linear and shrinks by the set ratio."""
+        t = ToeplitzConditioner(input_bits=256, output_bits=64)
+        a, b = bytes(range(64)), bytes(range(64, 128))
+        xor = bytes(x ^ y for x, y in zip(a, b))
+        out_a, out_b = t.condition(a, 1 << 10), t.condition(b, 1 << 10)
+        assert len(out_a) == 2 * 64 // 8
+        assert t.condition(xor, 1 << 10) == bytes(
+            x ^ y for x, y in zip(out_a, out_b)
+        )
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            get_conditioner("md5")
+
+    def test_benchmark_covers_all_backends(self):
+        bench = quality.benchmark_conditioning(
+            [make_beat(i) for i in range(3)], min_seconds=0.01
+        )
+        assert set(bench) == {"sha512", "blake2b", "shake256", "toeplitz"}
+        assert bench["toeplitz"]["bytes_per_beat"] < bench["sha512"]["bytes_per_beat"]
+
+
+class TestBackgroundRefill:
+    """Test the background heartbeat watcher."""
+
+    def test_worker_ingests_new_files_and_tops_up(self, tmp_path):
+        """New beat files should be picked up and the pool kept full."""
+        (tmp_path / "beat_0.json").write_text(json.dumps(make_beat(0)))
+        qe = QuantumEntropyExtractor(
+            results_dir=str(tmp_path), high_watermark=8192,
+        )
+        assert qe.beats_loaded == 1
+
+        worker = qe.start_background_refill(poll_interval=0.05)
+        try:
+            (tmp_path / "beat_1.json").write_text(json.dumps(make_beat(1)))
+            deadline = time.time() + 5
+            while qe.beats_loaded < 2 and time.time() < deadline:
+                time.sleep(0.02)
+            assert qe.beats_loaded == 2
+            assert qe.pool_size >= 8192
+            assert worker.files_ingested == 1
+        finally:
+            qe.stop_background_refill(timeout=5)
+        assert not worker.is_alive()
+
+    def test_already_ingested_files_skipped(self, tmp_path):
+        """ingest_new_files should not re-ingest known files."""
+        (tmp_path / "beat_0.json").write_text(json.dumps(make_beat(0)))
+        qe = QuantumEntropyExtractor(results_dir=str(tmp_path))
+        assert qe.ingest_new_files() == 0
+        assert qe.beats_loaded == 1
+
+
+class TestConcurrency:
+    """Test thread sub-pools and the multi-process entropy service."""
+
+    def test_threads_draw_disjoint_bytes(self, tmp_path):
+        """Concurrent threads should never receive the same pool bytes."""
+        qe = QuantumEntropyExtractor(
+            results_dir=str(tmp_path), auto_load=False, subpool_bytes=256,
+        )
+        qe.ingest_heartbeat(make_beat(0))
+        results = {}
+
+        def draw(name):
+            results[name] = [qe.random() for _ in range(2000)]
+
+        threads = [threading.Thread(target=draw, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        values = [v for vals in results.values() for v in vals]
+        assert len(values) == 16000
+        assert len(set(values)) == len(values)
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX")
+    def test_client_draws_from_server(self, tmp_path, extractor):
+        """A connected extractor should be fed by the server's pool."""
+        address = str(tmp_path / "entropy.sock")
+        server = extractor.serve(address)
+        try:
+            client = QuantumEntropyExtractor.connect(address, high_watermark=1024)
+            before = extractor.pool_size
+            values = client.random_array(100)
+            assert values.shape == (100,)
+            assert client.beats_loaded == 0
+            assert extractor.pool_size < before
+        finally:
+            server.stop()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs AF_UNIX")
+    def test_unix_socket_is_owner_only(self, tmp_path, extractor):
+        """The socket is 0600 and a non-socket path is never unlinked."""
+        address = tmp_path / "entropy.sock"
+        with extractor.serve(str(address)):
+            assert address.stat().st_mode & 0o777 == 0o600
+        address.write_text("not a socket")
+        with pytest.raises(FileExistsError):
+            extractor.serve(str(address))
+        assert address.read_text() == "not a socket"
+
+    @pytest.mark.skipif(not socket.has_ipv6, reason="needs IPv6")
+    def test_client_over_ipv6_loopback(self, extractor):
+        """An IPv6 loopback host should be served over AF_INET6."""
+        try:
+            server = extractor.serve(("::1", 0))
+        except OSError:
+            pytest.skip("IPv6 loopback unavailable")
+        try:
+            client = QuantumEntropyExtractor.connect(server.address)
+            assert len(client.quantum_bytes(100)) == 100
+        finally:
+            server.stop()
+
+    def test_upstream_fetch_runs_outside_lock(self, extractor):
+        """Other threads can take the extractor lock during a server fetch."""
+
+        class Upstream:
+            def read(self, n):
+                taken = []
+                t = threading.Thread(
+                    target=lambda: taken.append(client._lock.acquire(timeout=1))
+                )
+                t.start()
+                t.join()
+                if taken[0]:
+                    client._lock.release()
+                assert taken == [True]
+                return extractor.quantum_bytes(n)
+
+        client = QuantumEntropyExtractor(upstream=Upstream())
+        assert 0.0 <= client.random() < 1.0
+        assert len(client.quantum_bytes(5000)) == 5000
+
+    def test_client_over_tcp(self, extractor):
+        """The service should also work over localhost TCP."""
+        server = extractor.serve(("127.0.0.1", 0))
+        try:
+            client = QuantumEntropyExtractor.connect(server.address)
+            assert len(client.quantum_bytes(5000)) == 5000
+        finally:
+            server.stop()
+
+    def test_tcp_is_local_only(self, extractor):
+        """Non-loopback hosts need an explicit opt-in."""
+        with pytest.raises(ValueError, match="local-only"):
+            extractor.serve(("0.0.0.0", 0))
+        with pytest.raises(ValueError, match="local-only"):
+            _parse_address("10.0.0.5:7000")
+        assert _parse_address("localhost:7000") == ("localhost", 7000)
+        assert _parse_address("10.0.0.5:7000", allow_remote=True) == (
+            "10.0.0.5", 7000,
+        )
+
+
+class TestCheckpoint:
+    """Test persistent extractor checkpoints."""
+
+    def test_restore_skips_ingested_files(self, tmp_path):
+        """A restored extractor should only hash beats that are new."""
+        beats = tmp_path / "beats"
+        beats.mkdir()
+        for i in range(3):
+            (beats / f"beat_{i}.json").write_text(json.dumps(make_beat(i)))
+        ckpt = tmp_path / "entropy.npz"
+
+        first = QuantumEntropyExtractor(results_dir=str(beats), checkpoint_path=ckpt)
+        first.save_checkpoint()
+
+        (beats / "beat_3.json").write_text(json.dumps(make_beat(3)))
+        restored = QuantumEntropyExtractor(
+            results_dir=str(beats), checkpoint_path=ckpt
+        )
+        assert restored.beats_loaded == 4
+        assert restored.status()["files_ingested"] == 4
+        assert restored.noise_summary["count"] == (
+            first.noise_summary["count"] + 3
+        )
+
+    def test_restored_state_matches(self, tmp_path, extractor):
+        """Pool size, counters and signature should survive a round trip."""
+        ckpt = tmp_path / "ckpt.npz"
+        extractor.random_array(10)
+        extractor.save_checkpoint(ckpt)
+        restored = QuantumEntropyExtractor(
+            results_dir=str(tmp_path), auto_load=False, checkpoint_path=ckpt
+        )
+        assert restored.pool_size == extractor.pool_size
+        assert restored.beats_loaded == extractor.beats_loaded
+        assert restored.noise_signature == extractor.noise_signature
+        assert restored.noise_summary == extractor.noise_summary
+
+    def test_restores_do_not_share_streams(self, tmp_path, extractor):
+        """Two processes restoring one checkpoint must diverge."""
+        ckpt = tmp_path / "ckpt.npz"
+        extractor.save_checkpoint(ckpt)
+        a, b = (
+            QuantumEntropyExtractor(
+                results_dir=str(tmp_path), auto_load=False, checkpoint_path=ckpt
+            )
+            for _ in range(2)
+        )
+        assert a.quantum_bytes(64) != b.quantum_bytes(64)
+
+    def test_foreign_checkpoint_ignored(self, tmp_path, extractor):
+        """A checkpoint for another results directory should be skipped."""
+        ckpt = tmp_path / "ckpt.npz"
+        extractor.save_checkpoint(ckpt)
+        other = tmp_path / "other"
+        other.mkdir()
+        qe = QuantumEntropyExtractor(results_dir=str(other), checkpoint_path=ckpt)
+        assert qe.beats_loaded == 0
+
+    def test_truncated_checkpoint_falls_back(self, tmp_path, extractor):
+        """A checkpoint cut short mid-write should trigger a full reload."""
+        ckpt = tmp_path / "ckpt.npz"
+        extractor.save_checkpoint(ckpt)
+        ckpt.write_bytes(ckpt.read_bytes()[:200])
+        with pytest.raises(ValueError, match="unreadable checkpoint"):
+            read_checkpoint(ckpt)
+        qe = QuantumEntropyExtractor(results_dir=str(tmp_path), checkpoint_path=ckpt)
+        assert qe.beats_loaded == 0
+
+    def test_bad_checkpoint_meta_falls_back(self, tmp_path, extractor):
+        """Malformed metadata should raise ValueError, not KeyError/TypeError."""
+        ckpt = tmp_path / "ckpt.npz"
+        extractor.save_checkpoint(ckpt)
+        meta, arrays = read_checkpoint(ckpt)
+        meta.pop("version")
+        for noise in ({"window_size": "wide"}, None):
+            write_checkpoint(ckpt, {**meta, "noise": noise}, arrays)
+            with pytest.raises(ValueError, match="corrupt checkpoint"):
+                extractor.load_checkpoint(ckpt)
+            qe = QuantumEntropyExtractor(
+                results_dir=str(tmp_path), checkpoint_path=ckpt
+            )
+            assert qe.beats_loaded == 0
+
+
+def bit_string(s):
+    """Bit array from a '0101...' string."""
+    return np.array([int(c) for c in s], dtype=np.uint8)
+
+
+class TestRandomnessSuite:
+    """Check statistical tests against SP 800-22 worked examples."""
+
+    def test_monobit_example(self):
+        result = quality.monobit_test(bit_string("1011010101"))
+        assert result.p_value == pytest.approx(0.527089, abs=1e-6)
+
+    def test_runs_example(self):
+        result = quality.runs_test(bit_string("1001101011"))
+        assert result.p_value == pytest.approx(0.147232, abs=1e-6)
+
+    def test_block_frequency_example(self):
+        result = quality.block_frequency_test(bit_string("0110011010"), block_size=3)
+        assert result.p_value == pytest.approx(0.801252, abs=1e-6)
+
+    def test_approximate_entropy_example(self):
+        result = quality.approximate_entropy_test(bit_string("0100110101"), m=3)
+        assert result.p_value == pytest.approx(0.261961, abs=1e-6)
+
+    def test_serial_example(self):
+        result = quality.serial_test(bit_string("0011011101"), m=3)
+        assert result.details["p_value1"] == pytest.approx(0.808792, abs=1e-6)
+        assert result.details["p_value2"] == pytest.approx(0.670320, abs=1e-6)
+
+    def test_constant_stream_fails(self):
+        """All-zero output should fail the suite."""
+        results = quality.run_randomness_tests(bytes(4096))
+        assert not any(r.passed for r in results)
+
+    def test_bytes_and_bits_agree(self, extractor):
+        """A corpus and its unpacked bits should give identical results."""
+        data = extractor.quantum_bytes(4096)
+        as_bytes = quality.run_randomness_tests(data)
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+        as_bits = quality.run_randomness_tests(bits)
+        assert as_bytes == as_bits
+        assert as_bytes[0].details["n"] == 8 * 4096
+
+    def test_inapplicable_runs_test_is_valid_json(self):
+        """A skipped runs test should report no statistic, not NaN."""
+        results = quality.run_randomness_tests(bytes(4096))
+        assert results[1].statistic is None
+        json.dumps([asdict(r) for r in results], allow_nan=False)
+
+    def test_report_on_extractor(self, extractor):
+        """The report should cover every test and every throughput path."""
+        report = quality.quality_report(
+            extractor, megabytes=0.05, benchmark_seconds=0.01
+        )
+        assert len(report["tests"]) == 5
+        assert set(report["throughput_bytes_per_sec"]) == {
+            "quantum_bytes", "random", "hash_chain",
+        }
+
+
+class TestWeightedSampling:
+    """Test alias-table sampling and vectorized sample/shuffle."""
+
+    def test_alias_sampler_distribution(self, extractor):
+        """Draw frequencies should follow the weights."""
+        sampler = extractor.weighted_sampler("abcd", [5, 0, 1, 4])
+        picks = np.array(sampler.draw(40000))
+        assert "b" not in picks
+        for item, expected in zip("acd", (0.5, 0.1, 0.4)):
+            assert np.mean(picks == item) == pytest.approx(expected, abs=0.015)
+
+    def test_choices_uses_weights(self, extractor):
+        """choices should honour weights and k."""
+        picks = extractor.choices(["x", "y"], weights=[0.0, 1.0], k=50)
+        assert picks == ["y"] * 50
+        assert len(extractor.choices(range(10), k=7)) == 7
+
+    def test_invalid_weights(self, extractor):
+        """Zero-total or negative weights should be rejected."""
+        with pytest.raises(ValueError):
+            extractor.weighted_sampler("ab", [0, 0])
+        with pytest.raises(ValueError):
+            extractor.weighted_sampler("ab", [1, -1])
+
+    def test_sample_and_shuffle(self, extractor):
+        """sample should be distinct; shuffle should permute in place."""
+        picks = extractor.sample(range(1000), 50)
+        assert len(set(picks)) == 50
+        items = list(range(100))
+        extractor.shuffle(items)
+        assert sorted(items) == list(range(100))
+        assert items != list(range(100))
@@ -2,6 +2,12 @@
 Tests for the Quantum Heartbeat module.
 """
 
+import asyncio
+import dataclasses
+import json
+import threading
+import time
+import numpy as np
 import pytest
 from pathlib import Path
 import sys
@@ -12,7 +18,12 @@ from aios_quantum.heartbeat import (
     QuantumHeartbeat,
     HeartbeatConfig,
     HeartbeatResult,
+    HeartbeatGroup,
+    heartbeat_phases,
+    parse_scatter_target,
     test_heartbeat,
+    ResultWriter,
+    read_result_log,
 )
 
 
@@ -113,6 +124,7 @@ class TestQuantumHeartbeat:
         )
         heartbeat = QuantumHeartbeat(config)
         heartbeat.single_beat()
+        assert heartbeat.flush(timeout=5)
 
         # Check file was created
         result_files = list(heartbeat.results_path.glob("*.json"))
@@ -147,6 +159,373 @@ class TestQuantumHeartbeat:
         assert heartbeat.beat_count == 0
 
 
+class TestAsyncHeartbeat:
+    """Test the asyncio fixed-rate scheduler."""
+
+    def _heartbeat(self, tmp_path, interval=0.05, **kwargs):
+        config = HeartbeatConfig(
+            use_simulator=True,
+            num_qubits=3,
+            shots=100,
+            interval_seconds=interval,
+            results_dir=str(tmp_path / "results"),
+            **kwargs,
+        )
+        return QuantumHeartbeat(config)
+
+    def test_runs_max_beats_and_callbacks(self, tmp_path):
+        """Should save every beat and run sync and async callbacks."""
+        heartbeat = self._heartbeat(tmp_path)
+        seen, uploaded = [], []
+
+        async def upload(result, path):
+            await asyncio.sleep(0)
+            uploaded.append(path)
+
+        asyncio.run(heartbeat.run_async(
+            max_beats=3,
+            on_result=[lambda r, p: seen.append(r.beat_number), upload],
+        ))
+
+        assert heartbeat.beat_count == 3
+        assert [r.beat_number for r in heartbeat.results] == [0, 1, 2]
+        assert sorted(seen) == [0, 1, 2]
+        assert all(p.exists() for p in uploaded)
+        assert len(list(heartbeat.results_path.glob("beat_*.json"))) == 3
+        assert not heartbeat.running
+
+    def test_fixed_rate_does_not_drift(self, tmp_path):
+        """Beat start times should follow the clock, not accumulate work."""
+        heartbeat = self._heartbeat(tmp_path, interval=0.2)
+        execute = heartbeat._execute_beat
+        starts = []
+
+        def slow_beat(number):
+            starts.append(time.monotonic())
+            time.sleep(0.1)
+            return execute(number)
+
+        heartbeat._execute_beat = slow_beat
+        asyncio.run(heartbeat.run_async(max_beats=4))
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert len(starts) == 4
+        # Sleeping after each beat would give gaps of ~0.3 s
+        assert sum(gaps) / len(gaps) < 0.27
+
+    def test_stop_wakes_the_clock(self, tmp_path):
+        """stop() should end a long wait immediately."""
+        heartbeat = self._heartbeat(tmp_path, interval=3600)
+
+        async def main():
+            runner = asyncio.create_task(heartbeat.run_async())
+            while heartbeat.beat_count == 0:
+                await asyncio.sleep(0.01)
+            heartbeat.stop()
+            await asyncio.wait_for(runner, timeout=5)
+
+        t0 = time.monotonic()
+        asyncio.run(main())
+
+        assert time.monotonic() - t0 < 5
+        assert heartbeat.beat_count == 1
+        assert len(list(heartbeat.results_path.glob("beat_*.json"))) == 1
+
+
+class TestScatterBeat:
+    """Test scatter mode: one beat on several targets at once."""
+
+    def _heartbeat(self, tmp_path, **kwargs):
+        config = HeartbeatConfig(
+            use_simulator=True,
+            num_qubits=3,
+            shots=100,
+            results_dir=str(tmp_path / "results"),
+            **kwargs,
+        )
+        return QuantumHeartbeat(config)
+
+    def test_parse_target(self):
+        assert parse_scatter_target("ibm:ibm_fez") == ("ibm", "ibm_fez")
+        assert parse_scatter_target("simulator") == ("simulator", None)
+
+    def test_group_records_members_and_failures(self, tmp_path):
+        """Failed targets are recorded; the rest form the group."""
+        heartbeat = self._heartbeat(tmp_path)
+        group = heartbeat.scatter_beat([
+            "simulator:statevector_sampler",
+            "simulator:mps_simulator",
+            "simulator:stabilizer_simulator",  # not Clifford → fails
+            "no_such_provider",
+        ])
+
+        assert isinstance(group, HeartbeatGroup)
+        backends = [r.backend_name for r in group.results]
+        assert backends == ["statevector_sampler", "mps_simulator"]
+        assert set(group.failures) == {
+            "simulator:stabilizer_simulator", "no_such_provider",
+        }
+        assert all(r.group_id == group.group_id for r in group.results)
+        assert all(r.beat_number == 0 for r in group.results)
+        assert heartbeat.beat_count == 1
+
+        assert heartbeat.flush(timeout=5)
+        files = sorted(p.name for p in heartbeat.results_path.glob("beat_*.json"))
+        assert len(files) == 2
+        assert any(f.endswith("_mps_simulator.json") for f in files)
+        manifest = heartbeat.results_path / "groups" / f"{group.group_id}.json"
+        assert json.loads(manifest.read_text())["failures"] == group.failures
+
+    def test_targets_run_concurrently_with_timeouts(self, tmp_path):
+        """Wall time is the slowest target, and stragglers time out."""
+        heartbeat = self._heartbeat(tmp_path)
+        run_target = heartbeat._run_scatter_target
+
+        def delayed(registry, target, circuit):
+            time.sleep(3.0 if target == "simulator:mps_simulator" else 0.3)
+            return run_target(registry, target, circuit)
+
+        heartbeat._run_scatter_target = delayed
+        group = heartbeat.scatter_beat(
+            [
+                "simulator",
+                "simulator:statevector_sampler",
+                "simulator:heartbeat_sampler",
+                "simulator:mps_simulator",
+            ],
+            timeout=1.0,
+        )
+
+        assert len(group.results) == 3
+        assert "timed out" in group.failures["simulator:mps_simulator"]
+        # Three 0.3 s targets in series would already take 0.9 s
+        assert group.wall_time_seconds < 1.5
+
+    def test_timed_out_hardware_target_is_charged(self, tmp_path):
+        """A straggler's QPU time is charged once its job finishes."""
+        heartbeat = self._heartbeat(tmp_path)
+        run_target = heartbeat._run_scatter_target
+        finished = threading.Event()
+
+        def slow_hardware(registry, target, circuit):
+            cr = run_target(registry, target, circuit)
+            if target != "simulator:mps_simulator":
+                return cr
+            time.sleep(1.0)
+            finished.set()
+            return dataclasses.replace(cr, is_real_hardware=True, execution_time=7.0)
+
+        heartbeat._run_scatter_target = slow_hardware
+        group = heartbeat.scatter_beat(
+            ["simulator", "simulator:mps_simulator"], timeout=0.5
+        )
+        assert "timed out" in group.failures["simulator:mps_simulator"]
+        before = heartbeat.budget_used
+        assert finished.wait(5)
+        deadline = time.time() + 5
+        while heartbeat.budget_used == before and time.time() < deadline:
+            time.sleep(0.01)
+        assert heartbeat.budget_used == pytest.approx(before + 7.0)
+
+    def test_async_scheduler_scatters(self, tmp_path):
+        """run_async should use scatter mode when targets are configured."""
+        heartbeat = self._heartbeat(
+            tmp_path,
+            interval_seconds=0.05,
+            scatter_targets=["simulator", "simulator:mps_simulator"],
+        )
+        saved = []
+        asyncio.run(heartbeat.run_async(
+            max_beats=2, on_result=[lambda r, p: saved.append(p)]
+        ))
+
+        assert heartbeat.beat_count == 2
+        assert len(heartbeat.results) == 4
+        assert len(saved) == 4
+        assert len(list((heartbeat.results_path / "groups").glob("*.json"))) == 2
+
+
+class TestBatchedBeats:
+    """Test the parameterized template and parameter-sweep batches."""
+
+    def _heartbeat(self, tmp_path, **kwargs):
+        config = HeartbeatConfig(
+            use_simulator=True,
+            num_qubits=3,
+            shots=100,
+            results_dir=str(tmp_path / "results"),
+            **kwargs,
+        )
+        return QuantumHeartbeat(config)
+
+    def test_template_is_built_once(self, tmp_path):
+        """Beats bind the shared template to their own phases."""
+        heartbeat = self._heartbeat(tmp_path)
+        template = heartbeat._heartbeat_template()
+        assert template.num_parameters == 3
+        assert heartbeat._heartbeat_template() is template
+
+        circuit = heartbeat._create_heartbeat_circuit(4)
+        assert circuit.name == "heartbeat_4"
+        assert not circuit.parameters
+        angles = [float(i.operation.params[0])
+                  for i in circuit.data if i.operation.name == "rz"]
+        assert angles == pytest.approx(heartbeat_phases(3, 4))
+
+    def test_batch_is_one_submission(self, tmp_path, monkeypatch):
+        """N beats should reach the sampler as a single sweep PUB."""
+        from qiskit.primitives import StatevectorSampler
+        heartbeat = self._heartbeat(tmp_path)
+        submissions = []
+        run = StatevectorSampler.run
+
+        def counting_run(self, pubs, *args, **kwargs):
+            submissions.append(pubs)
+            return run(self, pubs, *args, **kwargs)
+
+        monkeypatch.setattr(StatevectorSampler, "run", counting_run)
+        results = heartbeat.run_batch(4)
+
+        assert len(submissions) == 1
+        assert [r.beat_number for r in results] == [0, 1, 2, 3]
+        assert all(sum(r.counts.values()) == 100 for r in results)
+        assert heartbeat.beat_count == 4
+        assert heartbeat.flush(timeout=5)
+        assert len(list(heartbeat.results_path.glob("beat_*.json"))) == 4
+
+    def test_batch_matches_single_beats(self, tmp_path):
+        """Sweep row k should sample the distribution of beat k."""
+        heartbeat = self._heartbeat(tmp_path)
+        heartbeat.config.shots = 4000
+        results = heartbeat.run_batch(2)
+        # Qubit i of beat k reads 1 with probability sin²(phase / 2)
+        for result in results:
+            p_one = np.sin(heartbeat_phases(3, result.beat_number) / 2) ** 2
+            ones = np.zeros(3)
+            for state, count in result.counts.items():
+                ones += count * np.array([int(b) for b in reversed(state)])
+            assert ones / 4000 == pytest.approx(p_one, abs=0.05)
+
+    def test_registry_batch(self, tmp_path):
+        """The provider path submits the sweep through the registry."""
+        heartbeat = self._heartbeat(tmp_path, preferred_provider="simulator")
+        heartbeat.config.use_simulator = False
+        results = heartbeat.run_batch(3)
+        assert [r.beat_number for r in results] == [0, 1, 2]
+        assert {r.source for r in results} == {"simulation"}
+
+    def test_batch_is_cut_to_remaining_budget(self, tmp_path):
+        """A batch never runs more beats than the budget can pay for."""
+        heartbeat = self._heartbeat(tmp_path)
+        heartbeat.config.max_monthly_seconds = 100.0
+        heartbeat.config.estimated_seconds_per_beat = 10.0
+        heartbeat.budget_used = 75.0
+        assert [r.beat_number for r in heartbeat.run_batch(5)] == [0, 1]
+        heartbeat.budget_used = 95.0
+        assert heartbeat.run_batch(5) == []
+
+    def test_async_catches_up_missed_ticks(self, tmp_path):
+        """Ticks missed behind a slow beat run as one batch."""
+        heartbeat = self._heartbeat(
+            tmp_path, interval_seconds=0.05, catch_up_missed_beats=True
+        )
+        execute = heartbeat._execute_beat
+        batches = []
+
+        def slow_beat(number):
+            time.sleep(0.3)
+            return execute(number)
+
+        def record_batch(first, count):
+            batches.append(count)
+            return QuantumHeartbeat._execute_batch(heartbeat, first, count)
+
+        heartbeat._execute_beat = slow_beat
+        heartbeat._execute_batch = record_batch
+        asyncio.run(heartbeat.run_async(max_beats=5))
+
+        assert batches and batches[0] > 1
+        assert [r.beat_number for r in heartbeat.results] == [0, 1, 2, 3, 4]
+        assert len(list(heartbeat.results_path.glob("beat_*.json"))) == 5
+
+
+class TestResultPersistence:
+    """Test the background writer, append-only log and results ring."""
+
+    def _heartbeat(self, tmp_path, **kwargs):
+        config = HeartbeatConfig(
+            use_simulator=True,
+            num_qubits=3,
+            shots=100,
+            results_dir=str(tmp_path / "results"),
+            **kwargs,
+        )
+        return QuantumHeartbeat(config)
+
+    def test_beats_append_to_daily_log(self, tmp_path):
+        """Every beat should land in the day's JSONL log, in order."""
+        heartbeat = self._heartbeat(tmp_path)
+        for _ in range(3):
+            heartbeat.single_beat()
+        heartbeat.run_batch(2)
+        assert heartbeat.flush(timeout=5)
+
+        logs = list((heartbeat.results_path / "log").glob("beats_*.jsonl"))
+        assert len(logs) == 1
+        records = list(read_result_log(logs[0]))
+        assert [r["beat_number"] for r in records] == [0, 1, 2, 3, 4]
+        assert records[0]["counts"] == heartbeat.results[0].counts
+
+    def test_results_ring_is_bounded(self, tmp_path):
+        """Only the most recent results stay in memory."""
+        heartbeat = self._heartbeat(tmp_path, results_ring_size=2)
+        for _ in range(4):
+            heartbeat.single_beat()
+        assert heartbeat.beat_count == 4
+        assert [r.beat_number for r in heartbeat.results] == [2, 3]
+
+    def test_beat_does_not_wait_on_disk(self, tmp_path, monkeypatch):
+        """A slow disk should delay the files, not the beat."""
+        heartbeat = self._heartbeat(tmp_path)
+        append = ResultWriter._append_log
+
+        def slow_append(self, records):
+            time.sleep(0.5)
+            return append(self, records)
+
+        monkeypatch.setattr(ResultWriter, "_append_log", slow_append)
+        t0 = time.monotonic()
+        heartbeat.single_beat()
+        assert time.monotonic() - t0 < 0.5
+        assert heartbeat.flush(timeout=5)
+        assert len(list(heartbeat.results_path.glob("beat_*.json"))) == 1
+
+    def test_log_only(self, tmp_path):
+        """write_beat_files=False keeps only the log."""
+        heartbeat = self._heartbeat(tmp_path, write_beat_files=False,
+                                    fsync_policy="never")
+        heartbeat.single_beat()
+        assert heartbeat.flush(timeout=5)
+        assert not list(heartbeat.results_path.glob("*.json"))
+        assert len(list((heartbeat.results_path / "log").glob("*.jsonl"))) == 1
+
+    def test_torn_record_is_skipped(self, tmp_path):
+        log = tmp_path / "log" / "beats_2026-01-01.jsonl"
+        log.parent.mkdir()
+        log.write_text('{"beat_number": 0}\n{"beat_num')
+        assert list(read_result_log(log)) == [{"beat_number": 0}]
+
+        # The next append starts on a fresh line instead of joining the tear
+        writer = ResultWriter(tmp_path, write_beat_files=False)
+        record = {"beat_number": 1, "timestamp_utc": "2026-01-01T00:00:00"}
+        assert writer.submit([record]).result(timeout=5) == [log]
+        assert list(read_result_log(log)) == [{"beat_number": 0}, record]
+
+    def test_unknown_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            ResultWriter(tmp_path, fsync="sometimes")
+
+
 class TestHeartbeatResult:
     """Test HeartbeatResult dataclass."""
 
@@ -0,0 +1,299 @@
+"""Tests for the hypersphere module."""
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from aios_quantum.hypersphere import (
+    AsymptoticDescent,
+    CubeMembrane,
+    DescentBatch,
+    HypersphereManifold,
+    InformationFlux,
+    InverseExponentialMetric,
+)
+from aios_quantum.hypersphere.membrane import Face, FluxDirection, MembranePoint
+
+
+class TestDescentBatch:
+    """Test batched asymptotic descents."""
+
+    def test_matches_single_descent(self):
+        """Batch steps should match AsymptoticDescent.step exactly."""
+        batch = DescentBatch(
+            theta=[0.0, 1.0, 2.0],
+            phi=0.5,
+            initial_depth=[1000.0, 10.0, 1.0],
+            decay_rate=[0.1, 0.5, 1.0],
+        )
+        singles = [batch.descent(i) for i in range(len(batch))]
+        for _ in range(20):
+            batch.step(0.1)
+            singles = [d.step(0.1) for d in singles]
+
+        for i, single in enumerate(singles):
+            assert batch.current_depth[i] == pytest.approx(single.current_depth)
+            assert batch.information_accumulated[i] == pytest.approx(
+                single.information_accumulated
+            )
+
+    def test_step_with_grid_shaped_dt(self):
+        """dt shaped like the batch grid should apply per descent."""
+        batch = DescentBatch(theta=np.zeros((2, 3)), phi=0.0)
+        dt = np.arange(6.0).reshape(2, 3)
+        batch.step(dt)
+        np.testing.assert_allclose(batch.current_time, dt.ravel())
+        batch.step(np.ones(6)).jump_to_time(dt * 2)
+        np.testing.assert_allclose(batch.current_time, 2 * dt.ravel())
+
+    def test_times_on_a_grid_batch(self):
+        """Grid-shaped times are one per cell; a trailing axis is k per cell."""
+        batch = DescentBatch(
+            theta=np.zeros((2, 3)), phi=0.0,
+            decay_rate=np.arange(1.0, 7.0).reshape(2, 3),
+        )
+        times = np.full((2, 3), 2.0)
+        depths = batch.depth_at(times)
+        assert depths.shape == (2, 3)
+        np.testing.assert_allclose(
+            depths, 1000.0 * np.exp(-batch.decay_rate.reshape(2, 3) * 2.0)
+        )
+        curves = batch.depth_at(np.zeros((2, 3, 4)))
+        assert curves.shape == (2, 3, 4)
+        np.testing.assert_allclose(curves, 1000.0)
+        with pytest.raises(ValueError):
+            batch.depth_at(np.zeros((3, 2)))
+
+    def test_time_to_depth(self):
+        """Vectorized time_to_depth should match the scalar version."""
+        batch = DescentBatch(
+            theta=0.0, phi=0.0, initial_depth=[100.0, 100.0, 100.0]
+        )
+        times = batch.time_to_depth(np.array([1.0, 0.0, 200.0]))
+        single = AsymptoticDescent(initial_depth=100.0)
+        assert times[0] == pytest.approx(single.time_to_depth(1.0))
+        assert math.isinf(times[1])
+        assert times[2] == 0.0
+
+    def test_jump_to_depth(self):
+        """Jumping to a depth should land exactly on it."""
+        batch = DescentBatch(theta=0.0, phi=0.0, initial_depth=[10.0, 50.0])
+        batch.jump_to_depth(0.5)
+        np.testing.assert_allclose(batch.current_depth, 0.5)
+
+    def test_information_curves_shape(self):
+        """Curves should be one row per descent, starting at zero."""
+        batch = DescentBatch(theta=np.zeros(4), phi=0.0)
+        curves = batch.information_curves(np.linspace(0, 10, 11))
+        assert curves.shape == (4, 11)
+        np.testing.assert_allclose(curves[:, 0], 0.0)
+        assert np.all(np.diff(curves, axis=1) > 0)
+
+    def test_angular_grid(self):
+        """Manifold should build one descent per angular cell."""
+        manifold = HypersphereManifold(resolution=8, max_depth=100.0)
+        batch = manifold.angular_descent_grid()
+        assert len(batch) == 8 * 4
+        assert batch.shape == (8, 4)
+        np.testing.assert_allclose(batch.initial_depth, 100.0)
+
+
+class TestInverseExponentialMetric:
+    """Test scalar and array forms of the metric."""
+
+    def test_scalar_returns_float(self):
+        """Scalar inputs should still produce plain floats."""
+        metric = InverseExponentialMetric()
+        assert isinstance(metric.information_at_depth(2.0), float)
+        assert metric.proper_distance(1.0, math.e) == pytest.approx(1.0)
+
+    def test_array_matches_scalar(self):
+        """Array results should match element-wise scalar calls."""
+        metric = InverseExponentialMetric(surface_cutoff=1e-3)
+        depths = np.array([0.0, 1e-4, 0.5, 2.0, 100.0])
+        for method in ('information_at_depth', 'time_dilation'):
+            expected = [getattr(metric, method)(float(d)) for d in depths]
+            np.testing.assert_allclose(getattr(metric, method)(depths), expected)
+        np.testing.assert_allclose(
+            metric.wavelength_at_depth(2.0, depths),
+            [metric.wavelength_at_depth(2.0, float(d)) for d in depths],
+        )
+        np.testing.assert_allclose(
+            metric.proper_distance(1.0, depths[:, None]).shape, (5, 1)
+        )
+
+    def test_depth_table_cached(self):
+        """Repeated grids should reuse the same read-only table."""
+        metric = InverseExponentialMetric()
+        table = metric.depth_table(1e-3, 1e3, 64)
+        assert metric.depth_table(1e-3, 1e3, 64) is table
+        assert not table.information.flags.writeable
+        np.testing.assert_allclose(
+            table.information, metric.information_at_depth(table.depths)
+        )
+
+
+class TestFractalLayer:
+    """Test fractal layer generation."""
+
+    def test_layer_matches_fibonacci_layout(self):
+        """Cached angles should reproduce the Fibonacci sphere layout."""
+        manifold = HypersphereManifold(resolution=4)
+        points = manifold.generate_fractal_layer(0.5, detail_level=3)
+        assert len(points) == 16
+        golden = (1 + math.sqrt(5)) / 2
+        assert points[5].theta == pytest.approx(2 * math.pi * 5 / golden)
+        assert points[5].phi == pytest.approx(math.acos(1 - 2 * 5.5 / 16))
+        assert points[5].psi == pytest.approx(math.pi * 2 / 3)
+
+    def test_array_density(self):
+        """Density should broadcast over depth arrays."""
+        manifold = HypersphereManifold(resolution=4)
+        depths = np.array([0.1, 1.0, 10.0])
+        np.testing.assert_allclose(
+            manifold.information_density_at_depth(depths),
+            [manifold.information_density_at_depth(float(d)) for d in depths],
+        )
+        assert manifold.fractal_layer_density(depths).shape == (3, 16)
+
+
+class TestCubeMembrane:
+    """Test the grid-backed cube membrane."""
+
+    def test_write_and_read(self):
+        """Written flux should be readable at the same location."""
+        membrane = CubeMembrane(resolution=8)
+        flux = InformationFlux(1.0, FluxDirection.STATIC, frequency=2.0, phase=0.5)
+        membrane.write(Face.POSITIVE_X, 0.3, 0.7, flux, layer=0.5)
+
+        found = membrane.read(Face.POSITIVE_X, 0.3, 0.7, tolerance=0.05)
+        assert found == [flux]
+        assert membrane.read(Face.POSITIVE_X, 0.9, 0.1, tolerance=0.05) == []
+        assert membrane.read(Face.NEGATIVE_X, 0.3, 0.7) == []
+
+    def test_face_flux_accounting(self):
+        """Outward and inward writes should update net face flux."""
+        membrane = CubeMembrane(resolution=4)
+        membrane.write(
+            Face.POSITIVE_Z, 0.5, 0.5, InformationFlux(2.0, FluxDirection.OUTWARD)
+        )
+        membrane.write(
+            Face.POSITIVE_Z, 0.1, 0.1, InformationFlux(0.5, FluxDirection.INWARD)
+        )
+        assert membrane.get_face_flux(Face.POSITIVE_Z) == pytest.approx(1.5)
+        assert membrane.get_total_outward_flux() == pytest.approx(1.5)
+
+    def test_outward_flux_exits(self):
+        """Outward flux should cross the membrane and leave it."""
+        membrane = CubeMembrane(resolution=4)
+        membrane.write(
+            Face.POSITIVE_Y, 0.5, 0.5, InformationFlux(1.0, FluxDirection.OUTWARD)
+        )
+        for step in range(9):
+            membrane.propagate(0.1)
+            [(point, flux)] = membrane.face_fluxes(Face.POSITIVE_Y)
+            assert point.layer_depth == pytest.approx(0.1 * (step + 1))
+            assert flux.magnitude == pytest.approx(0.99 ** (step + 1))
+        membrane.propagate(0.1)
+        assert membrane.face_fluxes(Face.POSITIVE_Y) == []
+
+    def test_inward_flux_settles(self):
+        """Inward flux should stop at the inner surface."""
+        membrane = CubeMembrane(resolution=4)
+        membrane.write(
+            Face.NEGATIVE_Y, 0.5, 0.5,
+            InformationFlux(1.0, FluxDirection.INWARD), layer=0.2,
+        )
+        for _ in range(5):
+            membrane.propagate(0.1)
+        [(point, _)] = membrane.face_fluxes(Face.NEGATIVE_Y)
+        assert point.layer_depth == 0.0
+
+    def test_diffusion_spreads_laterally(self):
+        """Diffusion should spread magnitude to neighbours, conserving it."""
+        membrane = CubeMembrane(resolution=8, diffusion=1.0)
+        membrane.write(
+            Face.POSITIVE_X, 0.5, 0.5,
+            InformationFlux(1.0, FluxDirection.STATIC, phase=1.0), layer=0.5,
+        )
+        membrane.propagate(0.1)
+        grid = membrane.face_grid(Face.POSITIVE_X)
+        assert np.count_nonzero(grid.occupied) == 5
+        assert grid.magnitude.sum() == pytest.approx(0.99)
+        assert np.all(grid.direction[grid.occupied] == 0)
+
+    def test_mesh_matches_membrane_points(self):
+        """Cached mesh geometry should match MembranePoint.to_3d layout."""
+        res = 3
+        membrane = CubeMembrane(size=2.0, resolution=res)
+        mesh = membrane.to_mesh()
+        per_face = (res + 1) ** 2
+        assert mesh.positions.shape == (6 * per_face, 3)
+        assert mesh.indices.shape == (6 * res * res * 2, 3)
+        assert mesh.indices.dtype == np.uint32
+
+        for f, face in enumerate(Face):
+            for i in range(res + 1):
+                for j in range(res + 1):
+                    point = MembranePoint(face, i / res, j / res, 1.0)
+                    np.testing.assert_allclose(
+                        mesh.positions[f * per_face + i * (res + 1) + j],
+                        point.to_3d(2.0),
+                        rtol=1e-6,
+                    )
+        assert tuple(mesh.indices[1]) == (1, 5, 4)
+
+    def test_mesh_topology_cached(self):
+        """Repeated frames should reuse topology but refresh attributes."""
+        membrane = CubeMembrane(resolution=4)
+        first = membrane.to_mesh()
+        assert first.magnitude.max() == 0
+        membrane.write(
+            Face.POSITIVE_X, 0.1, 0.1,
+            InformationFlux(1.0, FluxDirection.STATIC), layer=0.5,
+        )
+        second = membrane.to_mesh()
+        assert second.indices is first.indices
+        assert second.positions is first.positions
+        # Corner vertex touches only the written cell
+        assert second.magnitude[0] == pytest.approx(1.0)
+        assert second.layer_depth[0] == pytest.approx(0.5)
+        assert second.colors[0, 0] == pytest.approx(1.0)
+
+    def test_colocated_fluxes_interfere(self):
+        """Same-cell fluxes should combine like interfere_with."""
+        membrane = CubeMembrane(resolution=4)
+        a = InformationFlux(1.0, FluxDirection.STATIC, phase=0.3)
+        b = InformationFlux(0.5, FluxDirection.STATIC, phase=1.9)
+        membrane.write(Face.POSITIVE_X, 0.1, 0.1, a, layer=0.5)
+        membrane.write(Face.POSITIVE_X, 0.1, 0.1, b, layer=0.5)
+        [combined] = membrane.read(Face.POSITIVE_X, 0.1, 0.1, tolerance=0.1)
+        expected = a.interfere_with(b)
+        assert combined.magnitude == pytest.approx(expected.magnitude)
+        assert combined.phase == pytest.approx(expected.phase)
+
+    def test_write_many_bins_per_cell(self):
+        """Bulk writes should sum complex amplitudes per cell."""
+        membrane = CubeMembrane(resolution=4)
+        n = 2000
+        # Alternate phases 0 and π: pairs cancel in the first cell
+        phases = np.where(np.arange(n) % 2 == 0, 0.0, np.pi)
+        membrane.write_many(
+            Face.NEGATIVE_Z, np.full(n, 0.1), np.full(n, 0.1),
+            np.ones(n), FluxDirection.STATIC, phase=phases, layer=0.5,
+        )
+        # In-phase fluxes add constructively in another cell
+        membrane.write_many(
+            Face.NEGATIVE_Z, np.full(n, 0.9), np.full(n, 0.9),
+            np.full(n, 0.01), FluxDirection.STATIC, phase=1.0, layer=0.5,
+        )
+        membrane.propagate(0.1)
+        grid = membrane.face_grid(Face.NEGATIVE_Z)
+        assert np.count_nonzero(grid.occupied) == 1
+        i, j = membrane.cell_index(0.9, 0.9)
+        assert grid.magnitude[i, j, 5] == pytest.approx(n * 0.01 * 0.99)
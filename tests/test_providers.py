@@ -0,0 +1,377 @@
+"""
+Tests for the multi-provider registry.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from aios_quantum.providers import (
+    CircuitOpenError,
+    ProbeCache,
+    ProviderRegistry,
+    SimulatorProvider,
+)
+from aios_quantum.routing import CircuitBreaker, ProviderStats, RouteStats
+
+
+class FakeProvider(SimulatorProvider):
+    """Simulator that counts probes and can be made to fail."""
+
+    def __init__(self, name="fake", available=True, delay=0.0, run_delay=0.0,
+                 run_error=None, real=False):
+        self._name = name
+        self.real = real
+        self.available = available
+        self.delay = delay
+        self.run_delay = run_delay
+        self.run_error = run_error
+        self.probes = 0
+        self.runs = 0
+
+    def name(self) -> str:
+        return self._name
+
+    def is_available(self) -> bool:
+        self.probes += 1
+        time.sleep(self.delay)
+        if isinstance(self.available, Exception):
+            raise self.available
+        return self.available
+
+    def run_circuit(self, qiskit_circuit, shots=2048, backend_name=None,
+                    optimization_level=1):
+        self.runs += 1
+        time.sleep(self.run_delay)
+        if self.run_error is not None:
+            raise self.run_error
+        result = super().run_circuit(qiskit_circuit, shots, backend_name)
+        result.provider_name = self._name
+        result.is_real_hardware = self.real
+        return result
+
+
+def bell():
+    from qiskit import QuantumCircuit
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    return qc
+
+
+def make_registry(*providers, **kwargs):
+    """Registry holding only the given providers, in that priority order."""
+    registry = ProviderRegistry(
+        priority=[p.name() for p in providers], **kwargs
+    )
+    registry._providers = {p.name(): p for p in providers}
+    return registry
+
+
+class TestProbeCache:
+    """Test the TTL probe cache."""
+
+    def test_probes_once_within_ttl(self):
+        cache = ProbeCache(ttl=60)
+        calls = []
+        for _ in range(5):
+            assert cache.get(("p", "available"), lambda: calls.append(1) or True, False)
+        assert len(calls) == 1
+
+    def test_failures_are_cached_with_error(self):
+        cache = ProbeCache(ttl=60, negative_ttl=60)
+        calls = []
+
+        def probe():
+            calls.append(1)
+            raise TimeoutError("no route")
+
+        assert cache.get(("p", "available"), probe, False) is False
+        assert cache.get(("p", "available"), probe, False) is False
+        assert len(calls) == 1
+        assert cache.error(("p", "available")) == "no route"
+
+    def test_stale_value_served_while_refreshing(self):
+        now = [0.0]
+        cache = ProbeCache(ttl=10, negative_ttl=1, clock=lambda: now[0])
+        values = iter([False, True])
+        key = ("p", "available")
+
+        assert cache.get(key, lambda: next(values), False) is False
+        now[0] = 5.0  # past the negative TTL
+        assert cache.get(key, lambda: next(values), False) is False  # stale
+        deadline = time.time() + 2
+        while cache.get(key, lambda: True, False) is not True:
+            assert time.time() < deadline
+            time.sleep(0.01)
+
+    def test_invalidate(self):
+        cache = ProbeCache()
+        cache.get(("a", "available"), lambda: True, False)
+        cache.get(("b", "available"), lambda: True, False)
+        cache.invalidate("a")
+        calls = []
+        cache.get(("a", "available"), lambda: calls.append(1) or True, False)
+        cache.get(("b", "available"), lambda: calls.append(1) or True, False)
+        assert len(calls) == 1
+
+
+class TestSimulatorProvider:
+    """Test simulator backend selection."""
+
+    def test_backends_are_real_methods(self):
+        backends = SimulatorProvider().get_backends()
+        assert "auto" not in backends
+        assert backends[0] == "statevector_sampler"
+
+    def test_unknown_backend_is_rejected(self):
+        sim = SimulatorProvider()
+        with pytest.raises(ValueError, match="unknown simulator backend"):
+            sim.run_circuit(bell(), shots=10, backend_name="mps_simulatr")
+        assert sim.run_circuit(bell(), shots=10, backend_name="auto").shots == 10
+
+
+class TestRegistryCaching:
+    """Test that the registry reuses cached probes."""
+
+    def test_selection_does_not_reprobe(self):
+        slow = FakeProvider("slow", available=TimeoutError("hang"), delay=0.2)
+        sim = FakeProvider("sim")
+        registry = make_registry(slow, sim)
+
+        assert registry.select_provider() is sim
+        t0 = time.monotonic()
+        for _ in range(20):
+            assert registry.select_provider() is sim
+            registry.get_available_providers()
+        assert time.monotonic() - t0 < 0.2
+        assert slow.probes == 1
+        assert sim.probes == 1
+
+    def test_heartbeat_failover_uses_cache(self):
+        sim = FakeProvider("sim")
+        registry = make_registry(FakeProvider("down", available=False), sim)
+
+        for _ in range(3):
+            result = registry.run_heartbeat_circuit(bell(), shots=50)
+            assert result.provider_name == "sim"
+        assert sim.probes == 1
+
+    def test_status_reports_probe_errors(self):
+        registry = make_registry(
+            FakeProvider("broken", available=RuntimeError("bad token")),
+            FakeProvider("sim"),
+        )
+        status = registry.status()
+        assert status["broken"].status == "error"
+        assert status["broken"].error == "bad token"
+        assert status["sim"].status == "available"
+        assert status["sim"].is_real_hardware is False
+
+    def test_refresh_forces_reprobe(self):
+        sim = FakeProvider("sim")
+        registry = make_registry(sim)
+        registry.select_provider()
+        registry.refresh("sim")
+        registry.select_provider()
+        assert sim.probes == 2
+
+
+class TestRouteStats:
+    """Test EWMA statistics and adaptive routing."""
+
+    def test_ewma_updates(self):
+        stats = RouteStats()
+        stats.record_success(latency=10.0, execution=2.0, cost=2.0, alpha=0.5)
+        assert (stats.latency, stats.queue, stats.cost) == (10.0, 8.0, 2.0)
+        stats.record_success(latency=20.0, execution=2.0, cost=2.0, alpha=0.5)
+        assert stats.latency == pytest.approx(15.0)
+        assert stats.latency_var == pytest.approx(25.0)
+        stats.record_failure(alpha=0.5)
+        assert stats.failure_rate == pytest.approx(0.5)
+        assert stats.expected_seconds() == pytest.approx(30.0)
+
+    def test_quantile_needs_samples(self):
+        stats = RouteStats()
+        for latency in (1.0, 2.0, 3.0, 4.0):
+            stats.record_success(latency, 0.0, 0.0)
+        assert stats.latency_quantile(0.95) is None
+        stats.record_success(5.0, 0.0, 0.0)
+        assert stats.latency_quantile(0.95) > stats.latency
+
+    def test_persistence(self, tmp_path):
+        path = tmp_path / "stats.json"
+        stats = ProviderStats(str(path))
+        stats.record("ibm", "ibm_fez", latency=30.0, execution=3.0, cost=3.0)
+        stats.record("ibm", "ibm_fez", latency=5.0, ok=False)
+
+        reloaded = ProviderStats(str(path))
+        assert reloaded.get("ibm").samples == 1
+        assert reloaded.get("ibm", "ibm_fez").failures == 1
+        assert reloaded.get("ibm").queue == pytest.approx(27.0)
+
+    def test_rank_by_expected_time_within_budget(self):
+        stats = ProviderStats()
+        stats.record("slow", None, latency=100.0)
+        stats.record("fast", None, latency=1.0, execution=1.0, cost=50.0)
+        stats.record("sim", None, latency=5.0)
+        assert stats.rank(["slow", "fast", "sim", "new"]) == [
+            "fast", "sim", "slow", "new",
+        ]
+        assert stats.rank(["slow", "fast", "sim"], budget_remaining=10.0) == [
+            "sim", "slow",
+        ]
+
+
+class TestAdaptiveRouting:
+    """Test registry routing policies and hedged submission."""
+
+    def test_adaptive_policy_prefers_fastest(self):
+        registry = make_registry(FakeProvider("slow"), FakeProvider("fast"))
+        registry.stats.record("slow", None, latency=60.0)
+        registry.stats.record("fast", None, latency=2.0)
+
+        assert [p.name() for p in registry.route()] == ["slow", "fast"]
+        assert [p.name() for p in registry.route(policy="adaptive")] == [
+            "fast", "slow",
+        ]
+        assert registry.route("slow", policy="adaptive")[0].name() == "slow"
+        with pytest.raises(ValueError):
+            registry.route(policy="fastest")
+
+    def test_attempts_are_recorded(self):
+        registry = make_registry(FakeProvider("sim"))
+        registry.run_heartbeat_circuit(bell(), shots=20)
+        stats = registry.stats.get("sim")
+        assert stats.samples == 1
+        assert stats.cost == 0.0
+        assert registry.stats.get("sim", "statevector_sampler").samples == 1
+
+    def test_hedges_slow_provider(self):
+        registry = make_registry(
+            FakeProvider("laggy", run_delay=2.0), FakeProvider("backup")
+        )
+        for _ in range(5):
+            registry.stats.record("laggy", None, latency=0.1)
+
+        t0 = time.monotonic()
+        result = registry.run_heartbeat_circuit(
+            bell(), shots=20, hedge_percentile=0.95
+        )
+        assert result.provider_name == "backup"
+        assert time.monotonic() - t0 < 1.5
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions and registry integration."""
+
+    def test_opens_then_half_open_probe(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10,
+                                 clock=lambda: now[0])
+        breaker.record_failure()
+        assert breaker.state == "closed" and breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open" and breaker.is_open()
+        assert not breaker.allow()
+
+        now[0] = 10.0
+        assert breaker.state == "half_open" and not breaker.is_open()
+        assert breaker.allow()  # the single probe
+        assert not breaker.allow()
+        breaker.record_failure()  # probe failed: open again
+        assert breaker.is_open()
+
+        now[0] = 20.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_open_breaker_skips_provider(self):
+        broken = FakeProvider("qpu", run_error=RuntimeError("queue timeout"))
+        sim = FakeProvider("simulator")
+        registry = make_registry(broken, sim, breaker_threshold=2)
+
+        for _ in range(4):
+            result = registry.run_heartbeat_circuit(bell(), shots=20)
+            assert result.provider_name == "simulator"
+        assert broken.runs == 2
+        assert registry.status()["qpu"].status == "circuit_open"
+        assert [p.name() for p in registry.get_available_providers()] == [
+            "simulator"
+        ]
+        with pytest.raises(CircuitOpenError):
+            registry.run_on_provider(broken, bell())
+
+    def test_simulator_never_trips(self):
+        sim = FakeProvider("simulator", run_error=RuntimeError("too wide"))
+        registry = make_registry(sim, breaker_threshold=1)
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                registry.run_heartbeat_circuit(bell(), shots=20)
+        assert sim.runs == 3
+
+
+class TestRaceMode:
+    """Test racing the first choice against the simulator."""
+
+    def test_hardware_within_deadline_wins(self):
+        registry = make_registry(
+            FakeProvider("qpu", run_delay=0.1),
+            FakeProvider("simulator"),
+        )
+        result = registry.run_heartbeat_circuit(bell(), shots=20, race_deadline=2.0)
+        assert result.provider_name == "qpu"
+
+    def test_simulator_wins_after_deadline(self):
+        qpu = FakeProvider("qpu", run_delay=3.0)
+        registry = make_registry(qpu, FakeProvider("simulator"))
+        t0 = time.monotonic()
+        result = registry.run_heartbeat_circuit(bell(), shots=20, race_deadline=0.2)
+        assert result.provider_name == "simulator"
+        assert time.monotonic() - t0 < 1.5
+
+    def test_losing_hardware_cost_is_reported(self):
+        qpu = FakeProvider("qpu", run_delay=0.5, real=True)
+        registry = make_registry(qpu, FakeProvider("simulator"))
+        extra = []
+        result = registry.run_heartbeat_circuit(
+            bell(), shots=20, race_deadline=0.1, on_extra_cost=extra.append
+        )
+        assert result.provider_name == "simulator"
+        deadline = time.time() + 3
+        while not extra:
+            assert time.time() < deadline
+            time.sleep(0.02)
+        assert [r.provider_name for r in extra] == ["qpu"]
+
+    def test_failed_hardware_falls_back(self):
+        registry = make_registry(
+            FakeProvider("qpu", run_error=RuntimeError("auth")),
+            FakeProvider("simulator", run_delay=0.2),
+        )
+        result = registry.run_heartbeat_circuit(bell(), shots=20, race_deadline=5.0)
+        assert result.provider_name == "simulator"
+
+    def test_both_legs_fail_over_to_next_provider(self):
+        registry = make_registry(
+            FakeProvider("qpu", run_error=RuntimeError("auth")),
+            FakeProvider("cloud"),
+            FakeProvider("spare"),
+            FakeProvider("simulator", run_error=RuntimeError("oom")),
+        )
+        # Enough samples for a latency quantile, so only the (unset)
+        # hedge percentile keeps the failover sequential
+        for name, latency in (("qpu", 0.05), ("cloud", 0.1), ("spare", 0.2)):
+            for _ in range(5):
+                registry.stats.record(name, None, latency=latency)
+        result = registry.run_heartbeat_circuit(bell(), shots=20, race_deadline=5.0)
+        assert result.provider_name == "cloud"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,225 @@
+"""
+Tests for structure-aware local simulation.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit.random import random_circuit
+from qiskit.quantum_info import Statevector, random_clifford
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from aios_quantum.heartbeat import HeartbeatConfig, QuantumHeartbeat
+from aios_quantum.providers import SimulatorProvider
+from aios_quantum.simulation import (
+    HEARTBEAT_CLOSED_FORM,
+    MATRIX_PRODUCT_STATE,
+    STABILIZER,
+    STATEVECTOR,
+    MPSState,
+    analyze_circuit,
+    match_heartbeat_family,
+    plan_simulation,
+    simulate,
+)
+from aios_quantum.simulation.stabilizer import support_basis
+
+
+def heartbeat_circuit(n: int) -> QuantumCircuit:
+    """Same layout as QuantumHeartbeat._create_heartbeat_circuit."""
+    qc = QuantumCircuit(n)
+    qc.h(range(n))
+    for i in range(n - 1):
+        qc.cx(i, i + 1)
+    for i in range(n):
+        qc.rz((i + 1) * 0.1, i)
+    qc.h(range(n))
+    qc.measure_all()
+    return qc
+
+
+def chain_circuit(n: int) -> QuantumCircuit:
+    """Entangling RY/CX ladder — chain-local but not in the heartbeat family."""
+    qc = QuantumCircuit(n)
+    for i in range(n):
+        qc.ry(0.3 + 0.1 * i, i)
+    for i in range(n - 1):
+        qc.cx(i, i + 1)
+    qc.rz(0.7, n - 1)
+    qc.measure_all()
+    return qc
+
+
+def ghz_circuit(n: int) -> QuantumCircuit:
+    qc = QuantumCircuit(n)
+    qc.h(0)
+    for i in range(n - 1):
+        qc.cx(i, i + 1)
+    qc.measure_all()
+    return qc
+
+
+def total_variation(counts, circuit) -> float:
+    probs = Statevector(circuit.remove_final_measurements(inplace=False)).probabilities()
+    shots = sum(counts.values())
+    empirical = np.zeros_like(probs)
+    for key, count in counts.items():
+        empirical[int(key, 2)] = count / shots
+    return 0.5 * np.abs(empirical - probs).sum()
+
+
+class TestCircuitProfile:
+    """Test structural analysis."""
+
+    def test_heartbeat_profile(self):
+        profile = analyze_circuit(heartbeat_circuit(6))
+        assert profile.is_chain
+        assert not profile.is_clifford
+        assert profile.cut_entangling_bits == [1] * 5
+        assert profile.measurements == {q: q for q in range(6)}
+        assert profile.supports_fast_paths
+
+    def test_mid_circuit_measurement_unsupported(self):
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.measure(0, 0)
+        qc.x(0)
+        qc.measure(1, 1)
+        assert "mid-circuit" in analyze_circuit(qc).unsupported
+
+
+class TestPlanner:
+    """Test method selection."""
+
+    def test_small_circuit_uses_statevector(self):
+        plan = plan_simulation(heartbeat_circuit(5))
+        assert plan.method == STATEVECTOR
+        assert plan.memory_bytes == 16 * 2 ** 5
+
+    def test_wide_clifford_uses_stabilizer(self):
+        assert plan_simulation(ghz_circuit(40)).method == STABILIZER
+
+    def test_wide_heartbeat_uses_closed_form(self):
+        plan = plan_simulation(heartbeat_circuit(127))
+        assert plan.method == HEARTBEAT_CLOSED_FORM
+        assert plan.memory_bytes < 1 << 20
+
+    def test_chain_uses_mps(self):
+        plan = plan_simulation(chain_circuit(27))
+        assert plan.method == MATRIX_PRODUCT_STATE
+        assert plan.exact
+        assert plan.memory_bytes < 16 * 2 ** 27
+
+    def test_forced_stabilizer_rejects_non_clifford(self):
+        with pytest.raises(ValueError):
+            plan_simulation(heartbeat_circuit(3), method=STABILIZER)
+
+
+class TestMethods:
+    """Each fast path should reproduce the statevector distribution."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_mps_amplitudes_exact(self, seed):
+        qc = random_circuit(5, 6, max_operands=2, seed=seed)
+        state = MPSState(5)
+        for ins in qc.data:
+            qubits = [qc.find_bit(q).index for q in ins.qubits]
+            matrix = np.asarray(ins.operation.to_matrix())
+            if len(qubits) == 1:
+                state.apply_1q(matrix, qubits[0])
+            else:
+                state.apply_2q(matrix, *qubits)
+        psi = state.tensors[0]
+        for tensor in state.tensors[1:]:
+            psi = np.einsum("lsm,mtr->lstr", psi, tensor).reshape(1, -1, tensor.shape[2])
+        dense = psi.reshape([2] * 5).transpose(4, 3, 2, 1, 0).reshape(-1)
+        assert abs(np.vdot(Statevector(qc).data, dense)) == pytest.approx(1.0)
+        assert state.truncation_error == 0.0
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_stabilizer_support_matches_statevector(self, seed):
+        clifford = random_clifford(4, seed=seed)
+        probs = Statevector(clifford.to_circuit()).probabilities()
+        x0, basis = support_basis(clifford)
+        k = basis.shape[0]
+        support = {
+            int("".join(map(str, (x0 ^ (np.array(c) @ basis) % 2)[::-1])), 2)
+            for c in np.ndindex(*(2,) * k)
+        }
+        assert support == set(np.flatnonzero(probs > 1e-9))
+
+    def test_sampled_distributions(self):
+        qc = random_circuit(5, 5, max_operands=2, seed=3)
+        qc.measure_all()
+        mps = simulate(qc, 20000, method=MATRIX_PRODUCT_STATE, seed=1)
+        assert total_variation(mps.counts, qc) < 0.03
+
+        stab = simulate(ghz_circuit(5), 4000, method=STABILIZER, seed=1)
+        assert set(stab.counts) == {"00000", "11111"}
+
+
+class TestHeartbeatFamily:
+    """Test the closed-form heartbeat sampler."""
+
+    @pytest.mark.parametrize("beat", [0, 1, 7, 42])
+    def test_distribution_matches_statevector(self, tmp_path, beat):
+        heartbeat = QuantumHeartbeat(HeartbeatConfig(
+            num_qubits=5, results_dir=str(tmp_path),
+            rotation_index_file=str(tmp_path / ".rotation_index"),
+        ))
+        heartbeat.beat_count = beat
+        circuit = heartbeat._create_heartbeat_circuit()
+        family = match_heartbeat_family(circuit)
+        assert family is not None
+        expected = Statevector(
+            circuit.remove_final_measurements(inplace=False)
+        ).probabilities()
+        np.testing.assert_allclose(family.probabilities(), expected, atol=1e-12)
+
+    def test_sampling_matches_statevector_sampler(self):
+        qc = heartbeat_circuit(4)
+        fast = simulate(qc, 20000, method=HEARTBEAT_CLOSED_FORM, seed=3)
+        assert fast.plan.backend_name == "heartbeat_sampler"
+        assert total_variation(fast.counts, qc) < 0.03
+
+    def test_rejects_other_circuits(self):
+        assert match_heartbeat_family(chain_circuit(4)) is None
+        assert match_heartbeat_family(ghz_circuit(4)) is None
+
+    def test_wide_simulated_beat(self, tmp_path):
+        heartbeat = QuantumHeartbeat(HeartbeatConfig(
+            use_simulator=True, num_qubits=127, shots=2048,
+            results_dir=str(tmp_path),
+            rotation_index_file=str(tmp_path / ".rotation_index"),
+        ))
+        result = heartbeat.single_beat()
+        assert result.backend_name == "heartbeat_sampler"
+        assert result.execution_time_seconds < 1.0
+        assert sum(result.counts.values()) == 2048
+
+
+class TestSimulatorProvider:
+    """Test the provider reports method and memory."""
+
+    def test_result_reports_method(self):
+        result = SimulatorProvider().run_circuit(chain_circuit(27), shots=256)
+        assert result.simulation_method == MATRIX_PRODUCT_STATE
+        assert result.backend_name == "mps_simulator"
+        assert 0 < result.memory_estimate_bytes < 16 * 2 ** 27
+        assert result.shots == 256
+        assert all(len(k) == 27 for k in result.counts)
+
+    def test_backend_name_forces_method(self):
+        result = SimulatorProvider().run_circuit(
+            ghz_circuit(3), shots=100, backend_name="statevector_sampler"
+        )
+        assert result.simulation_method == STATEVECTOR
+        assert set(result.counts) <= {"000", "111"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])